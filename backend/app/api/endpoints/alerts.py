@@ -5,15 +5,37 @@ Alert Management API endpoints.
 from typing import List, Optional
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
-from app.core.database import get_db
-from app.models.alert import Alert, AlertStatus, AlertSeverity
+from sqlalchemy import select, update, func, and_, case, literal
+from app.core.database import get_db, fetch_page
+from app.core.cache import cached, invalidate
+from app.core.pagination import encode_cursor, decode_cursor, keyset_filter, keyset_order
+from app.core.config import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.models.alert import (
+    Alert, AlertStatus, AlertSeverity,
+    alert_severity_key, alert_detected_key, ALERT_SEVERITY_UNSET, ALERT_UNDETECTED
+)
 from app.schemas.alert import AlertCreate, AlertUpdate, AlertResponse, AlertListResponse
 
 
 router = APIRouter()
 
+# Sort keys for the alert list as (column, descending); id breaks ties so
+# that keyset cursors are unambiguous.
+ALERT_SORT_KEYS = (
+    (alert_severity_key, True),
+    (alert_detected_key, True),
+    (Alert.id, True),
+)
+ALERT_CURSOR_PARSERS = (AlertSeverity, datetime.fromisoformat, str)
+
+# List views read only the columns AlertResponse exposes, skipping ORM
+# hydration and the to_dict() round-trip.
+ALERT_LIST_COLUMNS = tuple(getattr(Alert, name) for name in AlertResponse.model_fields)
+
+DASHBOARD_CACHE_KEY = "alerts:dashboard"
+
 
 @router.get("/", response_model=AlertListResponse)
 async def list_alerts(
@@ -25,86 +47,109 @@ async def list_alerts(
     date_from: Optional[datetime] = None,
     date_to: Optional[datetime] = None,
     page: int = Query(1, ge=1),
-    page_size: int = Query(20, ge=1, le=100),
+    page_size: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    include_total: bool = True,
     db: AsyncSession = Depends(get_db)
 ):
     """
     List alerts with filtering and pagination.
     
     Supports filtering by status, severity, category, assignment,
-    related entity, and detection date range.
+    related entity, and detection date range. Pass the returned
+    ``next_cursor`` as ``cursor`` for constant-time deep paging, and
+    ``include_total=false`` to skip the COUNT query.
     """
-    query = select(Alert)
-    
     # Apply filters
+    filters = []
     if status:
-        query = query.where(Alert.status == status)
+        filters.append(Alert.status == status)
     if severity:
-        query = query.where(Alert.severity == severity)
+        filters.append(Alert.severity == severity)
     if category:
-        query = query.where(Alert.category == category)
+        filters.append(Alert.category == category)
     if assigned_to:
-        query = query.where(Alert.assigned_to == assigned_to)
+        filters.append(Alert.assigned_to == assigned_to)
     if entity_id:
-        query = query.where(Alert.primary_entity_id == entity_id)
+        filters.append(Alert.primary_entity_id == entity_id)
     if date_from:
-        query = query.where(Alert.detected_at >= date_from)
+        filters.append(Alert.detected_at >= date_from)
     if date_to:
-        query = query.where(Alert.detected_at <= date_to)
+        filters.append(Alert.detected_at <= date_to)
     
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total = await db.scalar(count_query)
+    # Total count query
+    count_query = select(func.count(Alert.id)).where(*filters) if include_total else None
     
     # Apply pagination and ordering
-    offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size).order_by(
-        Alert.severity.desc(),
-        Alert.detected_at.desc()
-    )
+    query = select(*ALERT_LIST_COLUMNS).where(*filters).order_by(*keyset_order(ALERT_SORT_KEYS))
+    if cursor:
+        query = query.where(
+            keyset_filter(ALERT_SORT_KEYS, decode_cursor(cursor, ALERT_CURSOR_PARSERS))
+        )
+    else:
+        query = query.offset((page - 1) * page_size)
+    query = query.limit(page_size)
     
-    result = await db.execute(query)
-    alerts = result.scalars().all()
+    # Rows go out as plain dicts: the selected columns already match
+    # AlertResponse, so building and re-serializing a model per row would
+    # only cost time. response_model still documents the shape.
+    total, items = await fetch_page(db, query, dict, count_query)
     
-    return AlertListResponse(
-        items=[AlertResponse.model_validate(a.to_dict()) for a in alerts],
-        total=total,
-        page=page,
-        page_size=page_size,
-        pages=(total + page_size - 1) // page_size if total > 0 else 0
-    )
+    next_cursor = None
+    if len(items) == page_size:
+        last = items[-1]
+        next_cursor = encode_cursor((
+            last["severity"] or ALERT_SEVERITY_UNSET,
+            last["detected_at"] or ALERT_UNDETECTED,
+            last["id"]
+        ))
+    
+    return ORJSONResponse({
+        "items": items,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "pages": (total + page_size - 1) // page_size if total is not None else None,
+        "next_cursor": next_cursor
+    })
 
 
 @router.get("/dashboard")
+@cached(key=DASHBOARD_CACHE_KEY, ttl=10)
 async def get_alert_dashboard(db: AsyncSession = Depends(get_db)):
     """
     Get alert statistics for dashboard display.
     
     Returns counts by status, severity, and category.
     """
-    # Count by status
-    status_counts = {}
-    for status in AlertStatus:
-        count = await db.scalar(
-            select(func.count()).select_from(Alert).where(Alert.status == status)
-        )
-        status_counts[status.value] = count or 0
+    # Count by status and severity, one GROUP BY each
+    status_rows = await db.execute(
+        select(Alert.status, func.count()).group_by(Alert.status)
+    )
+    by_status = dict(status_rows.all())
+    status_counts = {status.value: by_status.get(status, 0) for status in AlertStatus}
     
-    # Count by severity
-    severity_counts = {}
-    for severity in AlertSeverity:
-        count = await db.scalar(
-            select(func.count()).select_from(Alert).where(Alert.severity == severity)
-        )
-        severity_counts[severity.value] = count or 0
+    severity_rows = await db.execute(
+        select(Alert.severity, func.count()).group_by(Alert.severity)
+    )
+    by_severity = dict(severity_rows.all())
+    severity_counts = {
+        severity.value: by_severity.get(severity, 0) for severity in AlertSeverity
+    }
     
-    # Total counts
-    total = await db.scalar(select(func.count()).select_from(Alert))
-    open_alerts = await db.scalar(
-        select(func.count()).select_from(Alert).where(
-            Alert.status.in_([AlertStatus.NEW, AlertStatus.INVESTIGATING])
-        )
+    # Total and open counts in a single pass
+    totals = await db.execute(
+        select(
+            func.count(),
+            func.sum(
+                case(
+                    (Alert.status.in_([AlertStatus.NEW, AlertStatus.INVESTIGATING]), 1),
+                    else_=0
+                )
+            )
+        ).select_from(Alert)
     )
+    total, open_alerts = totals.one()
     
     return {
         "total_alerts": total or 0,
@@ -123,7 +168,7 @@ async def get_alert(alert_id: str, db: AsyncSession = Depends(get_db)):
     if not alert:
         raise HTTPException(status_code=404, detail="Alert not found")
     
-    return AlertResponse.model_validate(alert.to_dict())
+    return AlertResponse.model_validate(alert)
 
 
 @router.post("/", response_model=AlertResponse, status_code=201)
@@ -132,9 +177,9 @@ async def create_alert(alert_data: AlertCreate, db: AsyncSession = Depends(get_d
     alert = Alert(**alert_data.model_dump())
     db.add(alert)
     await db.commit()
-    await db.refresh(alert)
+    await invalidate(DASHBOARD_CACHE_KEY)
     
-    return AlertResponse.model_validate(alert.to_dict())
+    return AlertResponse.model_validate(alert)
 
 
 @router.put("/{alert_id}", response_model=AlertResponse)
@@ -144,20 +189,22 @@ async def update_alert(
     db: AsyncSession = Depends(get_db)
 ):
     """Update an existing alert."""
-    result = await db.execute(select(Alert).where(Alert.id == alert_id))
+    update_data = alert_data.model_dump(exclude_unset=True)
+    result = await db.execute(
+        update(Alert)
+        .where(Alert.id == alert_id)
+        .values(**update_data)
+        .returning(Alert)
+    )
     alert = result.scalar_one_or_none()
     
     if not alert:
         raise HTTPException(status_code=404, detail="Alert not found")
     
-    update_data = alert_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(alert, field, value)
-    
     await db.commit()
-    await db.refresh(alert)
+    await invalidate(DASHBOARD_CACHE_KEY)
     
-    return AlertResponse.model_validate(alert.to_dict())
+    return AlertResponse.model_validate(alert)
 
 
 @router.post("/{alert_id}/assign")
@@ -167,18 +214,30 @@ async def assign_alert(
     db: AsyncSession = Depends(get_db)
 ):
     """Assign an alert to an analyst."""
-    result = await db.execute(select(Alert).where(Alert.id == alert_id))
-    alert = result.scalar_one_or_none()
+    # New alerts move to investigating; the transition happens in the same
+    # UPDATE so it is atomic with the assignment.
+    result = await db.execute(
+        update(Alert)
+        .where(Alert.id == alert_id)
+        .values(
+            assigned_to=assigned_to,
+            acknowledged_at=datetime.utcnow(),
+            status=case(
+                (
+                    Alert.status == AlertStatus.NEW,
+                    literal(AlertStatus.INVESTIGATING, Alert.status.type)
+                ),
+                else_=Alert.status
+            )
+        )
+        .returning(Alert.id)
+    )
     
-    if not alert:
+    if result.first() is None:
         raise HTTPException(status_code=404, detail="Alert not found")
     
-    alert.assigned_to = assigned_to
-    alert.acknowledged_at = datetime.utcnow()
-    if alert.status == AlertStatus.NEW:
-        alert.status = AlertStatus.INVESTIGATING
-    
     await db.commit()
+    await invalidate(DASHBOARD_CACHE_KEY)
     
     return {"message": "Alert assigned successfully", "alert_id": alert_id, "assigned_to": assigned_to}
 
@@ -191,24 +250,26 @@ async def resolve_alert(
     db: AsyncSession = Depends(get_db)
 ):
     """Resolve an alert with a disposition."""
-    result = await db.execute(select(Alert).where(Alert.id == alert_id))
-    alert = result.scalar_one_or_none()
-    
-    if not alert:
-        raise HTTPException(status_code=404, detail="Alert not found")
-    
     if resolution == "sar":
-        alert.status = AlertStatus.RESOLVED_SAR
+        status = AlertStatus.RESOLVED_SAR
     elif resolution == "false_positive":
-        alert.status = AlertStatus.RESOLVED_FALSE_POSITIVE
+        status = AlertStatus.RESOLVED_FALSE_POSITIVE
     else:
-        alert.status = AlertStatus.CLOSED
+        status = AlertStatus.CLOSED
     
-    alert.resolved_at = datetime.utcnow()
+    values = {"status": status, "resolved_at": datetime.utcnow()}
     if notes:
-        alert.investigation_notes = notes
+        values["investigation_notes"] = notes
+    
+    result = await db.execute(
+        update(Alert).where(Alert.id == alert_id).values(**values).returning(Alert.id)
+    )
+    
+    if result.first() is None:
+        raise HTTPException(status_code=404, detail="Alert not found")
     
     await db.commit()
+    await invalidate(DASHBOARD_CACHE_KEY)
     
     return {"message": "Alert resolved", "alert_id": alert_id, "resolution": resolution}
 
@@ -220,16 +281,21 @@ async def escalate_alert(
     db: AsyncSession = Depends(get_db)
 ):
     """Escalate an alert for senior review."""
-    result = await db.execute(select(Alert).where(Alert.id == alert_id))
-    alert = result.scalar_one_or_none()
+    result = await db.execute(
+        update(Alert)
+        .where(Alert.id == alert_id)
+        .values(
+            status=AlertStatus.ESCALATED,
+            investigation_notes=func.coalesce(Alert.investigation_notes, "")
+            + f"\n\nEscalation Reason: {reason}"
+        )
+        .returning(Alert.id)
+    )
     
-    if not alert:
+    if result.first() is None:
         raise HTTPException(status_code=404, detail="Alert not found")
     
-    alert.status = AlertStatus.ESCALATED
-    alert.investigation_notes = f"{alert.investigation_notes or ''}\n\nEscalation Reason: {reason}"
-    
     await db.commit()
+    await invalidate(DASHBOARD_CACHE_KEY)
     
     return {"message": "Alert escalated", "alert_id": alert_id}
-
@@ -6,10 +6,11 @@ from typing import List, Optional
 from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
-from app.core.database import get_db
+from sqlalchemy import select, func, and_, or_, case, cast, Date
+from app.core.database import get_db, gather_scalars
+from app.core.cache import cached
 from app.models.entity import Entity
-from app.models.transaction import Transaction
+from app.models.transaction import Transaction, transaction_daily_stats
 from app.models.alert import Alert
 
 
@@ -17,6 +18,7 @@ router = APIRouter()
 
 
 @router.get("/risk-distribution")
+@cached(key="analytics:risk-distribution", ttl=60)
 async def get_risk_distribution(db: AsyncSession = Depends(get_db)):
     """
     Get risk score distribution across all entities.
@@ -32,20 +34,20 @@ async def get_risk_distribution(db: AsyncSession = Depends(get_db)):
         ("critical", 0.8, 1.0)
     ]
     
-    distribution = {}
-    for name, low, high in buckets:
-        count = await db.scalar(
-            select(func.count()).select_from(Entity).where(
-                and_(Entity.risk_score >= low, Entity.risk_score < high)
-            )
-        )
-        distribution[name] = count or 0
+    # Bucket every entity in a single pass; scores of exactly 1.0 fall
+    # through to the top bucket.
+    bucket = case(
+        *[(Entity.risk_score < high, name) for name, _, high in buckets[:-1]],
+        else_=buckets[-1][0]
+    ).label("bucket")
     
-    # Handle edge case for score = 1.0
-    critical_count = await db.scalar(
-        select(func.count()).select_from(Entity).where(Entity.risk_score == 1.0)
+    result = await db.execute(
+        select(bucket, func.count()).where(
+            and_(Entity.risk_score >= 0, Entity.risk_score <= 1.0)
+        ).group_by(bucket)
     )
-    distribution["critical"] = distribution.get("critical", 0) + (critical_count or 0)
+    counts = dict(result.all())
+    distribution = {name: counts.get(name, 0) for name, _, _ in buckets}
     
     return {"distribution": distribution, "buckets": buckets}
 
@@ -63,19 +65,31 @@ async def get_transaction_trends(
     """
     start_date = datetime.utcnow() - timedelta(days=days)
     
-    # Query transactions grouped by date
-    query = select(
-        func.date(Transaction.transaction_date).label("date"),
-        func.count().label("count"),
-        func.sum(Transaction.amount).label("volume"),
-        func.avg(Transaction.risk_score).label("avg_risk")
-    ).where(
-        Transaction.transaction_date >= start_date
-    ).group_by(
-        func.date(Transaction.transaction_date)
-    ).order_by(
-        func.date(Transaction.transaction_date)
-    )
+    if granularity == "hour":
+        # Finer than the daily rollup, so aggregate the raw transactions
+        bucket = func.date_trunc("hour", Transaction.transaction_date)
+        query = select(
+            bucket.label("date"),
+            func.count().label("tx_count"),
+            func.sum(Transaction.amount).label("volume"),
+            func.avg(Transaction.risk_score).label("avg_risk")
+        ).where(
+            Transaction.transaction_date >= start_date
+        ).group_by(bucket).order_by(bucket)
+    else:
+        # Roll the precomputed daily stats up to the requested granularity
+        daily = transaction_daily_stats
+        bucket = daily.c.date if granularity == "day" else cast(
+            func.date_trunc(granularity, daily.c.date), Date
+        )
+        query = select(
+            bucket.label("date"),
+            func.sum(daily.c.tx_count).label("tx_count"),
+            func.sum(daily.c.volume).label("volume"),
+            (func.sum(daily.c.sum_risk) / func.nullif(func.sum(daily.c.n_risk), 0)).label("avg_risk")
+        ).where(
+            daily.c.date >= start_date.date()
+        ).group_by(bucket).order_by(bucket)
     
     result = await db.execute(query)
     rows = result.all()
@@ -83,7 +97,7 @@ async def get_transaction_trends(
     trends = [
         {
             "date": str(row.date),
-            "count": row.count,
+            "count": row.tx_count,
             "volume": float(row.volume or 0),
             "avg_risk": float(row.avg_risk or 0)
         }
@@ -155,52 +169,43 @@ async def get_high_risk_entities(
     Get entities with highest risk scores for prioritization.
     """
     query = select(Entity).order_by(Entity.risk_score.desc()).limit(limit)
-    result = await db.execute(query)
-    entities = result.scalars().all()
     
     return {
         "entities": [
             {
                 "id": e.id,
                 "name": e.name,
-                "entity_type": e.entity_type.value,
+                "entity_type": e.entity_type,
                 "risk_score": e.risk_score,
                 "risk_factors": e.risk_factors,
-                "is_sanctioned": bool(e.is_sanctioned),
-                "is_pep": bool(e.is_pep)
+                "is_sanctioned": e.is_sanctioned,
+                "is_pep": e.is_pep
             }
-            for e in entities
+            async for e in await db.stream_scalars(query)
         ]
     }
 
 
 @router.get("/network-statistics")
+@cached(key="analytics:network-statistics", ttl=60)
 async def get_network_statistics(db: AsyncSession = Depends(get_db)):
     """
     Get overall network statistics for the entity graph.
     """
-    # Total entities
-    entity_count = await db.scalar(select(func.count()).select_from(Entity))
-    
-    # Entity types breakdown
+    # Entity types breakdown; the total is the sum of the groups
     type_query = select(
         Entity.entity_type,
         func.count().label("count")
     ).group_by(Entity.entity_type)
     
     result = await db.execute(type_query)
-    by_type = {row.entity_type.value: row.count for row in result.all()}
-    
-    # Transaction count
-    transaction_count = await db.scalar(select(func.count()).select_from(Transaction))
+    by_type = {entity_type.value: count for entity_type, count in result.all()}
+    entity_count = sum(by_type.values())
     
-    # Unique senders
-    unique_senders = await db.scalar(
-        select(func.count(func.distinct(Transaction.sender_entity_id)))
-    )
-    
-    # Unique receivers
-    unique_receivers = await db.scalar(
+    # Transaction count and distinct counterparties, run concurrently
+    transaction_count, unique_senders, unique_receivers = await gather_scalars(
+        select(func.count()).select_from(Transaction),
+        select(func.count(func.distinct(Transaction.sender_entity_id))),
         select(func.count(func.distinct(Transaction.receiver_entity_id)))
     )
     
@@ -227,12 +232,31 @@ async def calculate_entity_risk(
     - Sanctions/PEP status
     - Historical alerts
     """
-    result = await db.execute(select(Entity).where(Entity.id == entity_id))
-    entity = result.scalar_one_or_none()
+    # Fetch the entity together with its transaction and alert counts
+    tx_count_subq = select(func.count()).select_from(Transaction).where(
+        or_(
+            Transaction.sender_entity_id == entity_id,
+            Transaction.receiver_entity_id == entity_id
+        )
+    ).scalar_subquery()
+    alert_count_subq = select(func.count()).select_from(Alert).where(
+        Alert.primary_entity_id == entity_id
+    ).scalar_subquery()
+    
+    result = await db.execute(
+        select(
+            Entity,
+            tx_count_subq.label("tx_count"),
+            alert_count_subq.label("alert_count")
+        ).where(Entity.id == entity_id)
+    )
+    row = result.one_or_none()
     
-    if not entity:
+    if not row:
         return {"error": "Entity not found"}
     
+    entity, tx_count, alert_count = row
+    
     risk_factors = []
     risk_score = 0.0
     
@@ -248,22 +272,11 @@ async def calculate_entity_risk(
         risk_factors.append("adverse_media_coverage")
     
     # Transaction volume risk
-    tx_count = await db.scalar(
-        select(func.count()).select_from(Transaction).where(
-            (Transaction.sender_entity_id == entity_id) |
-            (Transaction.receiver_entity_id == entity_id)
-        )
-    )
     if (tx_count or 0) > 100:
         risk_score += 0.1
         risk_factors.append("high_transaction_volume")
     
     # Alert history risk
-    alert_count = await db.scalar(
-        select(func.count()).select_from(Alert).where(
-            Alert.primary_entity_id == entity_id
-        )
-    )
     if (alert_count or 0) > 0:
         risk_score += min(0.15, (alert_count or 0) * 0.03)
         risk_factors.append("previous_alerts")
@@ -283,9 +296,9 @@ async def calculate_entity_risk(
         "calculation_factors": {
             "transaction_count": tx_count or 0,
             "alert_count": alert_count or 0,
-            "is_sanctioned": bool(entity.is_sanctioned),
-            "is_pep": bool(entity.is_pep),
-            "is_adverse_media": bool(entity.is_adverse_media)
+            "is_sanctioned": entity.is_sanctioned,
+            "is_pep": entity.is_pep,
+            "is_adverse_media": entity.is_adverse_media
         }
     }
 
@@ -5,15 +5,37 @@ Case Management API endpoints.
 from typing import List, Optional
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from app.core.database import get_db
-from app.models.case import Case, CaseStatus
+from sqlalchemy import select, update, func, literal, case as sql_case
+from app.core.database import get_db, fetch_page
+from app.core.cache import cached, invalidate
+from app.core.pagination import encode_cursor, decode_cursor, keyset_filter, keyset_order
+from app.core.config import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.models.case import (
+    Case, CaseStatus, case_number_seq,
+    case_priority_key, case_opened_key, CASE_UNPRIORITIZED, CASE_UNOPENED
+)
 from app.schemas.case import CaseCreate, CaseUpdate, CaseResponse, CaseListResponse
 
 
 router = APIRouter()
 
+# Sort keys for the case list as (column, descending); id breaks ties so
+# that keyset cursors are unambiguous.
+CASE_SORT_KEYS = (
+    (case_priority_key, False),
+    (case_opened_key, True),
+    (Case.id, True),
+)
+CASE_CURSOR_PARSERS = (int, datetime.fromisoformat, str)
+
+# List views read only the columns CaseResponse exposes, skipping ORM
+# hydration and the to_dict() round-trip.
+CASE_LIST_COLUMNS = tuple(getattr(Case, name) for name in CaseResponse.model_fields)
+
+DASHBOARD_CACHE_KEY = "cases:dashboard"
+
 
 @router.get("/", response_model=CaseListResponse)
 async def list_cases(
@@ -23,78 +45,90 @@ async def list_cases(
     assigned_to: Optional[str] = None,
     priority: Optional[int] = None,
     page: int = Query(1, ge=1),
-    page_size: int = Query(20, ge=1, le=100),
+    page_size: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    include_total: bool = True,
     db: AsyncSession = Depends(get_db)
 ):
     """
     List investigation cases with filtering and pagination.
-    """
-    query = select(Case)
     
+    Pass the returned ``next_cursor`` as ``cursor`` for keyset paging and
+    ``include_total=false`` to skip the COUNT query.
+    """
     # Apply filters
+    filters = []
     if status:
-        query = query.where(Case.status == status)
+        filters.append(Case.status == status)
     if case_type:
-        query = query.where(Case.case_type == case_type)
+        filters.append(Case.case_type == case_type)
     if category:
-        query = query.where(Case.category == category)
+        filters.append(Case.category == category)
     if assigned_to:
-        query = query.where(Case.assigned_to == assigned_to)
+        filters.append(Case.assigned_to == assigned_to)
     if priority:
-        query = query.where(Case.priority == priority)
+        filters.append(Case.priority == priority)
     
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total = await db.scalar(count_query)
+    # Total count query
+    count_query = select(func.count(Case.id)).where(*filters) if include_total else None
     
     # Apply pagination and ordering
-    offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size).order_by(
-        Case.priority.asc(),
-        Case.opened_at.desc()
-    )
+    query = select(*CASE_LIST_COLUMNS).where(*filters).order_by(*keyset_order(CASE_SORT_KEYS))
+    if cursor:
+        query = query.where(
+            keyset_filter(CASE_SORT_KEYS, decode_cursor(cursor, CASE_CURSOR_PARSERS))
+        )
+    else:
+        query = query.offset((page - 1) * page_size)
+    query = query.limit(page_size)
     
-    result = await db.execute(query)
-    cases = result.scalars().all()
+    # Rows go out as plain dicts: the selected columns already match
+    # CaseResponse, so building and re-serializing a model per row would
+    # only cost time. response_model still documents the shape.
+    total, items = await fetch_page(db, query, dict, count_query)
     
-    return CaseListResponse(
-        items=[CaseResponse.model_validate(c.to_dict()) for c in cases],
-        total=total,
-        page=page,
-        page_size=page_size,
-        pages=(total + page_size - 1) // page_size if total > 0 else 0
-    )
+    next_cursor = None
+    if len(items) == page_size:
+        last = items[-1]
+        next_cursor = encode_cursor((
+            last["priority"] if last["priority"] is not None else CASE_UNPRIORITIZED,
+            last["opened_at"] or CASE_UNOPENED,
+            last["id"]
+        ))
+    
+    return ORJSONResponse({
+        "items": items,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "pages": (total + page_size - 1) // page_size if total is not None else None,
+        "next_cursor": next_cursor
+    })
 
 
 @router.get("/dashboard")
+@cached(key=DASHBOARD_CACHE_KEY, ttl=10)
 async def get_case_dashboard(db: AsyncSession = Depends(get_db)):
     """
     Get case statistics for dashboard display.
     """
     # Count by status
-    status_counts = {}
-    for status in CaseStatus:
-        count = await db.scalar(
-            select(func.count()).select_from(Case).where(Case.status == status)
-        )
-        status_counts[status.value] = count or 0
-    
-    # Open cases
-    open_count = await db.scalar(
-        select(func.count()).select_from(Case).where(
-            Case.status.in_([CaseStatus.OPEN, CaseStatus.IN_PROGRESS, CaseStatus.PENDING_REVIEW])
-        )
-    )
-    
-    # SAR filed
-    sar_count = await db.scalar(
-        select(func.count()).select_from(Case).where(Case.status == CaseStatus.SAR_FILED)
+    status_rows = await db.execute(
+        select(Case.status, func.count()).group_by(Case.status)
     )
+    by_status = dict(status_rows.all())
+    status_counts = {status.value: by_status.get(status, 0) for status in CaseStatus}
     
-    # Average risk score
-    avg_risk = await db.scalar(
-        select(func.avg(Case.overall_risk_score))
+    # Open cases, SAR filed and average risk score in one aggregate query
+    open_statuses = [CaseStatus.OPEN, CaseStatus.IN_PROGRESS, CaseStatus.PENDING_REVIEW]
+    totals = await db.execute(
+        select(
+            func.sum(sql_case((Case.status.in_(open_statuses), 1), else_=0)),
+            func.sum(sql_case((Case.status == CaseStatus.SAR_FILED, 1), else_=0)),
+            func.avg(Case.overall_risk_score)
+        )
     )
+    open_count, sar_count, avg_risk = totals.one()
     
     return {
         "open_cases": open_count or 0,
@@ -113,22 +147,23 @@ async def get_case(case_id: str, db: AsyncSession = Depends(get_db)):
     if not case:
         raise HTTPException(status_code=404, detail="Case not found")
     
-    return CaseResponse.model_validate(case.to_dict())
+    return CaseResponse.model_validate(case)
 
 
 @router.post("/", response_model=CaseResponse, status_code=201)
 async def create_case(case_data: CaseCreate, db: AsyncSession = Depends(get_db)):
     """Create a new investigation case."""
-    # Generate case number
-    count = await db.scalar(select(func.count()).select_from(Case))
-    case_number = f"CASE-{datetime.utcnow().strftime('%Y%m%d')}-{(count or 0) + 1:05d}"
+    # Generate case number from the sequence (no table scan, no duplicates
+    # under concurrent creates)
+    seq = await db.scalar(select(case_number_seq.next_value()))
+    case_number = f"CASE-{datetime.utcnow().strftime('%Y%m%d')}-{seq:05d}"
     
     case = Case(**case_data.model_dump(), case_number=case_number)
     db.add(case)
     await db.commit()
-    await db.refresh(case)
+    await invalidate(DASHBOARD_CACHE_KEY)
     
-    return CaseResponse.model_validate(case.to_dict())
+    return CaseResponse.model_validate(case)
 
 
 @router.put("/{case_id}", response_model=CaseResponse)
@@ -138,20 +173,22 @@ async def update_case(
     db: AsyncSession = Depends(get_db)
 ):
     """Update an existing case."""
-    result = await db.execute(select(Case).where(Case.id == case_id))
+    update_data = case_data.model_dump(exclude_unset=True)
+    result = await db.execute(
+        update(Case)
+        .where(Case.id == case_id)
+        .values(**update_data)
+        .returning(Case)
+    )
     case = result.scalar_one_or_none()
     
     if not case:
         raise HTTPException(status_code=404, detail="Case not found")
     
-    update_data = case_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(case, field, value)
-    
     await db.commit()
-    await db.refresh(case)
+    await invalidate(DASHBOARD_CACHE_KEY)
     
-    return CaseResponse.model_validate(case.to_dict())
+    return CaseResponse.model_validate(case)
 
 
 @router.post("/{case_id}/assign")
@@ -162,19 +199,26 @@ async def assign_case(
     db: AsyncSession = Depends(get_db)
 ):
     """Assign a case to an analyst or team."""
-    result = await db.execute(select(Case).where(Case.id == case_id))
-    case = result.scalar_one_or_none()
+    # Open cases move to in-progress within the same UPDATE
+    values = {
+        "assigned_to": assigned_to,
+        "status": sql_case(
+            (Case.status == CaseStatus.OPEN, literal(CaseStatus.IN_PROGRESS, Case.status.type)),
+            else_=Case.status
+        )
+    }
+    if team:
+        values["assigned_team"] = team
     
-    if not case:
-        raise HTTPException(status_code=404, detail="Case not found")
+    result = await db.execute(
+        update(Case).where(Case.id == case_id).values(**values).returning(Case.id)
+    )
     
-    case.assigned_to = assigned_to
-    if team:
-        case.assigned_team = team
-    if case.status == CaseStatus.OPEN:
-        case.status = CaseStatus.IN_PROGRESS
+    if result.first() is None:
+        raise HTTPException(status_code=404, detail="Case not found")
     
     await db.commit()
+    await invalidate(DASHBOARD_CACHE_KEY)
     
     return {"message": "Case assigned", "case_id": case_id, "assigned_to": assigned_to}
 
@@ -186,17 +230,22 @@ async def file_sar(
     db: AsyncSession = Depends(get_db)
 ):
     """Record SAR filing for a case."""
-    result = await db.execute(select(Case).where(Case.id == case_id))
-    case = result.scalar_one_or_none()
+    result = await db.execute(
+        update(Case)
+        .where(Case.id == case_id)
+        .values(
+            status=CaseStatus.SAR_FILED,
+            sar_reference=sar_reference,
+            sar_filed_date=datetime.utcnow()
+        )
+        .returning(Case.id)
+    )
     
-    if not case:
+    if result.first() is None:
         raise HTTPException(status_code=404, detail="Case not found")
     
-    case.status = CaseStatus.SAR_FILED
-    case.sar_reference = sar_reference
-    case.sar_filed_date = datetime.utcnow()
-    
     await db.commit()
+    await invalidate(DASHBOARD_CACHE_KEY)
     
     return {
         "message": "SAR filed successfully",
@@ -214,18 +263,22 @@ async def close_case(
     db: AsyncSession = Depends(get_db)
 ):
     """Close a case with findings and recommendation."""
-    result = await db.execute(select(Case).where(Case.id == case_id))
-    case = result.scalar_one_or_none()
+    result = await db.execute(
+        update(Case)
+        .where(Case.id == case_id)
+        .values(
+            status=CaseStatus.CLOSED if action_taken else CaseStatus.CLOSED_NO_ACTION,
+            findings=findings,
+            recommendation=recommendation,
+            closed_at=datetime.utcnow()
+        )
+        .returning(Case.id)
+    )
     
-    if not case:
+    if result.first() is None:
         raise HTTPException(status_code=404, detail="Case not found")
     
-    case.status = CaseStatus.CLOSED if action_taken else CaseStatus.CLOSED_NO_ACTION
-    case.findings = findings
-    case.recommendation = recommendation
-    case.closed_at = datetime.utcnow()
-    
     await db.commit()
+    await invalidate(DASHBOARD_CACHE_KEY)
     
     return {"message": "Case closed", "case_id": case_id}
-
@@ -3,17 +3,34 @@ Entity Resolution API endpoints.
 """
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from app.core.database import get_db
-from app.models.entity import Entity, EntityType
+from sqlalchemy import select, update, delete, func, values, column, String
+from loguru import logger
+from tenacity import retry, stop_after_attempt, wait_exponential
+from app.core.database import get_db, fetch_page
+from app.core.pagination import encode_cursor, decode_cursor, keyset_filter, keyset_order
+from app.core.config import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.models.entity import Entity, EntityType, entity_risk_key, ENTITY_UNSCORED
 from app.schemas.entity import EntityCreate, EntityUpdate, EntityResponse, EntityListResponse
-from app.services.neo4j_service import Neo4jService
+from app.services.neo4j_service import Neo4jService, get_neo4j_service
 
 
 router = APIRouter()
 
+# Sort keys for the entity list as (column, descending); id breaks ties so
+# that keyset cursors are unambiguous.
+ENTITY_SORT_KEYS = (
+    (entity_risk_key, True),
+    (Entity.id, True),
+)
+ENTITY_CURSOR_PARSERS = (float, str)
+
+# List views read only the columns EntityResponse exposes, skipping ORM
+# hydration and the to_dict() round-trip.
+ENTITY_LIST_COLUMNS = tuple(getattr(Entity, name) for name in EntityResponse.model_fields)
+
 
 @router.get("/", response_model=EntityListResponse)
 async def list_entities(
@@ -24,49 +41,68 @@ async def list_entities(
     is_pep: Optional[bool] = None,
     search: Optional[str] = None,
     page: int = Query(1, ge=1),
-    page_size: int = Query(20, ge=1, le=100),
+    page_size: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    include_total: bool = True,
     db: AsyncSession = Depends(get_db)
 ):
     """
     List entities with filtering and pagination.
     
     Supports filtering by entity type, risk score range, sanctions status,
-    PEP status, and full-text search on name.
+    PEP status, and full-text search on name. Pass the returned
+    ``next_cursor`` as ``cursor`` for keyset paging and
+    ``include_total=false`` to skip the COUNT query.
     """
-    query = select(Entity)
-    
     # Apply filters
+    filters = []
     if entity_type:
-        query = query.where(Entity.entity_type == entity_type)
+        filters.append(Entity.entity_type == entity_type)
     if risk_score_min is not None:
-        query = query.where(Entity.risk_score >= risk_score_min)
+        filters.append(Entity.risk_score >= risk_score_min)
     if risk_score_max is not None:
-        query = query.where(Entity.risk_score <= risk_score_max)
+        filters.append(Entity.risk_score <= risk_score_max)
     if is_sanctioned is not None:
-        query = query.where(Entity.is_sanctioned == (1 if is_sanctioned else 0))
+        filters.append(Entity.is_sanctioned.is_(is_sanctioned))
     if is_pep is not None:
-        query = query.where(Entity.is_pep == (1 if is_pep else 0))
+        filters.append(Entity.is_pep.is_(is_pep))
     if search:
-        query = query.where(Entity.name.ilike(f"%{search}%"))
+        filters.append(Entity.name.ilike(f"%{search}%"))
     
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total = await db.scalar(count_query)
+    # Total count query
+    count_query = select(func.count(Entity.id)).where(*filters) if include_total else None
     
-    # Apply pagination
-    offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size).order_by(Entity.risk_score.desc())
+    # Apply pagination and ordering
+    query = select(*ENTITY_LIST_COLUMNS).where(*filters).order_by(*keyset_order(ENTITY_SORT_KEYS))
+    if cursor:
+        query = query.where(
+            keyset_filter(ENTITY_SORT_KEYS, decode_cursor(cursor, ENTITY_CURSOR_PARSERS))
+        )
+    else:
+        query = query.offset((page - 1) * page_size)
+    query = query.limit(page_size)
     
-    result = await db.execute(query)
-    entities = result.scalars().all()
-    
-    return EntityListResponse(
-        items=[EntityResponse.model_validate(e.to_dict()) for e in entities],
-        total=total,
-        page=page,
-        page_size=page_size,
-        pages=(total + page_size - 1) // page_size
-    )
+    # Rows go out as plain dicts: the selected columns already match
+    # EntityResponse, so building and re-serializing a model per row would
+    # only cost time. response_model still documents the shape.
+    total, items = await fetch_page(db, query, dict, count_query)
+    
+    next_cursor = None
+    if len(items) == page_size:
+        last = items[-1]
+        next_cursor = encode_cursor((
+            last["risk_score"] if last["risk_score"] is not None else ENTITY_UNSCORED,
+            last["id"]
+        ))
+    
+    return ORJSONResponse({
+        "items": items,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "pages": (total + page_size - 1) // page_size if total is not None else None,
+        "next_cursor": next_cursor
+    })
 
 
 @router.get("/{entity_id}", response_model=EntityResponse)
@@ -78,25 +114,47 @@ async def get_entity(entity_id: str, db: AsyncSession = Depends(get_db)):
     if not entity:
         raise HTTPException(status_code=404, detail="Entity not found")
     
-    return EntityResponse.model_validate(entity.to_dict())
+    return EntityResponse.model_validate(entity)
+
+
+@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=0.5, max=5), reraise=True)
+async def _create_graph_node(**node) -> None:
+    """Write an entity node to Neo4j, retrying transient failures."""
+    await get_neo4j_service().create_entity_node(**node)
+
+
+async def sync_entity_to_graph(**node) -> None:
+    """Background task mirroring a new entity into Neo4j for graph analytics."""
+    try:
+        await _create_graph_node(**node)
+    except Exception as e:
+        logger.warning(f"Neo4j sync failed for entity {node.get('entity_id')}: {e}")
 
 
 @router.post("/", response_model=EntityResponse, status_code=201)
-async def create_entity(entity_data: EntityCreate, db: AsyncSession = Depends(get_db)):
+async def create_entity(
+    entity_data: EntityCreate,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db)
+):
     """Create a new entity."""
     entity = Entity(**entity_data.model_dump())
     db.add(entity)
     await db.commit()
-    await db.refresh(entity)
     
-    # Also create in Neo4j for graph analytics
-    try:
-        neo4j_service = Neo4jService()
-        await neo4j_service.create_entity_node(entity)
-    except Exception:
-        pass  # Continue even if Neo4j fails
+    # Mirror into Neo4j after the response is sent; pass plain values so the
+    # task does not touch the ORM instance once the session is closed.
+    background_tasks.add_task(
+        sync_entity_to_graph,
+        entity_id=entity.id,
+        name=entity.name,
+        entity_type=entity.entity_type.value,
+        risk_score=entity.risk_score,
+        is_sanctioned=entity.is_sanctioned,
+        is_pep=entity.is_pep
+    )
     
-    return EntityResponse.model_validate(entity.to_dict())
+    return EntityResponse.model_validate(entity)
 
 
 @router.put("/{entity_id}", response_model=EntityResponse)
@@ -106,43 +164,47 @@ async def update_entity(
     db: AsyncSession = Depends(get_db)
 ):
     """Update an existing entity."""
-    result = await db.execute(select(Entity).where(Entity.id == entity_id))
+    update_data = entity_data.model_dump(exclude_unset=True)
+    result = await db.execute(
+        update(Entity)
+        .where(Entity.id == entity_id)
+        .values(**update_data)
+        .returning(Entity)
+    )
     entity = result.scalar_one_or_none()
     
     if not entity:
         raise HTTPException(status_code=404, detail="Entity not found")
     
-    update_data = entity_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(entity, field, value)
-    
     await db.commit()
-    await db.refresh(entity)
     
-    return EntityResponse.model_validate(entity.to_dict())
+    return EntityResponse.model_validate(entity)
 
 
 @router.delete("/{entity_id}", status_code=204)
 async def delete_entity(entity_id: str, db: AsyncSession = Depends(get_db)):
     """Delete an entity."""
-    result = await db.execute(select(Entity).where(Entity.id == entity_id))
-    entity = result.scalar_one_or_none()
+    result = await db.execute(
+        delete(Entity).where(Entity.id == entity_id).returning(Entity.id)
+    )
     
-    if not entity:
+    if result.first() is None:
         raise HTTPException(status_code=404, detail="Entity not found")
     
-    await db.delete(entity)
     await db.commit()
 
 
 @router.get("/{entity_id}/relationships")
-async def get_entity_relationships(entity_id: str, depth: int = Query(2, ge=1, le=5)):
+async def get_entity_relationships(
+    entity_id: str,
+    depth: int = Query(2, ge=1, le=5),
+    neo4j_service: Neo4jService = Depends(get_neo4j_service)
+):
     """
     Get related entities using graph traversal.
     
     Returns entities connected to the specified entity up to the given depth.
     """
-    neo4j_service = Neo4jService()
     relationships = await neo4j_service.get_entity_relationships(entity_id, depth)
     return {"entity_id": entity_id, "relationships": relationships, "depth": depth}
 
@@ -156,25 +218,52 @@ async def resolve_entities(
     """
     Resolve a list of names to existing entities using fuzzy matching.
     
-    Returns potential matches with confidence scores.
+    Returns up to five matches per name whose trigram similarity is at
+    least ``threshold``.
     """
-    # This would typically use more sophisticated entity resolution
-    # For now, doing simple name matching
-    results = []
-    for name in names:
-        query = select(Entity).where(Entity.name.ilike(f"%{name}%")).limit(5)
-        result = await db.execute(query)
-        matches = result.scalars().all()
-        results.append({
-            "input": name,
-            "matches": [
-                {
-                    "entity": EntityResponse.model_validate(e.to_dict()),
-                    "confidence": 0.9  # Placeholder
-                }
-                for e in matches
-            ]
+    if not names:
+        return {"results": []}
+    
+    # Match every input name in one round-trip: join a VALUES list of inputs
+    # against entities and keep the five closest matches per input, scored
+    # by pg_trgm similarity (the trigram index also serves the ILIKE).
+    # Repeated names are matched once; each copy gets the same result below.
+    inputs = values(column("input", String), name="inputs").data(
+        [(name,) for name in dict.fromkeys(names)]
+    )
+    similarity = func.similarity(Entity.name, inputs.c.input)
+    ranked = (
+        select(
+            Entity.id.label("entity_id"),
+            inputs.c.input,
+            similarity.label("confidence"),
+            func.row_number().over(
+                partition_by=inputs.c.input,
+                order_by=similarity.desc()
+            ).label("rank")
+        )
+        .select_from(inputs)
+        .join(Entity, Entity.name.ilike("%" + inputs.c.input + "%"))
+        .subquery()
+    )
+    query = (
+        select(Entity, ranked.c.input, ranked.c.confidence)
+        .join(ranked, Entity.id == ranked.c.entity_id)
+        .where(ranked.c.rank <= 5, ranked.c.confidence >= threshold)
+        .order_by(ranked.c.input, ranked.c.rank)
+    )
+    result = await db.execute(query)
+    
+    matches_by_input = {}
+    for entity, input_name, confidence in result.all():
+        matches_by_input.setdefault(input_name, []).append({
+            "entity": EntityResponse.model_validate(entity),
+            "confidence": round(float(confidence or 0), 4)
         })
     
+    results = [
+        {"input": name, "matches": matches_by_input.get(name, [])}
+        for name in names
+    ]
+    
     return {"results": results}
-
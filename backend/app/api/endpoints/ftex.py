@@ -8,19 +8,23 @@ Exposes FTex's core technology capabilities:
 - Decision Intelligence
 """
 
-from typing import List, Dict, Any, Optional
-from fastapi import APIRouter, HTTPException, Query
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
+from typing_extensions import TypedDict
 
 from app.services.entity_resolution_engine import (
     EntityResolutionEngine,
     EntityRecord,
-    ResolvedEntity
-)
-from app.services.network_generation import (
-    NetworkGenerationEngine,
-    RelationshipType
+    ResolvedEntity,
+    SimilarityScorer,
+    SIMILARITY_METRICS
 )
+from app.services.network_generation import NetworkGenerationEngine
+from app.services.neo4j_service import Neo4jService, get_neo4j_service
 from app.services.contextual_scoring import (
     ContextualScoringEngine,
     RiskScore
@@ -30,6 +34,31 @@ from app.services.contextual_scoring import (
 router = APIRouter()
 
 
+# ============================================
+# Engine Factories
+# ============================================
+# Engines are built once per configuration and shared across requests.
+# NetworkGenerationEngine accumulates the graph it is building, so it is
+# still created per request.
+
+@lru_cache(maxsize=1)
+def get_scoring_engine() -> ContextualScoringEngine:
+    """Shared contextual scoring engine with the default rule set."""
+    return ContextualScoringEngine()
+
+
+@lru_cache(maxsize=8)
+def get_resolution_engine(
+    match_threshold: float = 0.75,
+    blocking_strategies: Tuple[str, ...] = ("soundex", "ngram")
+) -> EntityResolutionEngine:
+    """Shared entity resolution engine for a threshold/blocking configuration."""
+    return EntityResolutionEngine(
+        match_threshold=match_threshold,
+        blocking_strategies=list(blocking_strategies)
+    )
+
+
 # ============================================
 # Pydantic Models for Request/Response
 # ============================================
@@ -68,6 +97,13 @@ class EntityResolutionResponse(BaseModel):
     resolved_entities: List[ResolvedEntityResponse]
 
 
+class CompareBatchRequest(BaseModel):
+    """Request model for batch name comparison."""
+    left: List[str]
+    right: Optional[List[str]] = None  # defaults to comparing left with itself
+    algorithms: List[str] = Field(["jaro_winkler", "levenshtein"], min_length=1)
+
+
 class NetworkNodeInput(BaseModel):
     """Input model for network node."""
     id: str
@@ -99,9 +135,24 @@ class ScoringRequest(BaseModel):
     context: Optional[Dict[str, Any]] = None
 
 
+class ScoringEntity(TypedDict, total=False):
+    """Entity attributes read by the default scoring rules."""
+    id: str
+    name: str
+    is_sanctioned: bool
+    matched_sanctions_lists: List[str]
+    sanctions_match_type: str
+    is_pep: bool
+    pep_level: str
+    pep_position: str
+    pep_country: str
+    country: str
+    jurisdiction: str
+
+
 class BatchScoringRequest(BaseModel):
     """Request model for batch scoring."""
-    entities: List[Dict[str, Any]]
+    entities: List[ScoringEntity]
 
 
 # ============================================
@@ -135,35 +186,41 @@ async def resolve_entities(request: EntityResolutionRequest):
     ]
     
     # Run entity resolution
-    engine = EntityResolutionEngine(
-        match_threshold=request.match_threshold,
-        blocking_strategies=request.blocking_strategies
+    engine = get_resolution_engine(
+        request.match_threshold,
+        tuple(request.blocking_strategies)
     )
     
     resolved = engine.resolve(records)
     
-    # Convert to response
-    response_entities = []
-    for entity in resolved:
-        response_entities.append(ResolvedEntityResponse(
-            resolved_id=entity.resolved_id,
-            canonical_name=entity.canonical_name,
-            entity_type=entity.entity_type,
-            confidence_score=entity.confidence_score,
-            source_record_ids=[r.id for r in entity.source_records],
-            attributes=entity.attributes,
-            match_scores=entity.match_scores
-        ))
-    
     # Calculate resolution rate (reduction in entities)
     resolution_rate = 1.0 - (len(resolved) / len(records)) if records else 0.0
     
-    return EntityResolutionResponse(
-        input_record_count=len(records),
-        resolved_entity_count=len(resolved),
-        resolution_rate=resolution_rate,
-        resolved_entities=response_entities
-    )
+    # Emit plain dicts straight to orjson; the response_model above only
+    # documents the shape, so the payload is not validated a second time.
+    return ORJSONResponse({
+        'input_record_count': len(records),
+        'resolved_entity_count': len(resolved),
+        'resolution_rate': resolution_rate,
+        'resolved_entities': [
+            {
+                'resolved_id': entity.resolved_id,
+                'canonical_name': entity.canonical_name,
+                'entity_type': entity.entity_type,
+                'confidence_score': entity.confidence_score,
+                'source_record_ids': [r.id for r in entity.source_records],
+                'attributes': entity.attributes,
+                'match_scores': entity.match_scores
+            }
+            for entity in resolved
+        ]
+    })
+
+
+NAME_SCORE_KEYS = (
+    'jaro_winkler', 'levenshtein', 'jaccard_bigram', 'jaccard_trigram',
+    'token_based', 'phonetic', 'composite'
+)
 
 
 @router.post("/entity-resolution/compare")
@@ -177,22 +234,24 @@ async def compare_entities(
     Uses multiple matching algorithms to determine if
     two records represent the same real-world entity.
     """
-    from app.services.entity_resolution_engine import SimilarityScorer
-    
     scorer = SimilarityScorer()
     
     name_a = entity_a.get('name', '')
     name_b = entity_b.get('name', '')
     
-    scores = {
-        'jaro_winkler': scorer.jaro_winkler_similarity(name_a, name_b),
-        'levenshtein': scorer.levenshtein_similarity(name_a, name_b),
-        'jaccard_bigram': scorer.jaccard_similarity(name_a, name_b, ngram=2),
-        'jaccard_trigram': scorer.jaccard_similarity(name_a, name_b, ngram=3),
-        'token_based': scorer.token_based_similarity(name_a, name_b),
-        'phonetic': scorer.phonetic_similarity(name_a, name_b),
-        'composite': scorer.composite_name_score(name_a, name_b)
-    }
+    if name_a == name_b:
+        # Identical names score 1.0 on every measure
+        scores = dict.fromkeys(NAME_SCORE_KEYS, 1.0)
+    else:
+        scores = {
+            'jaro_winkler': scorer.jaro_winkler_similarity(name_a, name_b),
+            'levenshtein': scorer.levenshtein_similarity(name_a, name_b),
+            'jaccard_bigram': scorer.jaccard_similarity(name_a, name_b, ngram=2),
+            'jaccard_trigram': scorer.jaccard_similarity(name_a, name_b, ngram=3),
+            'token_based': scorer.token_based_similarity(name_a, name_b),
+            'phonetic': scorer.phonetic_similarity(name_a, name_b),
+        }
+        scores['composite'] = scorer.composite_name_score(name_a, name_b, scores)
     
     # Additional attribute comparisons
     if entity_a.get('date_of_birth') and entity_b.get('date_of_birth'):
@@ -216,6 +275,41 @@ async def compare_entities(
     }
 
 
+@router.post("/entity-resolution/compare-batch")
+async def compare_entities_batch(request: CompareBatchRequest):
+    """
+    Compare many names in one call.
+    
+    Returns ``scores[a][i][j]``: the similarity of ``left[i]`` and
+    ``right[j]`` under ``algorithms[a]``, each computed as a single native
+    n×m matrix. Omit ``right`` to compare ``left`` with itself; the matrix
+    is then symmetric and only half of it is computed.
+    """
+    unknown = [a for a in request.algorithms if a not in SIMILARITY_METRICS]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown algorithms: {unknown}; choose from {sorted(SIMILARITY_METRICS)}"
+        )
+    
+    left = request.left
+    # Passing the same list as both sides lets rapidfuzz skip the mirrored half
+    right = left if request.right is None else request.right
+    
+    scorer = SimilarityScorer()
+    scores = np.stack([
+        scorer.similarity_matrix(left, SIMILARITY_METRICS[algorithm], right)
+        for algorithm in request.algorithms
+    ])
+    
+    # ORJSONResponse serializes the ndarray natively (OPT_SERIALIZE_NUMPY)
+    return ORJSONResponse({
+        'algorithms': request.algorithms,
+        'shape': list(scores.shape),
+        'scores': scores
+    })
+
+
 # ============================================
 # Network Generation Endpoints
 # ============================================
@@ -235,29 +329,11 @@ async def generate_network(request: NetworkGenerationRequest):
     """
     engine = NetworkGenerationEngine()
     
-    # Create nodes
-    for node in request.nodes:
-        engine.create_node_from_entity(
-            entity_id=node.id,
-            entity_type=node.entity_type,
-            name=node.name,
-            attributes=node.attributes,
-            risk_score=node.risk_score
-        )
-    
-    # Create explicit edges
-    for edge in request.edges:
-        try:
-            rel_type = RelationshipType(edge.relationship_type)
-        except ValueError:
-            rel_type = RelationshipType.RELATED_TO
-        
-        engine.create_edge(
-            source_id=edge.source_id,
-            target_id=edge.target_id,
-            relationship_type=rel_type,
-            attributes=edge.attributes
-        )
+    # Create nodes and explicit edges
+    engine.bulk_load(
+        [node.model_dump() for node in request.nodes],
+        [edge.model_dump() for edge in request.edges or []]
+    )
     
     # Extract from transactions
     if request.transactions:
@@ -285,7 +361,8 @@ async def generate_network(request: NetworkGenerationRequest):
 @router.post("/network/analyze/{entity_id}")
 async def analyze_entity_network(
     entity_id: str,
-    depth: int = Query(2, ge=1, le=5)
+    depth: int = Query(2, ge=1, le=5),
+    neo4j_service: Neo4jService = Depends(get_neo4j_service)
 ):
     """
     Analyze the network around a specific entity.
@@ -295,21 +372,35 @@ async def analyze_entity_network(
     - Connected entities up to specified depth
     - Risk propagation analysis
     """
-    engine = NetworkGenerationEngine()
-    
-    # In a real implementation, this would load from database/Neo4j
-    # For demo, return structure
+    # Metrics and propagation are computed by Neo4j/APOC, not in Python
+    try:
+        metrics = await neo4j_service.get_entity_metrics(entity_id)
+        propagation = await neo4j_service.analyze_risk_propagation(entity_id, depth)
+    except Exception as e:
+        return {
+            'entity_id': entity_id,
+            'depth': depth,
+            'metrics': {
+                'degree_centrality': 0.0,
+                'clustering_coefficient': 0.0,
+                'risk_exposure': 0.0
+            },
+            'connected_entities': [],
+            'risk_propagation': {},
+            'error': str(e)
+        }
     
+    affected = propagation['affected_entities']
     return {
         'entity_id': entity_id,
         'depth': depth,
         'metrics': {
-            'degree_centrality': 0.0,
-            'clustering_coefficient': 0.0,
-            'risk_exposure': 0.0
+            'degree_centrality': metrics['degree'],
+            'clustering_coefficient': metrics['clustering'],
+            'risk_exposure': metrics['risk_exposure']
         },
-        'connected_entities': [],
-        'risk_propagation': {}
+        'connected_entities': affected,
+        'risk_propagation': {a['id']: a['propagated_risk'] for a in affected}
     }
 
 
@@ -317,7 +408,8 @@ async def analyze_entity_network(
 async def find_network_path(
     source_id: str,
     target_id: str,
-    max_depth: int = Query(6, ge=1, le=10)
+    max_depth: int = Query(6, ge=1, le=10),
+    neo4j_service: Neo4jService = Depends(get_neo4j_service)
 ):
     """
     Find shortest path between two entities in the network.
@@ -327,14 +419,29 @@ async def find_network_path(
     - Understanding money flow paths
     - Compliance investigations
     """
-    # Would use Neo4j pathfinding in real implementation
+    # Weighted shortest path runs server-side via APOC Dijkstra
+    try:
+        path = await neo4j_service.find_weighted_path(source_id, target_id, max_depth)
+    except Exception as e:
+        return {
+            'source_id': source_id,
+            'target_id': target_id,
+            'max_depth': max_depth,
+            'path_found': False,
+            'path': [],
+            'path_length': -1,
+            'error': str(e)
+        }
+    
     return {
         'source_id': source_id,
         'target_id': target_id,
         'max_depth': max_depth,
-        'path_found': False,
-        'path': [],
-        'path_length': -1
+        'path_found': path['length'] >= 0,
+        'path': path['nodes'],
+        'relationships': path['relationships'],
+        'path_length': path['length'],
+        'path_weight': path.get('weight')
     }
 
 
@@ -357,7 +464,7 @@ async def calculate_risk_score(request: ScoringRequest):
     
     Returns explainable risk score with contributing factors.
     """
-    engine = ContextualScoringEngine()
+    engine = get_scoring_engine()
     
     score = engine.calculate_score(
         entity=request.entity,
@@ -375,6 +482,10 @@ async def calculate_risk_score(request: ScoringRequest):
     }
 
 
+# Level code from which an entity counts as high risk ("high" or "critical")
+HIGH_RISK_LEVEL = RiskScore.LEVELS.index("high")
+
+
 @router.post("/scoring/batch")
 async def batch_calculate_scores(request: BatchScoringRequest):
     """
@@ -382,28 +493,32 @@ async def batch_calculate_scores(request: BatchScoringRequest):
     
     Efficient batch processing for screening large volumes.
     """
-    engine = ContextualScoringEngine()
-    
-    results = []
-    for entity in request.entities:
-        score = engine.calculate_score(entity, {})
-        results.append({
-            'entity_id': entity.get('id', 'unknown'),
-            'overall_score': score.overall_score,
-            'risk_level': score.risk_level,
-            'factor_count': len(score.factors)
-        })
-    
-    # Summary statistics
-    high_risk = sum(1 for r in results if r['risk_level'] in ['high', 'critical'])
-    avg_score = sum(r['overall_score'] for r in results) / len(results) if results else 0
+    engine = get_scoring_engine()
     
-    return {
-        'entity_count': len(results),
+    scores, factor_counts = engine.calculate_scores_vectorized(request.entities)
+    level_codes = RiskScore.level_codes(scores)
+    
+    # Summary statistics as array reductions
+    high_risk = int(np.count_nonzero(level_codes >= HIGH_RISK_LEVEL))
+    avg_score = float(scores.mean()) if len(scores) else 0
+    
+    levels = RiskScore.LEVELS
+    return ORJSONResponse({
+        'entity_count': len(scores),
         'high_risk_count': high_risk,
         'average_score': avg_score,
-        'scores': results
-    }
+        'scores': [
+            {
+                'entity_id': entity.get('id', 'unknown'),
+                'overall_score': score,
+                'risk_level': levels[code],
+                'factor_count': factor_count
+            }
+            for entity, score, code, factor_count in zip(
+                request.entities, scores.tolist(), level_codes.tolist(), factor_counts.tolist()
+            )
+        ]
+    })
 
 
 @router.post("/scoring/explain")
@@ -417,7 +532,7 @@ async def explain_risk_score(
     
     Provides full transparency into scoring factors and recommendations.
     """
-    engine = ContextualScoringEngine()
+    engine = get_scoring_engine()
     
     score = engine.calculate_score(entity, context or {})
     explanation = engine.explain_score(score)
@@ -4,7 +4,7 @@ Graph Analytics API endpoints for entity relationship visualization.
 
 from typing import List, Optional
 from fastapi import APIRouter, Depends, Query, HTTPException
-from app.services.neo4j_service import Neo4jService
+from app.services.neo4j_service import Neo4jService, get_neo4j_service
 
 
 router = APIRouter()
@@ -14,15 +14,14 @@ router = APIRouter()
 async def get_entity_network(
     entity_id: str,
     depth: int = Query(2, ge=1, le=5),
-    limit: int = Query(100, ge=1, le=500)
+    limit: int = Query(100, ge=1, le=500),
+    neo4j_service: Neo4jService = Depends(get_neo4j_service)
 ):
     """
     Get the relationship network for an entity.
     
     Returns nodes and edges for graph visualization.
     """
-    neo4j_service = Neo4jService()
-    
     try:
         network = await neo4j_service.get_entity_network(entity_id, depth, limit)
         return network
@@ -38,13 +37,12 @@ async def get_entity_network(
 async def find_shortest_path(
     source_id: str,
     target_id: str,
-    max_depth: int = Query(10, ge=1, le=20)
+    max_depth: int = Query(10, ge=1, le=20),
+    neo4j_service: Neo4jService = Depends(get_neo4j_service)
 ):
     """
     Find the shortest path between two entities.
     """
-    neo4j_service = Neo4jService()
-    
     try:
         path = await neo4j_service.find_shortest_path(source_id, target_id, max_depth)
         return path
@@ -57,15 +55,14 @@ async def find_shortest_path(
 
 @router.get("/community-detection")
 async def detect_communities(
-    min_size: int = Query(3, ge=2, le=100)
+    min_size: int = Query(3, ge=2, le=100),
+    neo4j_service: Neo4jService = Depends(get_neo4j_service)
 ):
     """
     Detect communities/clusters in the entity network.
     
     Uses graph algorithms to identify closely connected groups.
     """
-    neo4j_service = Neo4jService()
-    
     try:
         communities = await neo4j_service.detect_communities(min_size)
         return communities
@@ -79,15 +76,14 @@ async def detect_communities(
 @router.get("/centrality")
 async def calculate_centrality(
     algorithm: str = Query("pagerank", pattern="^(pagerank|betweenness|degree)$"),
-    limit: int = Query(20, ge=1, le=100)
+    limit: int = Query(20, ge=1, le=100),
+    neo4j_service: Neo4jService = Depends(get_neo4j_service)
 ):
     """
     Calculate centrality metrics for entities in the network.
     
     Identifies the most influential or connected entities.
     """
-    neo4j_service = Neo4jService()
-    
     try:
         results = await neo4j_service.calculate_centrality(algorithm, limit)
         return results
@@ -104,13 +100,12 @@ async def create_relationship(
     source_id: str,
     target_id: str,
     relationship_type: str,
-    properties: Optional[dict] = None
+    properties: Optional[dict] = None,
+    neo4j_service: Neo4jService = Depends(get_neo4j_service)
 ):
     """
     Create a relationship between two entities in the graph.
     """
-    neo4j_service = Neo4jService()
-    
     try:
         result = await neo4j_service.create_relationship(
             source_id, target_id, relationship_type, properties or {}
@@ -123,15 +118,14 @@ async def create_relationship(
 @router.get("/risk-propagation/{entity_id}")
 async def analyze_risk_propagation(
     entity_id: str,
-    depth: int = Query(3, ge=1, le=5)
+    depth: int = Query(3, ge=1, le=5),
+    neo4j_service: Neo4jService = Depends(get_neo4j_service)
 ):
     """
     Analyze how risk propagates through the network from a source entity.
     
     Returns entities at risk due to their connection to the source.
     """
-    neo4j_service = Neo4jService()
-    
     try:
         propagation = await neo4j_service.analyze_risk_propagation(entity_id, depth)
         return propagation
@@ -147,15 +141,14 @@ async def analyze_risk_propagation(
 async def get_transaction_flow(
     entity_id: str,
     direction: str = Query("both", pattern="^(incoming|outgoing|both)$"),
-    limit: int = Query(50, ge=1, le=200)
+    limit: int = Query(50, ge=1, le=200),
+    neo4j_service: Neo4jService = Depends(get_neo4j_service)
 ):
     """
     Get transaction flow patterns for an entity.
     
     Shows money flow visualization data.
     """
-    neo4j_service = Neo4jService()
-    
     try:
         flow = await neo4j_service.get_transaction_flow(entity_id, direction, limit)
         return flow
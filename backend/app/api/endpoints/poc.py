@@ -7,19 +7,61 @@ product demonstrations as referenced in lines 23 and 25 of plan.txt.
 
 from typing import List, Optional
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select, update, func, and_, or_, literal
 from pydantic import BaseModel, Field
-from app.core.database import get_db
+from app.core.database import get_db, fetch_page
+from app.core.cache import cached, invalidate, count_cache_key, row_etag, etag_matches
+from app.core.pagination import encode_cursor, decode_cursor, keyset_filter, keyset_order
+from app.core.config import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from app.models.poc import (
     ProvingEngagement, EngagementType, EngagementStatus,
-    ProductDemo, DemoType, DemoScenario
+    ProductDemo, DemoType, DemoScenario, engagement_seq, demo_seq,
+    engagement_created_key, ENGAGEMENT_UNDATED, demo_schedule_key, DEMO_UNSCHEDULED
 )
 
 
 router = APIRouter()
 
+# Sort keys for the engagement list as (column, descending); id breaks ties
+# so that keyset cursors are unambiguous.
+ENGAGEMENT_SORT_KEYS = (
+    (engagement_created_key, True),
+    (ProvingEngagement.id, True),
+)
+ENGAGEMENT_CURSOR_PARSERS = (datetime.fromisoformat, str)
+
+# Demos sort newest first with unscheduled demos last
+DEMO_SORT_KEYS = (
+    (demo_schedule_key, True),
+    (ProductDemo.id, True),
+)
+DEMO_CURSOR_PARSERS = (datetime.fromisoformat, str)
+
+DEMO_DASHBOARD_CACHE_KEY = "poc:demos:dashboard"
+
+# List views read only the columns to_dict() renders, skipping ORM hydration
+# and wide columns such as feedback, materials and outcome notes. Enum and
+# datetime values serialize to the same JSON as to_dict() produces.
+DEMO_LIST_COLUMNS = (
+    ProductDemo.id, ProductDemo.demo_number, ProductDemo.demo_type,
+    ProductDemo.client_name, ProductDemo.client_industry, ProductDemo.attendees,
+    ProductDemo.audience_type, ProductDemo.title, ProductDemo.description,
+    ProductDemo.key_messages, ProductDemo.solution_areas, ProductDemo.use_cases_shown,
+    ProductDemo.delivery_format, ProductDemo.scheduled_date, ProductDemo.actual_date,
+    ProductDemo.duration_minutes, ProductDemo.presenter, ProductDemo.status,
+    ProductDemo.overall_rating, ProductDemo.strengths, ProductDemo.improvements,
+    ProductDemo.created_at,
+)
+SCENARIO_LIST_COLUMNS = (
+    DemoScenario.id, DemoScenario.name, DemoScenario.description,
+    DemoScenario.solution_area, DemoScenario.target_audience, DemoScenario.narrative,
+    DemoScenario.demo_steps, DemoScenario.talking_points, DemoScenario.key_features,
+    DemoScenario.estimated_duration, DemoScenario.times_used, DemoScenario.avg_rating,
+    DemoScenario.version,
+)
+
 
 # ============================================
 # Pydantic Schemas
@@ -112,47 +154,80 @@ async def list_engagements(
     solution_area: Optional[str] = None,
     search: Optional[str] = None,
     page: int = Query(1, ge=1),
-    page_size: int = Query(20, ge=1, le=100),
+    page_size: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db)
 ):
     """
     List PoC/Trial engagements with filtering.
     
     Supports filtering by type, status, client, solution area, and search.
+    Pass the returned ``next_cursor`` as ``cursor`` for constant-time deep
+    paging; ``page`` remains as the offset-based fallback.
     """
-    query = select(ProvingEngagement)
-    
+    # The WHERE clauses are kept separately so the counts below reuse them
+    # without wrapping the row query in a subquery
+    filters = []
     if engagement_type:
-        query = query.where(ProvingEngagement.engagement_type == engagement_type)
+        filters.append(ProvingEngagement.engagement_type == engagement_type)
     if status:
-        query = query.where(ProvingEngagement.status == status)
+        filters.append(ProvingEngagement.status == status)
     if client_name:
-        query = query.where(ProvingEngagement.client_name.ilike(f"%{client_name}%"))
+        filters.append(ProvingEngagement.client_name.ilike(f"%{client_name}%"))
     if search:
-        query = query.where(
+        filters.append(
             or_(
                 ProvingEngagement.title.ilike(f"%{search}%"),
                 ProvingEngagement.client_name.ilike(f"%{search}%")
             )
         )
     
-    # Get total
-    count_query = select(func.count()).select_from(query.subquery())
-    total = await db.scalar(count_query)
+    query = select(ProvingEngagement).where(*filters)
+    count_query = select(func.count(ProvingEngagement.id)).where(*filters)
     
-    # Paginate
-    offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size).order_by(ProvingEngagement.created_at.desc())
-    
-    result = await db.execute(query)
-    engagements = result.scalars().all()
+    paged = query.order_by(*keyset_order(ENGAGEMENT_SORT_KEYS)).limit(page_size)
+    if cursor:
+        # A window count after the cursor predicate would only see the
+        # remaining rows, so the total comes from its own count query,
+        # run concurrently with the page.
+        paged = paged.where(
+            keyset_filter(ENGAGEMENT_SORT_KEYS, decode_cursor(cursor, ENGAGEMENT_CURSOR_PARSERS))
+        )
+        total, engagements = await fetch_page(
+            db,
+            paged,
+            lambda row: row["ProvingEngagement"],
+            count_query
+        )
+    else:
+        # Paginate, reading the total from a window count over the same scan
+        offset = (page - 1) * page_size
+        result = await db.execute(
+            paged.add_columns(func.count().over().label("total_count")).offset(offset)
+        )
+        rows = result.all()
+        engagements = [row[0] for row in rows]
+        
+        if rows:
+            total = rows[0].total_count
+        elif offset:
+            # Past the last page there is no row to carry the count
+            total = await db.scalar(count_query)
+        else:
+            total = 0
+    
+    next_cursor = None
+    if len(engagements) == page_size:
+        last = engagements[-1]
+        next_cursor = encode_cursor((last.created_at or ENGAGEMENT_UNDATED, last.id))
     
     return {
         "items": [e.to_dict() for e in engagements],
         "total": total,
         "page": page,
         "page_size": page_size,
-        "pages": (total + page_size - 1) // page_size if total > 0 else 0
+        "pages": (total + page_size - 1) // page_size if total > 0 else 0,
+        "next_cursor": next_cursor
     }
 
 
@@ -161,25 +236,20 @@ async def get_engagement_dashboard(db: AsyncSession = Depends(get_db)):
     """
     Get PoC/Trial dashboard statistics.
     """
-    # Count by status
-    status_counts = {}
-    for status in EngagementStatus:
-        count = await db.scalar(
-            select(func.count()).select_from(ProvingEngagement).where(
-                ProvingEngagement.status == status
-            )
-        )
-        status_counts[status.value] = count or 0
-    
-    # Count by type
-    type_counts = {}
-    for etype in EngagementType:
-        count = await db.scalar(
-            select(func.count()).select_from(ProvingEngagement).where(
-                ProvingEngagement.engagement_type == etype
-            )
-        )
-        type_counts[etype.value] = count or 0
+    # Count by status and type in one grouped query
+    rows = await db.execute(
+        select(
+            ProvingEngagement.status,
+            ProvingEngagement.engagement_type,
+            func.count()
+        ).group_by(ProvingEngagement.status, ProvingEngagement.engagement_type)
+    )
+    status_counts = {status.value: 0 for status in EngagementStatus}
+    type_counts = {etype.value: 0 for etype in EngagementType}
+    for status, etype, count in rows:
+        if status is not None:
+            status_counts[status.value] += count
+        type_counts[etype.value] += count
     
     # Active engagements
     active = status_counts.get("in_progress", 0)
@@ -218,9 +288,9 @@ async def create_engagement(
 ):
     """Create a new PoC/Trial engagement."""
     # Generate engagement number
-    count = await db.scalar(select(func.count()).select_from(ProvingEngagement))
+    next_id = await db.scalar(select(engagement_seq.next_value()))
     type_prefix = data.engagement_type.value.upper()[:3]
-    engagement_number = f"{type_prefix}-{datetime.utcnow().strftime('%Y%m')}-{(count or 0) + 1:04d}"
+    engagement_number = f"{type_prefix}-{datetime.utcnow():%Y%m}-{next_id:04d}"
     
     engagement = ProvingEngagement(
         **data.model_dump(),
@@ -228,7 +298,6 @@ async def create_engagement(
     )
     db.add(engagement)
     await db.commit()
-    await db.refresh(engagement)
     
     return engagement.to_dict()
 
@@ -253,7 +322,6 @@ async def update_engagement(
         setattr(engagement, field, value)
     
     await db.commit()
-    await db.refresh(engagement)
     
     return engagement.to_dict()
 
@@ -315,91 +383,133 @@ async def list_demos(
     date_from: Optional[datetime] = None,
     date_to: Optional[datetime] = None,
     page: int = Query(1, ge=1),
-    page_size: int = Query(20, ge=1, le=100),
+    page_size: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db)
 ):
     """
     List product demonstrations with filtering.
-    """
-    query = select(ProductDemo)
     
+    Pass the returned ``next_cursor`` as ``cursor`` for constant-time deep
+    paging; ``page`` remains as the offset-based fallback.
+    """
+    filters = []
     if demo_type:
-        query = query.where(ProductDemo.demo_type == demo_type)
+        filters.append(ProductDemo.demo_type == demo_type)
     if status:
-        query = query.where(ProductDemo.status == status)
+        filters.append(ProductDemo.status == status)
     if client_name:
-        query = query.where(ProductDemo.client_name.ilike(f"%{client_name}%"))
+        filters.append(ProductDemo.client_name.ilike(f"%{client_name}%"))
     if presenter:
-        query = query.where(ProductDemo.presenter == presenter)
+        filters.append(ProductDemo.presenter == presenter)
     if date_from:
-        query = query.where(ProductDemo.scheduled_date >= date_from)
+        filters.append(ProductDemo.scheduled_date >= date_from)
     if date_to:
-        query = query.where(ProductDemo.scheduled_date <= date_to)
+        filters.append(ProductDemo.scheduled_date <= date_to)
     
-    # Get total
-    count_query = select(func.count()).select_from(query.subquery())
-    total = await db.scalar(count_query)
+    count_query = select(func.count(ProductDemo.id)).where(*filters)
     
-    # Paginate
-    offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size).order_by(ProductDemo.scheduled_date.desc())
+    # Paginate, counting concurrently
+    query = select(*DEMO_LIST_COLUMNS).where(*filters).order_by(*keyset_order(DEMO_SORT_KEYS))
+    if cursor:
+        query = query.where(
+            keyset_filter(DEMO_SORT_KEYS, decode_cursor(cursor, DEMO_CURSOR_PARSERS))
+        )
+    else:
+        query = query.offset((page - 1) * page_size)
+    query = query.limit(page_size)
+    
+    count_key = count_cache_key("demos", {
+        "demo_type": demo_type, "status": status, "client_name": client_name,
+        "presenter": presenter, "date_from": date_from, "date_to": date_to
+    })
+    total, items = await fetch_page(db, query, dict, count_query, count_key)
     
-    result = await db.execute(query)
-    demos = result.scalars().all()
+    next_cursor = None
+    if len(items) == page_size:
+        last = items[-1]
+        next_cursor = encode_cursor((last["scheduled_date"] or DEMO_UNSCHEDULED, last["id"]))
     
     return {
-        "items": [d.to_dict() for d in demos],
+        "items": items,
         "total": total,
         "page": page,
         "page_size": page_size,
-        "pages": (total + page_size - 1) // page_size if total > 0 else 0
+        "pages": (total + page_size - 1) // page_size if total > 0 else 0,
+        "next_cursor": next_cursor
     }
 
 
 @router.get("/demos/dashboard")
-async def get_demo_dashboard(db: AsyncSession = Depends(get_db)):
-    """Get demo statistics."""
-    # Total demos
-    total = await db.scalar(select(func.count()).select_from(ProductDemo))
-    
-    # Upcoming demos
-    upcoming = await db.scalar(
-        select(func.count()).select_from(ProductDemo).where(
-            and_(
-                ProductDemo.scheduled_date >= datetime.utcnow(),
-                ProductDemo.status == "scheduled"
-            )
-        )
-    )
+@cached(key=DEMO_DASHBOARD_CACHE_KEY, ttl=30)
+async def get_demo_dashboard(fresh: bool = False, db: AsyncSession = Depends(get_db)):
+    """
+    Get demo statistics.
     
-    # Average rating
-    avg_rating = await db.scalar(
-        select(func.avg(ProductDemo.overall_rating)).where(
-            ProductDemo.overall_rating.isnot(None)
-        )
+    Cached for 30 seconds; pass ``fresh=true`` to recompute.
+    """
+    # Per-type counts with the upcoming count and rating aggregates folded
+    # into the same grouped query
+    rows = await db.execute(
+        select(
+            ProductDemo.demo_type,
+            func.count(),
+            func.count().filter(
+                and_(
+                    ProductDemo.scheduled_date >= datetime.utcnow(),
+                    ProductDemo.status == "scheduled"
+                )
+            ),
+            func.sum(ProductDemo.overall_rating),
+            func.count(ProductDemo.overall_rating)
+        ).group_by(ProductDemo.demo_type)
     )
     
-    # By type
-    type_counts = {}
-    for dtype in DemoType:
-        count = await db.scalar(
-            select(func.count()).select_from(ProductDemo).where(
-                ProductDemo.demo_type == dtype
-            )
-        )
-        type_counts[dtype.value] = count or 0
+    type_counts = {dtype.value: 0 for dtype in DemoType}
+    total = upcoming = rated = 0
+    rating_sum = 0.0
+    for dtype, count, upcoming_count, type_rating_sum, type_rated in rows:
+        type_counts[dtype.value] += count
+        total += count
+        upcoming += upcoming_count
+        rating_sum += type_rating_sum or 0
+        rated += type_rated
+    
+    # Average rating
+    avg_rating = rating_sum / rated if rated else 0
     
     return {
-        "total_demos": total or 0,
-        "upcoming_demos": upcoming or 0,
-        "average_rating": round(float(avg_rating or 0), 2),
+        "total_demos": total,
+        "upcoming_demos": upcoming,
+        "average_rating": round(float(avg_rating), 2),
         "by_type": type_counts
     }
 
 
 @router.get("/demos/{demo_id}")
-async def get_demo(demo_id: str, db: AsyncSession = Depends(get_db)):
-    """Get specific demo details."""
+async def get_demo(
+    demo_id: str,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get specific demo details.
+    
+    Honours If-None-Match against the demo's ETag with a 304.
+    """
+    version = await db.execute(
+        select(ProductDemo.updated_at).where(ProductDemo.id == demo_id)
+    )
+    row = version.first()
+    
+    if row is None:
+        raise HTTPException(status_code=404, detail="Demo not found")
+    
+    etag = row_etag(row.updated_at)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    
     result = await db.execute(
         select(ProductDemo).where(ProductDemo.id == demo_id)
     )
@@ -408,6 +518,7 @@ async def get_demo(demo_id: str, db: AsyncSession = Depends(get_db)):
     if not demo:
         raise HTTPException(status_code=404, detail="Demo not found")
     
+    response.headers["ETag"] = row_etag(demo.updated_at)
     return demo.to_dict()
 
 
@@ -417,8 +528,8 @@ async def create_demo(
     db: AsyncSession = Depends(get_db)
 ):
     """Schedule a new product demonstration."""
-    count = await db.scalar(select(func.count()).select_from(ProductDemo))
-    demo_number = f"DEMO-{datetime.utcnow().strftime('%Y%m')}-{(count or 0) + 1:04d}"
+    next_id = await db.scalar(select(demo_seq.next_value()))
+    demo_number = f"DEMO-{datetime.utcnow():%Y%m}-{next_id:04d}"
     
     demo = ProductDemo(
         **data.model_dump(),
@@ -427,7 +538,7 @@ async def create_demo(
     )
     db.add(demo)
     await db.commit()
-    await db.refresh(demo)
+    await invalidate(DEMO_DASHBOARD_CACHE_KEY)
     
     return demo.to_dict()
 
@@ -439,20 +550,24 @@ async def update_demo(
     db: AsyncSession = Depends(get_db)
 ):
     """Update a demo."""
-    result = await db.execute(
-        select(ProductDemo).where(ProductDemo.id == demo_id)
-    )
+    update_data = data.model_dump(exclude_unset=True)
+    if update_data:
+        statement = (
+            update(ProductDemo)
+            .where(ProductDemo.id == demo_id)
+            .values(**update_data)
+            .returning(ProductDemo)
+        )
+    else:
+        statement = select(ProductDemo).where(ProductDemo.id == demo_id)
+    result = await db.execute(statement)
     demo = result.scalar_one_or_none()
     
     if not demo:
         raise HTTPException(status_code=404, detail="Demo not found")
     
-    update_data = data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(demo, field, value)
-    
     await db.commit()
-    await db.refresh(demo)
+    await invalidate(DEMO_DASHBOARD_CACHE_KEY)
     
     return demo.to_dict()
 
@@ -465,22 +580,24 @@ async def complete_demo(
     db: AsyncSession = Depends(get_db)
 ):
     """Mark demo as completed."""
+    values = {"status": "completed", "actual_date": datetime.utcnow()}
+    if overall_rating:
+        values["overall_rating"] = overall_rating
+    if outcome_notes:
+        values["outcome_notes"] = outcome_notes
+    
     result = await db.execute(
-        select(ProductDemo).where(ProductDemo.id == demo_id)
+        update(ProductDemo)
+        .where(ProductDemo.id == demo_id)
+        .values(**values)
+        .returning(ProductDemo.id)
     )
-    demo = result.scalar_one_or_none()
     
-    if not demo:
+    if result.first() is None:
         raise HTTPException(status_code=404, detail="Demo not found")
     
-    demo.status = "completed"
-    demo.actual_date = datetime.utcnow()
-    if overall_rating:
-        demo.overall_rating = overall_rating
-    if outcome_notes:
-        demo.outcome_notes = outcome_notes
-    
     await db.commit()
+    await invalidate(DEMO_DASHBOARD_CACHE_KEY)
     
     return {"message": "Demo completed", "demo_id": demo_id}
 
@@ -495,35 +612,38 @@ async def list_scenarios(
     target_audience: Optional[str] = None,
     search: Optional[str] = None,
     page: int = Query(1, ge=1),
-    page_size: int = Query(20, ge=1, le=100),
+    page_size: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     db: AsyncSession = Depends(get_db)
 ):
     """List demo scenarios/templates."""
-    query = select(DemoScenario).where(DemoScenario.is_active == 1)
-    
+    filters = [DemoScenario.is_active == 1]
     if solution_area:
-        query = query.where(DemoScenario.solution_area == solution_area)
+        filters.append(DemoScenario.solution_area == solution_area)
     if target_audience:
-        query = query.where(DemoScenario.target_audience == target_audience)
+        filters.append(DemoScenario.target_audience == target_audience)
     if search:
-        query = query.where(
+        filters.append(
             or_(
                 DemoScenario.name.ilike(f"%{search}%"),
                 DemoScenario.description.ilike(f"%{search}%")
             )
         )
     
-    count_query = select(func.count()).select_from(query.subquery())
-    total = await db.scalar(count_query)
+    count_query = select(func.count(DemoScenario.id)).where(*filters)
     
     offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size).order_by(DemoScenario.times_used.desc())
-    
-    result = await db.execute(query)
-    scenarios = result.scalars().all()
+    # The list only returns active scenarios
+    query = select(*SCENARIO_LIST_COLUMNS, literal(True).label("is_active")).where(*filters).offset(offset).limit(page_size).order_by(DemoScenario.times_used.desc())
+    
+    count_key = count_cache_key("scenarios", {
+        "solution_area": solution_area, "target_audience": target_audience, "search": search
+    })
+    total, items = await fetch_page(
+        db, query, dict, count_query, count_key
+    )
     
     return {
-        "items": [s.to_dict() for s in scenarios],
+        "items": items,
         "total": total,
         "page": page,
         "page_size": page_size
@@ -539,7 +659,6 @@ async def create_scenario(
     scenario = DemoScenario(**data.model_dump())
     db.add(scenario)
     await db.commit()
-    await db.refresh(scenario)
     
     return scenario.to_dict()
 
@@ -547,16 +666,18 @@ async def create_scenario(
 @router.get("/scenarios/{scenario_id}")
 async def get_scenario(scenario_id: str, db: AsyncSession = Depends(get_db)):
     """Get a specific scenario."""
+    # Fetch and increment usage count in one atomic statement
     result = await db.execute(
-        select(DemoScenario).where(DemoScenario.id == scenario_id)
+        update(DemoScenario)
+        .where(DemoScenario.id == scenario_id)
+        .values(times_used=DemoScenario.times_used + 1)
+        .returning(DemoScenario)
     )
     scenario = result.scalar_one_or_none()
     
     if not scenario:
         raise HTTPException(status_code=404, detail="Scenario not found")
     
-    # Increment usage count
-    scenario.times_used += 1
     await db.commit()
     
     return scenario.to_dict()
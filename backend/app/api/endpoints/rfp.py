@@ -11,14 +11,22 @@ Request for Information (RFIs) including:
 """
 
 from typing import List, Optional
-from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, Query
+from datetime import datetime, timedelta
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_
-from app.core.database import get_db
+from sqlalchemy import select, insert, update, func, and_, or_, cast, literal_column
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import raiseload
+from app.core.database import get_db, fetch_page
+from app.core.cache import cached, invalidate, count_cache_key, row_etag, etag_matches
+from app.core.pagination import encode_cursor, decode_cursor, keyset_filter, keyset_order
+from app.core.config import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from app.models.rfp import (
     Proposal, ProposalType, ProposalStatus, ProposalPriority,
-    ProposalSection, ContentLibrary
+    ProposalSection, ContentLibrary, proposal_seq,
+    proposal_due_key, PROPOSAL_UNDATED, proposal_priority_key, PROPOSAL_PRIORITY_UNSET,
+    proposal_dashboard_stats
 )
 from app.schemas.rfp import (
     ProposalCreate, ProposalUpdate, ProposalResponse, ProposalListResponse,
@@ -29,6 +37,25 @@ from app.schemas.rfp import (
 
 router = APIRouter()
 
+# Sort keys for the proposal list as (column, descending): soonest due
+# first, undated proposals last, id breaking ties so that keyset cursors
+# are unambiguous.
+PROPOSAL_SORT_KEYS = (
+    (proposal_due_key, False),
+    (proposal_priority_key, True),
+    (Proposal.id, False),
+)
+PROPOSAL_CURSOR_PARSERS = (datetime.fromisoformat, ProposalPriority, str)
+
+# List views read only the columns their response schemas expose, skipping
+# ORM hydration, the to_dict() round-trip and wide columns such as the
+# requirement and attachment JSON.
+PROPOSAL_LIST_COLUMNS = tuple(getattr(Proposal, name) for name in ProposalResponse.model_fields)
+CONTENT_LIST_COLUMNS = tuple(getattr(ContentLibrary, name) for name in ContentResponse.model_fields)
+SECTION_LIST_COLUMNS = tuple(getattr(ProposalSection, name) for name in SectionResponse.model_fields)
+
+DASHBOARD_CACHE_KEY = "rfp:dashboard"
+
 
 # ============================================
 # Proposal Management
@@ -45,32 +72,33 @@ async def list_proposals(
     due_before: Optional[datetime] = None,
     search: Optional[str] = None,
     page: int = Query(1, ge=1),
-    page_size: int = Query(20, ge=1, le=100),
+    page_size: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db)
 ):
     """
     List RFPs/RFIs with filtering and pagination.
     
     Supports filtering by type, status, priority, client, owner,
-    solution area, due date, and full-text search.
+    solution area, due date, and full-text search. Pass the returned
+    ``next_cursor`` as ``cursor`` for constant-time deep paging.
     """
-    query = select(Proposal)
-    
     # Apply filters
+    filters = []
     if proposal_type:
-        query = query.where(Proposal.proposal_type == proposal_type)
+        filters.append(Proposal.proposal_type == proposal_type)
     if status:
-        query = query.where(Proposal.status == status)
+        filters.append(Proposal.status == status)
     if priority:
-        query = query.where(Proposal.priority == priority)
+        filters.append(Proposal.priority == priority)
     if client_name:
-        query = query.where(Proposal.client_name.ilike(f"%{client_name}%"))
+        filters.append(Proposal.client_name.ilike(f"%{client_name}%"))
     if lead_owner:
-        query = query.where(Proposal.lead_owner == lead_owner)
+        filters.append(Proposal.lead_owner == lead_owner)
     if due_before:
-        query = query.where(Proposal.due_date <= due_before)
+        filters.append(Proposal.due_date <= due_before)
     if search:
-        query = query.where(
+        filters.append(
             or_(
                 Proposal.title.ilike(f"%{search}%"),
                 Proposal.client_name.ilike(f"%{search}%"),
@@ -78,105 +106,144 @@ async def list_proposals(
             )
         )
     
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total = await db.scalar(count_query)
+    # Total count, run concurrently with the page
+    count_query = select(func.count(Proposal.id)).where(*filters)
     
     # Apply pagination and ordering
-    offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size).order_by(
-        Proposal.due_date.asc(),
-        Proposal.priority.desc()
-    )
-    
-    result = await db.execute(query)
-    proposals = result.scalars().all()
-    
-    return ProposalListResponse(
-        items=[ProposalResponse.model_validate(p.to_dict()) for p in proposals],
-        total=total,
-        page=page,
-        page_size=page_size,
-        pages=(total + page_size - 1) // page_size if total > 0 else 0
-    )
+    query = select(*PROPOSAL_LIST_COLUMNS).where(*filters).order_by(*keyset_order(PROPOSAL_SORT_KEYS))
+    if cursor:
+        query = query.where(
+            keyset_filter(PROPOSAL_SORT_KEYS, decode_cursor(cursor, PROPOSAL_CURSOR_PARSERS))
+        )
+    else:
+        query = query.offset((page - 1) * page_size)
+    query = query.limit(page_size)
+    
+    count_key = count_cache_key("proposals", {
+        "proposal_type": proposal_type, "status": status, "priority": priority,
+        "client_name": client_name, "lead_owner": lead_owner,
+        "due_before": due_before, "search": search
+    })
+    # Rows go out as plain dicts: the selected columns already match
+    # ProposalResponse, so building and re-serializing a model per row would
+    # only cost time. response_model still documents the shape.
+    total, items = await fetch_page(db, query, dict, count_query, count_key)
+    
+    next_cursor = None
+    if len(items) == page_size:
+        last = items[-1]
+        next_cursor = encode_cursor((
+            last["due_date"] or PROPOSAL_UNDATED,
+            last["priority"] or PROPOSAL_PRIORITY_UNSET,
+            last["id"]
+        ))
+    
+    return ORJSONResponse({
+        "items": items,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "pages": (total + page_size - 1) // page_size if total > 0 else 0,
+        "next_cursor": next_cursor
+    })
 
 
 @router.get("/dashboard")
-async def get_rfp_dashboard(db: AsyncSession = Depends(get_db)):
+@cached(key=DASHBOARD_CACHE_KEY, ttl=30)
+async def get_rfp_dashboard(fresh: bool = False, db: AsyncSession = Depends(get_db)):
     """
     Get RFP/RFI dashboard statistics.
     
     Returns counts by status, priority, and type, plus key metrics.
+    Counts and won value come from the mv_proposal_dashboard rollup, so
+    they lag writes by up to one materialized view refresh; the due-soon
+    count is read live. Cached for 30 seconds; pass ``fresh=true`` to
+    recompute.
     """
-    # Count by status
-    status_counts = {}
-    for status in ProposalStatus:
-        count = await db.scalar(
-            select(func.count()).select_from(Proposal).where(Proposal.status == status)
-        )
-        status_counts[status.value] = count or 0
-    
-    # Count by type
-    type_counts = {}
-    for ptype in ProposalType:
-        count = await db.scalar(
-            select(func.count()).select_from(Proposal).where(Proposal.proposal_type == ptype)
-        )
-        type_counts[ptype.value] = count or 0
-    
-    # Active proposals (not closed)
     active_statuses = [ProposalStatus.DRAFT, ProposalStatus.IN_PROGRESS, ProposalStatus.REVIEW]
-    active_count = await db.scalar(
-        select(func.count()).select_from(Proposal).where(
-            Proposal.status.in_(active_statuses)
-        )
-    )
-    
-    # Due this week
-    from datetime import timedelta
     week_from_now = datetime.utcnow() + timedelta(days=7)
+    
+    stats = proposal_dashboard_stats
+    rows = await db.execute(
+        select(stats.c.status, stats.c.proposal_type, stats.c.proposal_count, stats.c.deal_value)
+    )
+    # Depends on the current time, so it can't be precomputed; the partial
+    # active-proposal index keeps it small
     due_soon = await db.scalar(
-        select(func.count()).select_from(Proposal).where(
-            and_(
-                Proposal.due_date <= week_from_now,
-                Proposal.status.in_(active_statuses)
-            )
+        select(func.count()).where(
+            Proposal.status.in_(active_statuses),
+            Proposal.due_date <= week_from_now
         )
     )
     
+    status_counts = {status.value: 0 for status in ProposalStatus}
+    type_counts = {ptype.value: 0 for ptype in ProposalType}
+    active_count = 0
+    total_won_value = 0.0
+    for status, ptype, count, value in rows:
+        if status is not None:
+            status_counts[status.value] += count
+        type_counts[ptype.value] += count
+        # Active proposals (not closed)
+        if status in active_statuses:
+            active_count += count
+        # Total deal value (won proposals)
+        if status == ProposalStatus.WON:
+            total_won_value += value or 0
+    
     # Win rate
     won_count = status_counts.get("won", 0)
     lost_count = status_counts.get("lost", 0)
     total_decided = won_count + lost_count
     win_rate = (won_count / total_decided * 100) if total_decided > 0 else 0
     
-    # Total deal value (won proposals)
-    total_won_value = await db.scalar(
-        select(func.sum(Proposal.estimated_deal_value)).where(
-            Proposal.status == ProposalStatus.WON
-        )
-    )
-    
     return {
-        "active_proposals": active_count or 0,
+        "active_proposals": active_count,
         "due_this_week": due_soon or 0,
         "win_rate": round(win_rate, 1),
-        "total_won_value": float(total_won_value or 0),
+        "total_won_value": float(total_won_value),
         "by_status": status_counts,
         "by_type": type_counts
     }
 
 
 @router.get("/{proposal_id}", response_model=ProposalResponse)
-async def get_proposal(proposal_id: str, db: AsyncSession = Depends(get_db)):
-    """Get a specific proposal by ID."""
-    result = await db.execute(select(Proposal).where(Proposal.id == proposal_id))
+async def get_proposal(
+    proposal_id: str,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get a specific proposal by ID.
+    
+    Responses carry an ETag; clients that send it back in If-None-Match get
+    a 304 after a single-column lookup instead of the full record.
+    """
+    version = await db.execute(
+        select(Proposal.updated_at).where(Proposal.id == proposal_id)
+    )
+    row = version.first()
+    
+    if row is None:
+        raise HTTPException(status_code=404, detail="Proposal not found")
+    
+    etag = row_etag(row.updated_at)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    # Validation reads columns only; raiseload makes any relationship access
+    # fail loudly instead of issuing per-row lazy loads
+    result = await db.execute(
+        select(Proposal).where(Proposal.id == proposal_id).options(raiseload("*"))
+    )
     proposal = result.scalar_one_or_none()
     
     if not proposal:
         raise HTTPException(status_code=404, detail="Proposal not found")
     
-    return ProposalResponse.model_validate(proposal.to_dict())
+    response.headers["ETag"] = row_etag(proposal.updated_at)
+    return ProposalResponse.model_validate(proposal)
 
 
 @router.post("/", response_model=ProposalResponse, status_code=201)
@@ -186,9 +253,9 @@ async def create_proposal(
 ):
     """Create a new RFP/RFI proposal."""
     # Generate proposal number
-    count = await db.scalar(select(func.count()).select_from(Proposal))
+    next_id = await db.scalar(select(proposal_seq.next_value()))
     type_prefix = proposal_data.proposal_type.value.upper()
-    proposal_number = f"{type_prefix}-{datetime.utcnow().strftime('%Y%m')}-{(count or 0) + 1:04d}"
+    proposal_number = f"{type_prefix}-{datetime.utcnow():%Y%m}-{next_id:04d}"
     
     proposal = Proposal(
         **proposal_data.model_dump(),
@@ -196,9 +263,9 @@ async def create_proposal(
     )
     db.add(proposal)
     await db.commit()
-    await db.refresh(proposal)
+    await invalidate(DASHBOARD_CACHE_KEY)
     
-    return ProposalResponse.model_validate(proposal.to_dict())
+    return ProposalResponse.model_validate(proposal)
 
 
 @router.put("/{proposal_id}", response_model=ProposalResponse)
@@ -208,20 +275,26 @@ async def update_proposal(
     db: AsyncSession = Depends(get_db)
 ):
     """Update an existing proposal."""
-    result = await db.execute(select(Proposal).where(Proposal.id == proposal_id))
+    update_data = proposal_data.model_dump(exclude_unset=True)
+    if update_data:
+        statement = (
+            update(Proposal)
+            .where(Proposal.id == proposal_id)
+            .values(**update_data)
+            .returning(Proposal)
+        )
+    else:
+        statement = select(Proposal).where(Proposal.id == proposal_id)
+    result = await db.execute(statement)
     proposal = result.scalar_one_or_none()
     
     if not proposal:
         raise HTTPException(status_code=404, detail="Proposal not found")
     
-    update_data = proposal_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(proposal, field, value)
-    
     await db.commit()
-    await db.refresh(proposal)
+    await invalidate(DASHBOARD_CACHE_KEY)
     
-    return ProposalResponse.model_validate(proposal.to_dict())
+    return ProposalResponse.model_validate(proposal)
 
 
 @router.post("/{proposal_id}/submit")
@@ -230,15 +303,18 @@ async def submit_proposal(
     db: AsyncSession = Depends(get_db)
 ):
     """Submit a proposal."""
-    result = await db.execute(select(Proposal).where(Proposal.id == proposal_id))
-    proposal = result.scalar_one_or_none()
+    result = await db.execute(
+        update(Proposal)
+        .where(Proposal.id == proposal_id)
+        .values(status=ProposalStatus.SUBMITTED, submitted_date=datetime.utcnow())
+        .returning(Proposal.id)
+    )
     
-    if not proposal:
+    if result.first() is None:
         raise HTTPException(status_code=404, detail="Proposal not found")
     
-    proposal.status = ProposalStatus.SUBMITTED
-    proposal.submitted_date = datetime.utcnow()
     await db.commit()
+    await invalidate(DASHBOARD_CACHE_KEY)
     
     return {"message": "Proposal submitted successfully", "proposal_id": proposal_id}
 
@@ -252,24 +328,30 @@ async def record_outcome(
     db: AsyncSession = Depends(get_db)
 ):
     """Record proposal outcome (won/lost)."""
-    result = await db.execute(select(Proposal).where(Proposal.id == proposal_id))
-    proposal = result.scalar_one_or_none()
-    
-    if not proposal:
-        raise HTTPException(status_code=404, detail="Proposal not found")
-    
     if outcome == "won":
-        proposal.status = ProposalStatus.WON
+        status = ProposalStatus.WON
     elif outcome == "lost":
-        proposal.status = ProposalStatus.LOST
+        status = ProposalStatus.LOST
     else:
         raise HTTPException(status_code=400, detail="Invalid outcome. Use 'won' or 'lost'")
     
-    proposal.decision_date = datetime.utcnow()
-    proposal.outcome_reason = reason
-    proposal.lessons_learned = lessons_learned
+    result = await db.execute(
+        update(Proposal)
+        .where(Proposal.id == proposal_id)
+        .values(
+            status=status,
+            decision_date=datetime.utcnow(),
+            outcome_reason=reason,
+            lessons_learned=lessons_learned
+        )
+        .returning(Proposal.id)
+    )
+    
+    if result.first() is None:
+        raise HTTPException(status_code=404, detail="Proposal not found")
     
     await db.commit()
+    await invalidate(DASHBOARD_CACHE_KEY)
     
     return {"message": f"Proposal marked as {outcome}", "proposal_id": proposal_id}
 
@@ -285,6 +367,7 @@ async def delete_proposal(proposal_id: str, db: AsyncSession = Depends(get_db)):
     
     proposal.status = ProposalStatus.WITHDRAWN
     await db.commit()
+    await invalidate(DASHBOARD_CACHE_KEY)
 
 
 # ============================================
@@ -295,12 +378,11 @@ async def delete_proposal(proposal_id: str, db: AsyncSession = Depends(get_db)):
 async def list_sections(proposal_id: str, db: AsyncSession = Depends(get_db)):
     """List all sections for a proposal."""
     result = await db.execute(
-        select(ProposalSection)
+        select(*SECTION_LIST_COLUMNS)
         .where(ProposalSection.proposal_id == proposal_id)
         .order_by(ProposalSection.section_number)
     )
-    sections = result.scalars().all()
-    return [SectionResponse.model_validate(s.to_dict()) for s in sections]
+    return [SectionResponse.model_validate(row) for row in result.mappings()]
 
 
 @router.post("/{proposal_id}/sections", response_model=SectionResponse, status_code=201)
@@ -321,9 +403,38 @@ async def create_section(
     )
     db.add(section)
     await db.commit()
-    await db.refresh(section)
     
-    return SectionResponse.model_validate(section.to_dict())
+    return SectionResponse.model_validate(section)
+
+
+@router.post("/{proposal_id}/sections/bulk", response_model=List[SectionResponse], status_code=201)
+async def create_sections_bulk(
+    proposal_id: str,
+    sections_data: List[SectionCreate],
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Add many sections to a proposal at once.
+    
+    All rows go in a single INSERT ... RETURNING and one commit, instead of
+    a round-trip and commit per section.
+    """
+    # Verify proposal exists
+    exists = await db.scalar(select(Proposal.id).where(Proposal.id == proposal_id))
+    if exists is None:
+        raise HTTPException(status_code=404, detail="Proposal not found")
+    
+    if not sections_data:
+        return []
+    
+    result = await db.execute(
+        insert(ProposalSection).returning(ProposalSection, sort_by_parameter_order=True),
+        [{"proposal_id": proposal_id, **data.model_dump()} for data in sections_data]
+    )
+    sections = result.scalars().all()
+    await db.commit()
+    
+    return [SectionResponse.model_validate(s) for s in sections]
 
 
 @router.put("/{proposal_id}/sections/{section_id}", response_model=SectionResponse)
@@ -334,27 +445,29 @@ async def update_section(
     db: AsyncSession = Depends(get_db)
 ):
     """Update a proposal section (add/edit response)."""
-    result = await db.execute(
-        select(ProposalSection).where(
-            and_(
-                ProposalSection.id == section_id,
-                ProposalSection.proposal_id == proposal_id
-            )
-        )
+    match = and_(
+        ProposalSection.id == section_id,
+        ProposalSection.proposal_id == proposal_id
     )
+    update_data = section_data.model_dump(exclude_unset=True)
+    if update_data:
+        statement = (
+            update(ProposalSection)
+            .where(match)
+            .values(**update_data)
+            .returning(ProposalSection)
+        )
+    else:
+        statement = select(ProposalSection).where(match)
+    result = await db.execute(statement)
     section = result.scalar_one_or_none()
     
     if not section:
         raise HTTPException(status_code=404, detail="Section not found")
     
-    update_data = section_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(section, field, value)
-    
     await db.commit()
-    await db.refresh(section)
     
-    return SectionResponse.model_validate(section.to_dict())
+    return SectionResponse.model_validate(section)
 
 
 # ============================================
@@ -367,7 +480,7 @@ async def list_content(
     solution_area: Optional[str] = None,
     search: Optional[str] = None,
     page: int = Query(1, ge=1),
-    page_size: int = Query(20, ge=1, le=100),
+    page_size: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -375,35 +488,41 @@ async def list_content(
     
     Provides reusable content for RFP/RFI responses.
     """
-    query = select(ContentLibrary).where(ContentLibrary.is_current == 1)
-    
+    filters = [ContentLibrary.is_current == 1]
     if category:
-        query = query.where(ContentLibrary.category == category)
+        filters.append(ContentLibrary.category == category)
     if solution_area:
-        query = query.where(ContentLibrary.solution_area == solution_area)
+        filters.append(ContentLibrary.solution_area == solution_area)
     if search:
-        query = query.where(
+        filters.append(
             or_(
                 ContentLibrary.title.ilike(f"%{search}%"),
                 ContentLibrary.content.ilike(f"%{search}%")
             )
         )
     
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total = await db.scalar(count_query)
+    # Total count, run concurrently with the page
+    count_query = select(func.count(ContentLibrary.id)).where(*filters)
     
     # Apply pagination
     offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size).order_by(
+    query = select(*CONTENT_LIST_COLUMNS).where(*filters).offset(offset).limit(page_size).order_by(
         ContentLibrary.usage_count.desc()
     )
     
-    result = await db.execute(query)
-    items = result.scalars().all()
+    count_key = count_cache_key("content", {
+        "category": category, "solution_area": solution_area, "search": search
+    })
+    total, items = await fetch_page(
+        db,
+        query,
+        ContentResponse.model_validate,
+        count_query,
+        count_key
+    )
     
     return ContentListResponse(
-        items=[ContentResponse.model_validate(c.to_dict()) for c in items],
+        items=items,
         total=total,
         page=page,
         page_size=page_size,
@@ -420,28 +539,31 @@ async def create_content(
     content = ContentLibrary(**content_data.model_dump())
     db.add(content)
     await db.commit()
-    await db.refresh(content)
     
-    return ContentResponse.model_validate(content.to_dict())
+    return ContentResponse.model_validate(content)
 
 
 @router.get("/library/content/{content_id}", response_model=ContentResponse)
 async def get_content(content_id: str, db: AsyncSession = Depends(get_db)):
     """Get a specific content library item."""
+    # Fetch and increment usage count in one atomic statement
     result = await db.execute(
-        select(ContentLibrary).where(ContentLibrary.id == content_id)
+        update(ContentLibrary)
+        .where(ContentLibrary.id == content_id)
+        .values(
+            usage_count=ContentLibrary.usage_count + 1,
+            last_used_date=datetime.utcnow()
+        )
+        .returning(ContentLibrary)
     )
     content = result.scalar_one_or_none()
     
     if not content:
         raise HTTPException(status_code=404, detail="Content not found")
     
-    # Increment usage count
-    content.usage_count += 1
-    content.last_used_date = datetime.utcnow()
     await db.commit()
     
-    return ContentResponse.model_validate(content.to_dict())
+    return ContentResponse.model_validate(content)
 
 
 @router.put("/library/content/{content_id}", response_model=ContentResponse)
@@ -451,26 +573,23 @@ async def update_content(
     db: AsyncSession = Depends(get_db)
 ):
     """Update a content library item."""
+    update_data = content_data.model_dump(exclude_unset=True)
+    
+    # Bump the minor version in the same statement
     result = await db.execute(
-        select(ContentLibrary).where(ContentLibrary.id == content_id)
+        update(ContentLibrary)
+        .where(ContentLibrary.id == content_id)
+        .values(**update_data, minor_version=ContentLibrary.minor_version + 1)
+        .returning(ContentLibrary)
     )
     content = result.scalar_one_or_none()
     
     if not content:
         raise HTTPException(status_code=404, detail="Content not found")
     
-    update_data = content_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(content, field, value)
-    
-    # Update version
-    major, minor = content.version.split(".")
-    content.version = f"{major}.{int(minor) + 1}"
-    
     await db.commit()
-    await db.refresh(content)
     
-    return ContentResponse.model_validate(content.to_dict())
+    return ContentResponse.model_validate(content)
 
 
 @router.get("/analytics/win-loss")
@@ -483,53 +602,68 @@ async def get_win_loss_analytics(
     
     Analyzes proposal outcomes for insights.
     """
-    from datetime import timedelta
     start_date = datetime.utcnow() - timedelta(days=months * 30)
     
-    # Win/loss by solution area
-    result = await db.execute(
-        select(Proposal).where(
-            and_(
-                Proposal.decision_date >= start_date,
-                Proposal.status.in_([ProposalStatus.WON, ProposalStatus.LOST])
-            )
+    decided = and_(
+        Proposal.decision_date >= start_date,
+        Proposal.status.in_([ProposalStatus.WON, ProposalStatus.LOST])
+    )
+    
+    # Win/loss and deal value by industry, aggregated in the database. The
+    # defaults are inlined so the GROUP BY expression matches the select
+    # list exactly instead of differing by bind parameter.
+    industry = func.coalesce(
+        func.nullif(Proposal.client_industry, literal_column("''")),
+        literal_column("'Unknown'")
+    )
+    industry_rows = await db.execute(
+        select(
+            industry,
+            Proposal.status,
+            func.count(),
+            func.sum(Proposal.estimated_deal_value)
+        ).where(decided).group_by(industry, Proposal.status)
+    )
+    
+    by_client_industry = {}
+    outcome_counts = {ProposalStatus.WON: 0, ProposalStatus.LOST: 0}
+    outcome_values = {ProposalStatus.WON: 0, ProposalStatus.LOST: 0}
+    for name, status, count, value in industry_rows:
+        by_client_industry.setdefault(name, {"won": 0, "lost": 0})[status.value] = count
+        outcome_counts[status] += count
+        outcome_values[status] += value or 0
+    
+    # Win/loss by solution area, expanding the JSON array in the database.
+    # init-db.sql creates the column as jsonb and create_all as json; the
+    # cast lets the jsonb functions serve both.
+    solution_areas = cast(Proposal.solution_areas, JSONB)
+    areas = (
+        select(
+            func.jsonb_array_elements_text(solution_areas).label("area"),
+            Proposal.status
         )
+        .where(decided, func.jsonb_typeof(solution_areas) == "array")
+        .subquery()
+    )
+    area_rows = await db.execute(
+        select(areas.c.area, areas.c.status, func.count())
+        .group_by(areas.c.area, areas.c.status)
     )
-    proposals = result.scalars().all()
     
     by_solution_area = {}
-    by_client_industry = {}
-    total_won_value = 0
-    total_lost_value = 0
-    
-    for p in proposals:
-        # By solution area
-        for area in (p.solution_areas or []):
-            if area not in by_solution_area:
-                by_solution_area[area] = {"won": 0, "lost": 0}
-            if p.status == ProposalStatus.WON:
-                by_solution_area[area]["won"] += 1
-            else:
-                by_solution_area[area]["lost"] += 1
-        
-        # By industry
-        industry = p.client_industry or "Unknown"
-        if industry not in by_client_industry:
-            by_client_industry[industry] = {"won": 0, "lost": 0}
-        if p.status == ProposalStatus.WON:
-            by_client_industry[industry]["won"] += 1
-            total_won_value += p.estimated_deal_value or 0
-        else:
-            by_client_industry[industry]["lost"] += 1
-            total_lost_value += p.estimated_deal_value or 0
+    for area, status, count in area_rows:
+        by_solution_area.setdefault(area, {"won": 0, "lost": 0})[status.value] = count
+    
+    won = outcome_counts[ProposalStatus.WON]
+    lost = outcome_counts[ProposalStatus.LOST]
     
     return {
         "period_months": months,
-        "total_proposals": len(proposals),
-        "won": sum(1 for p in proposals if p.status == ProposalStatus.WON),
-        "lost": sum(1 for p in proposals if p.status == ProposalStatus.LOST),
-        "total_won_value": total_won_value,
-        "total_lost_value": total_lost_value,
+        "total_proposals": won + lost,
+        "won": won,
+        "lost": lost,
+        "total_won_value": outcome_values[ProposalStatus.WON],
+        "total_lost_value": outcome_values[ProposalStatus.LOST],
         "by_solution_area": by_solution_area,
         "by_client_industry": by_client_industry
     }
@@ -4,12 +4,40 @@ Search API endpoints using OpenSearch for full-text search.
 
 from typing import List, Optional
 from fastapi import APIRouter, Depends, Query
-from app.services.opensearch_service import OpenSearchService
+from app.core.cache import cached
+from app.core.config import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.services.opensearch_service import (
+    OpenSearchService, get_opensearch_service, SEARCH_CACHE_GENERATION
+)
 
 
 router = APIRouter()
 
 
+# Popular queries and autocomplete prefixes repeat heavily, so their results
+# are cached briefly per argument set; index writes invalidate them. Search
+# failures raise out of these functions, so they are never cached. Both are
+# called with keyword arguments only.
+@cached(
+    key="search:global",
+    ttl=300,
+    vary=("query", "from_", "size"),
+    generation=SEARCH_CACHE_GENERATION
+)
+async def _cached_global_search(opensearch_service: OpenSearchService, query: str, from_: int, size: int):
+    return await opensearch_service.global_search(query=query, from_=from_, size=size)
+
+
+@cached(
+    key="search:suggest",
+    ttl=15,
+    vary=("query", "limit"),
+    generation=SEARCH_CACHE_GENERATION
+)
+async def _cached_suggestions(opensearch_service: OpenSearchService, query: str, limit: int):
+    return await opensearch_service.get_suggestions(query, limit)
+
+
 @router.get("/entities")
 async def search_entities(
     q: str = Query(..., min_length=2, description="Search query"),
@@ -17,15 +45,14 @@ async def search_entities(
     risk_min: Optional[float] = Query(None, ge=0, le=1),
     risk_max: Optional[float] = Query(None, ge=0, le=1),
     page: int = Query(1, ge=1),
-    page_size: int = Query(20, ge=1, le=100)
+    page_size: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    opensearch_service: OpenSearchService = Depends(get_opensearch_service)
 ):
     """
     Full-text search for entities using OpenSearch.
     
     Supports filtering by entity type and risk score range.
     """
-    opensearch_service = OpenSearchService()
-    
     # Build filters
     filters = {}
     if entity_types:
@@ -59,13 +86,12 @@ async def search_transactions(
     amount_max: Optional[float] = Query(None, ge=0),
     currency: Optional[str] = Query(None),
     page: int = Query(1, ge=1),
-    page_size: int = Query(20, ge=1, le=100)
+    page_size: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    opensearch_service: OpenSearchService = Depends(get_opensearch_service)
 ):
     """
     Full-text search for transactions.
     """
-    opensearch_service = OpenSearchService()
-    
     filters = {}
     if amount_min is not None or amount_max is not None:
         filters["amount"] = {
@@ -97,13 +123,12 @@ async def search_alerts(
     severity: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
     page: int = Query(1, ge=1),
-    page_size: int = Query(20, ge=1, le=100)
+    page_size: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    opensearch_service: OpenSearchService = Depends(get_opensearch_service)
 ):
     """
     Full-text search for alerts.
     """
-    opensearch_service = OpenSearchService()
-    
     filters = {}
     if severity:
         filters["severity"] = severity.lower()
@@ -130,17 +155,17 @@ async def search_alerts(
 async def global_search(
     q: str = Query(..., min_length=2),
     page: int = Query(1, ge=1),
-    page_size: int = Query(10, ge=1, le=50)
+    page_size: int = Query(10, ge=1, le=50),
+    opensearch_service: OpenSearchService = Depends(get_opensearch_service)
 ):
     """
     Search across all document types (entities, transactions, alerts, cases).
     
     Returns aggregated results from all indices.
     """
-    opensearch_service = OpenSearchService()
-    
     try:
-        results = await opensearch_service.global_search(
+        results = await _cached_global_search(
+            opensearch_service=opensearch_service,
             query=q,
             from_=(page - 1) * page_size,
             size=page_size
@@ -159,15 +184,18 @@ async def global_search(
 @router.get("/suggest")
 async def search_suggestions(
     q: str = Query(..., min_length=1),
-    limit: int = Query(10, ge=1, le=50)
+    limit: int = Query(10, ge=1, le=50),
+    opensearch_service: OpenSearchService = Depends(get_opensearch_service)
 ):
     """
     Get search suggestions for autocomplete functionality.
     """
-    opensearch_service = OpenSearchService()
-    
     try:
-        suggestions = await opensearch_service.get_suggestions(q, limit)
+        suggestions = await _cached_suggestions(
+            opensearch_service=opensearch_service,
+            query=q,
+            limit=limit
+        )
         return {"suggestions": suggestions}
     except Exception as e:
         return {
@@ -179,29 +207,20 @@ async def search_suggestions(
 @router.post("/screening")
 async def sanctions_screening(
     names: List[str],
-    threshold: float = Query(0.8, ge=0.5, le=1.0)
+    threshold: float = Query(0.8, ge=0.5, le=1.0),
+    opensearch_service: OpenSearchService = Depends(get_opensearch_service)
 ):
     """
     Screen a list of names against sanctions and watchlists.
     
     Returns potential matches with confidence scores.
     """
-    opensearch_service = OpenSearchService()
-    
-    results = []
-    for name in names:
-        try:
-            matches = await opensearch_service.screen_name(name, threshold)
-            results.append({
-                "input": name,
-                "matches": matches
-            })
-        except Exception as e:
-            results.append({
-                "input": name,
-                "matches": [],
-                "error": str(e)
-            })
+    try:
+        results = await opensearch_service.screen_names_bulk(names, threshold)
+    except Exception as e:
+        results = [
+            {"input": name, "matches": [], "error": str(e)}
+            for name in names
+        ]
     
     return {"screening_results": results}
-
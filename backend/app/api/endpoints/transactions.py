@@ -4,10 +4,15 @@ Transaction Monitoring API endpoints.
 
 from typing import List, Optional
 from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends, HTTPException, Query
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
-from app.core.database import get_db
+from sqlalchemy import select, func, union
+from app.core.database import get_db, fetch_page, AsyncSessionLocal
+from app.core.cache import cached, bump_generation
+from app.core.pagination import encode_cursor, decode_cursor, keyset_filter, keyset_order
+from app.core.config import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from app.models.transaction import Transaction, TransactionType
 from app.schemas.transaction import (
     TransactionCreate, 
@@ -19,9 +24,34 @@ from app.schemas.transaction import (
 
 router = APIRouter()
 
+# Stats are polled by the dashboard; cached entries are keyed by this scope's
+# generation, which transaction writes bump
+STATS_CACHE_TTL = 30
+TRANSACTION_CACHE_GENERATION = "transactions"
 
-@router.get("/", response_model=TransactionListResponse)
-async def list_transactions(
+# Sort keys for the transaction list as (column, descending); id breaks ties
+# so that keyset cursors are unambiguous.
+TRANSACTION_SORT_KEYS = (
+    (Transaction.transaction_date, True),
+    (Transaction.id, True),
+)
+TRANSACTION_CURSOR_PARSERS = (datetime.fromisoformat, str)
+
+# Exports stream in batches of EXPORT_BATCH_ROWS fetched from the cursor
+EXPORT_MAX_ROWS = 1_000_000
+EXPORT_BATCH_ROWS = 1000
+
+# List views read only the columns TransactionResponse exposes, skipping ORM
+# hydration, and label each with its field name so rows serialize as is;
+# fields validated under an alias read the attribute it names.
+TRANSACTION_LIST_COLUMNS = tuple(
+    getattr(Transaction, field.validation_alias or name).label(name)
+    for name, field in TransactionResponse.model_fields.items()
+)
+TRANSACTION_LIST_FIELDS = tuple(TransactionResponse.model_fields)
+
+
+def _transaction_filters(
     transaction_type: Optional[TransactionType] = None,
     min_amount: Optional[float] = None,
     max_amount: Optional[float] = None,
@@ -31,109 +61,152 @@ async def list_transactions(
     is_flagged: Optional[bool] = None,
     risk_score_min: Optional[float] = None,
     date_from: Optional[datetime] = None,
-    date_to: Optional[datetime] = None,
-    page: int = Query(1, ge=1),
-    page_size: int = Query(20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db)
-):
-    """
-    List transactions with comprehensive filtering.
-    
-    Supports filtering by type, amount range, currency, countries,
-    flagged status, risk score, and date range.
-    """
-    query = select(Transaction)
-    
-    # Apply filters
+    date_to: Optional[datetime] = None
+) -> list:
+    """Query-parameter dependency turning the transaction filters into WHERE clauses."""
+    filters = []
     if transaction_type:
-        query = query.where(Transaction.transaction_type == transaction_type)
+        filters.append(Transaction.transaction_type == transaction_type)
     if min_amount is not None:
-        query = query.where(Transaction.amount >= min_amount)
+        filters.append(Transaction.amount >= min_amount)
     if max_amount is not None:
-        query = query.where(Transaction.amount <= max_amount)
+        filters.append(Transaction.amount <= max_amount)
     if currency:
-        query = query.where(Transaction.currency == currency.upper())
+        filters.append(Transaction.currency == currency.upper())
     if sender_country:
-        query = query.where(Transaction.sender_country == sender_country.upper())
+        filters.append(Transaction.sender_country == sender_country.upper())
     if receiver_country:
-        query = query.where(Transaction.receiver_country == receiver_country.upper())
+        filters.append(Transaction.receiver_country == receiver_country.upper())
     if is_flagged is not None:
-        query = query.where(Transaction.is_flagged == (1 if is_flagged else 0))
+        filters.append(Transaction.is_flagged.is_(is_flagged))
     if risk_score_min is not None:
-        query = query.where(Transaction.risk_score >= risk_score_min)
+        filters.append(Transaction.risk_score >= risk_score_min)
     if date_from:
-        query = query.where(Transaction.transaction_date >= date_from)
+        filters.append(Transaction.transaction_date >= date_from)
     if date_to:
-        query = query.where(Transaction.transaction_date <= date_to)
+        filters.append(Transaction.transaction_date <= date_to)
+    return filters
+
+
+@router.get("/", response_model=TransactionListResponse)
+async def list_transactions(
+    filters: list = Depends(_transaction_filters),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    List transactions with comprehensive filtering.
     
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total = await db.scalar(count_query)
+    Supports filtering by type, amount range, currency, countries,
+    flagged status, risk score, and date range. Pass the returned
+    ``next_cursor`` as ``cursor`` for constant-time deep paging.
+    """
+    query = select(*TRANSACTION_LIST_COLUMNS).where(*filters)
+    count_query = select(func.count(Transaction.id)).where(*filters)
+    ordered = query.order_by(*keyset_order(TRANSACTION_SORT_KEYS))
     
-    # Apply pagination
-    offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size).order_by(Transaction.transaction_date.desc())
+    if cursor:
+        # Seek past the previous page instead of skipping rows; the window
+        # count would only see the rows after the cursor, so the total comes
+        # from a concurrent COUNT instead
+        page_query = ordered.where(
+            keyset_filter(TRANSACTION_SORT_KEYS, decode_cursor(cursor, TRANSACTION_CURSOR_PARSERS))
+        ).limit(page_size)
+        total, items = await fetch_page(db, page_query, dict, count_query)
+    else:
+        # Paginate, reading the total from a window count over the same scan
+        offset = (page - 1) * page_size
+        paged = ordered.add_columns(func.count().over().label("total_count"))
+        result = await db.execute(paged.offset(offset).limit(page_size))
+        rows = result.all()
+        
+        if rows:
+            total = rows[0].total_count
+        elif offset:
+            # Past the last page there is no row to carry the count
+            total = await db.scalar(count_query)
+        else:
+            total = 0
+        # zip() stops at the response fields, leaving out total_count
+        items = [dict(zip(TRANSACTION_LIST_FIELDS, row)) for row in rows]
     
-    result = await db.execute(query)
-    transactions = result.scalars().all()
+    next_cursor = None
+    if len(items) == page_size:
+        last = items[-1]
+        next_cursor = encode_cursor((last["transaction_date"], last["id"]))
     
-    return TransactionListResponse(
-        items=[TransactionResponse.model_validate(t.to_dict()) for t in transactions],
-        total=total,
-        page=page,
-        page_size=page_size,
-        pages=(total + page_size - 1) // page_size if total > 0 else 0
-    )
+    # Rows go out as plain dicts: the selected columns already match
+    # TransactionResponse, so building and re-serializing a model per row
+    # would only cost time. response_model still documents the shape.
+    return ORJSONResponse({
+        "items": items,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "pages": (total + page_size - 1) // page_size if total > 0 else 0,
+        "next_cursor": next_cursor
+    })
 
 
-@router.get("/stats", response_model=TransactionStats)
-async def get_transaction_stats(
-    days: int = Query(30, ge=1, le=365),
-    db: AsyncSession = Depends(get_db)
+@router.get("/export")
+async def export_transactions(
+    filters: list = Depends(_transaction_filters),
+    limit: int = Query(10000, ge=1, le=EXPORT_MAX_ROWS)
 ):
     """
-    Get transaction statistics for the specified period.
+    Export matching transactions as NDJSON, one TransactionResponse per line.
     
-    Returns aggregated metrics including total volume, count,
-    flagged transactions, and risk distribution.
+    Accepts the same filters as the list endpoint. Rows are read through a
+    server-side cursor and written as they arrive, so memory stays flat
+    regardless of ``limit``.
     """
-    start_date = datetime.utcnow() - timedelta(days=days)
-    
-    # Total transactions
-    total_query = select(func.count()).select_from(Transaction).where(
-        Transaction.transaction_date >= start_date
+    query = (
+        select(*TRANSACTION_LIST_COLUMNS)
+        .where(*filters)
+        .order_by(Transaction.transaction_date.desc())
+        .limit(limit)
+        .execution_options(yield_per=EXPORT_BATCH_ROWS)
     )
-    total_count = await db.scalar(total_query) or 0
     
-    # Total volume
-    volume_query = select(func.sum(Transaction.amount)).where(
-        Transaction.transaction_date >= start_date
-    )
-    total_volume = await db.scalar(volume_query) or 0
+    async def lines():
+        # The request session is closed before a streamed body is sent, so
+        # the export holds its own for as long as it runs
+        async with AsyncSessionLocal() as session:
+            result = await session.stream(query)
+            async for row in result.mappings():
+                yield orjson.dumps(dict(row)) + b"\n"
     
-    # Flagged transactions
-    flagged_query = select(func.count()).select_from(Transaction).where(
-        and_(
-            Transaction.transaction_date >= start_date,
-            Transaction.is_flagged == 1
-        )
-    )
-    flagged_count = await db.scalar(flagged_query) or 0
-    
-    # Average risk score
-    avg_risk_query = select(func.avg(Transaction.risk_score)).where(
-        Transaction.transaction_date >= start_date
-    )
-    avg_risk = await db.scalar(avg_risk_query) or 0
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@cached(
+    key="transactions:stats",
+    ttl=STATS_CACHE_TTL,
+    vary=("days",),
+    generation=TRANSACTION_CACHE_GENERATION
+)
+async def _transaction_stats(db: AsyncSession, days: int):
+    """Aggregate the stats for the last ``days`` days; called with keyword arguments."""
+    start_date = datetime.utcnow() - timedelta(days=days)
     
-    # High risk transactions (risk > 0.7)
-    high_risk_query = select(func.count()).select_from(Transaction).where(
-        and_(
-            Transaction.transaction_date >= start_date,
-            Transaction.risk_score >= 0.7
-        )
+    # All five aggregates in a single pass over the window
+    totals = await db.execute(
+        select(
+            func.count(),
+            func.sum(Transaction.amount),
+            func.count().filter(Transaction.is_flagged),
+            func.avg(Transaction.risk_score),
+            func.count().filter(Transaction.risk_score >= 0.7)
+        ).where(Transaction.transaction_date >= start_date)
     )
-    high_risk_count = await db.scalar(high_risk_query) or 0
+    total_count, total_volume, flagged_count, avg_risk, high_risk_count = totals.one()
+    total_count = total_count or 0
+    total_volume = total_volume or 0
+    flagged_count = flagged_count or 0
+    avg_risk = avg_risk or 0
+    high_risk_count = high_risk_count or 0
     
     return TransactionStats(
         period_days=days,
@@ -143,7 +216,26 @@ async def get_transaction_stats(
         high_risk_transactions=high_risk_count,
         average_risk_score=float(avg_risk),
         flagged_rate=flagged_count / total_count if total_count > 0 else 0
-    )
+    ).model_dump()
+
+
+
+@router.get("/stats", response_model=TransactionStats)
+async def get_transaction_stats(
+    response: Response,
+    days: int = Query(30, ge=1, le=365),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get transaction statistics for the specified period.
+    
+    Returns aggregated metrics including total volume, count,
+    flagged transactions, and risk distribution. Results are cached
+    per period for 30 seconds and dropped when a transaction is created
+    or flagged; clients may reuse them for as long.
+    """
+    response.headers["Cache-Control"] = f"private, max-age={STATS_CACHE_TTL}"
+    return await _transaction_stats(db=db, days=days)
 
 
 @router.get("/{transaction_id}", response_model=TransactionResponse)
@@ -155,7 +247,7 @@ async def get_transaction(transaction_id: str, db: AsyncSession = Depends(get_db
     if not transaction:
         raise HTTPException(status_code=404, detail="Transaction not found")
     
-    return TransactionResponse.model_validate(transaction.to_dict())
+    return TransactionResponse.model_validate(transaction)
 
 
 @router.post("/", response_model=TransactionResponse, status_code=201)
@@ -164,12 +256,15 @@ async def create_transaction(
     db: AsyncSession = Depends(get_db)
 ):
     """Create a new transaction record."""
-    transaction = Transaction(**transaction_data.model_dump())
+    data = transaction_data.model_dump()
+    data["metadata_"] = data.pop("metadata")
+    transaction = Transaction(**data)
     db.add(transaction)
     await db.commit()
+    await bump_generation(TRANSACTION_CACHE_GENERATION)
     await db.refresh(transaction)
     
-    return TransactionResponse.model_validate(transaction.to_dict())
+    return TransactionResponse.model_validate(transaction)
 
 
 @router.post("/{transaction_id}/flag")
@@ -185,16 +280,44 @@ async def flag_transaction(
     if not transaction:
         raise HTTPException(status_code=404, detail="Transaction not found")
     
-    transaction.is_flagged = 1
+    transaction.is_flagged = True
     indicators = transaction.risk_indicators or []
     indicators.append({"type": "manual_flag", "reason": reason, "timestamp": datetime.utcnow().isoformat()})
     transaction.risk_indicators = indicators
     
     await db.commit()
+    await bump_generation(TRANSACTION_CACHE_GENERATION)
     
     return {"message": "Transaction flagged successfully", "transaction_id": transaction_id}
 
 
+def _related_transactions_query(transaction_id: str, parties: List[str], limit: int):
+    """Newest ``limit`` other transactions with any of ``parties`` on either side."""
+    # One IN-lookup per party column, each able to use its own index and
+    # stop after the newest ``limit`` rows, instead of a four-way OR. Each
+    # branch is a subquery so its ORDER BY/LIMIT stays inside the UNION.
+    def newest_ids(column):
+        newest = (
+            select(Transaction.id)
+            .where(column.in_(parties), Transaction.id != transaction_id)
+            .order_by(Transaction.transaction_date.desc())
+            .limit(limit)
+            .subquery()
+        )
+        return select(newest.c.id)
+    
+    related_ids = union(
+        newest_ids(Transaction.sender_entity_id),
+        newest_ids(Transaction.receiver_entity_id)
+    ).subquery()
+    return (
+        select(Transaction)
+        .where(Transaction.id.in_(select(related_ids.c.id)))
+        .order_by(Transaction.transaction_date.desc())
+        .limit(limit)
+    )
+
+
 @router.get("/{transaction_id}/related")
 async def get_related_transactions(
     transaction_id: str,
@@ -213,24 +336,18 @@ async def get_related_transactions(
     if not transaction:
         raise HTTPException(status_code=404, detail="Transaction not found")
     
-    # Find related by same sender or receiver
-    related_query = select(Transaction).where(
-        and_(
-            Transaction.id != transaction_id,
-            (
-                (Transaction.sender_entity_id == transaction.sender_entity_id) |
-                (Transaction.receiver_entity_id == transaction.receiver_entity_id) |
-                (Transaction.sender_entity_id == transaction.receiver_entity_id) |
-                (Transaction.receiver_entity_id == transaction.sender_entity_id)
-            )
-        )
-    ).limit(limit).order_by(Transaction.transaction_date.desc())
-    
-    result = await db.execute(related_query)
-    related = result.scalars().all()
+    # Related transactions involve either party on either side
+    parties = [
+        party for party in {transaction.sender_entity_id, transaction.receiver_entity_id}
+        if party is not None
+    ]
+    related = []
+    if parties:
+        result = await db.execute(_related_transactions_query(transaction_id, parties, limit))
+        related = result.scalars().all()
     
     return {
         "transaction_id": transaction_id,
-        "related_transactions": [TransactionResponse.model_validate(t.to_dict()) for t in related]
+        "related_transactions": [TransactionResponse.model_validate(t) for t in related]
     }
 
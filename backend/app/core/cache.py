@@ -0,0 +1,160 @@
+"""
+Redis-backed response caching for read-heavy aggregate endpoints, plus
+ETag helpers for conditional GETs on detail endpoints.
+"""
+
+import asyncio
+import hashlib
+from datetime import datetime
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from fastapi import Request
+import orjson
+from loguru import logger
+from redis import asyncio as redis
+from app.core.config import settings
+
+
+# Connections are opened lazily on first use
+redis_client = redis.from_url(settings.REDIS_URL)
+
+# List totals are cached briefly per filter set; small totals are cheap to
+# count and more visibly stale, so only counts above the threshold are kept.
+COUNT_CACHE_TTL = 30
+COUNT_CACHE_MIN_ROWS = 1000
+
+# In-flight fills per cached key, so concurrent misses in this process share
+# one computation instead of stampeding the database
+_inflight: Dict[str, asyncio.Future] = {}
+
+
+async def get_cached(key: str) -> Optional[Any]:
+    """Return the cached value for ``key``, or None on a miss or Redis error."""
+    try:
+        hit = await redis_client.get(key)
+        if hit is not None:
+            return orjson.loads(hit)
+    except Exception as e:
+        logger.warning(f"Cache read failed for {key}: {e}")
+    return None
+
+
+async def set_cached(key: str, value: Any, ttl: int) -> None:
+    """Store a JSON-serializable value under ``key`` for ``ttl`` seconds."""
+    try:
+        await redis_client.set(key, orjson.dumps(value), ex=ttl)
+    except Exception as e:
+        logger.warning(f"Cache write failed for {key}: {e}")
+
+
+def _digest(params: Dict[str, Any]) -> str:
+    """Stable short hash of a parameter mapping."""
+    return hashlib.blake2b(
+        orjson.dumps(params, option=orjson.OPT_SORT_KEYS), digest_size=16
+    ).hexdigest()
+
+
+def count_cache_key(scope: str, filters: Dict[str, Any]) -> str:
+    """Cache key for a list total, derived from the list's filter values."""
+    return f"{scope}:count:{_digest(filters)}"
+
+
+async def current_generation(scope: str) -> int:
+    """Current generation of ``scope``; 0 if never bumped or Redis is down."""
+    try:
+        value = await redis_client.get(f"{scope}:generation")
+        return int(value) if value is not None else 0
+    except Exception as e:
+        logger.warning(f"Cache generation read failed for {scope}: {e}")
+        return 0
+
+
+async def bump_generation(scope: str) -> None:
+    """Orphan every entry cached under ``scope``'s current generation."""
+    try:
+        await redis_client.incr(f"{scope}:generation")
+    except Exception as e:
+        logger.warning(f"Cache generation bump failed for {scope}: {e}")
+
+
+def cached(
+    key: str,
+    ttl: int,
+    vary: Tuple[str, ...] = (),
+    generation: Optional[str] = None
+):
+    """
+    Cache a JSON-serializable endpoint result in Redis under ``key``.
+
+    Intended for read endpoints that tolerate ``ttl`` seconds of staleness.
+    By default the result must not depend on the call's arguments; list the
+    keyword arguments it does depend on in ``vary`` to cache one entry per
+    combination. With ``generation``, entries are also keyed by that scope's
+    generation, so ``bump_generation`` invalidates all of them at once.
+    Redis errors are logged and the handler is called directly, so an
+    unavailable cache never fails the request.
+
+    Concurrent misses are single-flighted: the first one computes the value
+    and the others await the same result. Handlers that declare a ``fresh``
+    parameter let callers pass ``fresh=true`` to skip the cached entry and
+    recompute.
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]):
+        async def fill(full_key, *args, **kwargs):
+            value = await func(*args, **kwargs)
+            await set_cached(full_key, value, ttl)
+            return value
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            full_key = key
+            if vary:
+                full_key = f"{full_key}:{_digest({name: kwargs.get(name) for name in vary})}"
+            if generation:
+                full_key = f"{full_key}:g{await current_generation(generation)}"
+
+            if kwargs.get("fresh", False):
+                return await fill(full_key, *args, **kwargs)
+
+            hit = await get_cached(full_key)
+            if hit is not None:
+                return hit
+
+            pending = _inflight.get(full_key)
+            if pending is None:
+                pending = asyncio.ensure_future(fill(full_key, *args, **kwargs))
+                _inflight[full_key] = pending
+                pending.add_done_callback(lambda _: _inflight.pop(full_key, None))
+            # Shielded so one waiter disconnecting doesn't cancel the others
+            return await asyncio.shield(pending)
+        return wrapper
+    return decorator
+
+
+def row_etag(updated_at: Optional[datetime]) -> str:
+    """Strong ETag for a row, derived from its ``updated_at`` timestamp."""
+    return f'"{updated_at.timestamp()}"' if updated_at else '"0"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True when the request's If-None-Match header already names ``etag``."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # Weak comparison, as RFC 9110 prescribes for If-None-Match
+    return etag in (tag.strip().removeprefix("W/") for tag in header.split(","))
+
+
+async def invalidate(*keys: str) -> None:
+    """Drop cached entries after a write that makes them stale."""
+    try:
+        await redis_client.delete(*keys)
+    except Exception as e:
+        logger.warning(f"Cache invalidation failed for {keys}: {e}")
+
+
+async def close_cache() -> None:
+    """Release the Redis connection pool."""
+    await redis_client.close()
@@ -2,9 +2,21 @@
 Database configuration and session management.
 """
 
+import asyncio
+import sys
+from functools import lru_cache
+import orjson
+from loguru import logger
+from sqlalchemy import event, inspect, text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from app.core.config import settings
+from app.core.cache import get_cached, set_cached, COUNT_CACHE_TTL, COUNT_CACHE_MIN_ROWS
+
+
+def _json_serializer(value) -> str:
+    """Encode JSON column values with orjson; non-string keys are stringified like json.dumps."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
 
 
 # Create async engine
@@ -12,6 +24,18 @@ engine = create_async_engine(
     settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://"),
     pool_size=settings.DATABASE_POOL_SIZE,
     max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,
+    pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+    connect_args={
+        "statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DATABASE_PREPARED_STATEMENT_CACHE_SIZE,
+        # JIT compilation costs more than it saves on short OLTP queries
+        "server_settings": {"jit": "off"},
+    },
+    # JSON columns are encoded and decoded with orjson instead of the stdlib
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
     echo=settings.DEBUG
 )
 
@@ -23,9 +47,75 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+# Materialized views refreshed by refresh_materialized_views()
+MATERIALIZED_VIEWS = ("transaction_daily_stats", "mv_proposal_dashboard")
+
+
+@lru_cache(maxsize=None)
+def _column_keys(model: type) -> frozenset:
+    """Attribute names of a model's mapped columns."""
+    return frozenset(inspect(model).column_attrs.keys())
+
+
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
-    pass
+    
+    def _loaded_state(self) -> dict:
+        """
+        The instance's attribute dict, with every column loaded.
+        
+        to_dict() reads column values from this rather than through the
+        instrumented attribute descriptors, one per field. Expired or
+        deferred columns are loaded through getattr first; relationships
+        are left alone. Columns never set on a pending instance stay absent,
+        so callers read with ``.get()``.
+        """
+        state = inspect(self)
+        for key in state.unloaded & _column_keys(type(self)):
+            getattr(self, key)
+        return state.dict
+
+
+def intern_on_load(model: type, *keys: str) -> None:
+    """
+    Intern the given string columns of ``model`` whenever a row is loaded.
+    
+    For low-variety codes such as currencies, countries and statuses, every
+    loaded row then shares one string object per distinct value instead of
+    allocating its own copy.
+    """
+    @event.listens_for(model, "load")
+    def _intern_strings(target, context):
+        state = target.__dict__
+        for key in keys:
+            value = state.get(key)
+            if value is not None:
+                state[key] = sys.intern(value)
+
+
+def sequence_sync_ddl(sequence: str, table: str, column: str) -> str:
+    """
+    Statement moving a numbering sequence past the numbers already in
+    ``table``.
+    
+    ``column`` holds the generated numbers, whose trailing digits are the
+    sequence value (``DEMO-202401-0042``). Numbering does not have to be
+    gap-free, so the sequence is moved past the highest existing suffix
+    rather than the row count.
+    
+    create_all only builds a new sequence, so on an existing table numbering
+    would restart at 1; init_db() runs these to catch the sequence up. They
+    are no-ops once it has. A sequence that has never been called reports
+    ``last_value`` 1 yet still hands out 1 next, so it is synced even when
+    the highest existing number is 1.
+    """
+    return f"""
+    SELECT setval('{sequence}', m.n)
+    FROM (
+        SELECT max(substring({column} FROM '(\\d+)$')::bigint) AS n FROM {table}
+    ) AS m, {sequence} AS s
+    WHERE m.n > 0 AND (NOT s.is_called OR m.n > s.last_value)
+    """
 
 
 async def get_db() -> AsyncSession:
@@ -41,10 +131,112 @@ async def get_db() -> AsyncSession:
             await session.close()
 
 
+async def stream_rows(db: AsyncSession, query, row_factory) -> list:
+    """
+    Stream ``query`` through a server-side cursor, building each item as its
+    row arrives instead of buffering the whole result first.
+    """
+    result = await db.stream(query)
+    return [row_factory(row) async for row in result.mappings()]
+
+
+async def fetch_page(db: AsyncSession, query, row_factory, count_query=None, count_key=None):
+    """
+    Stream a page query and run its COUNT concurrently.
+    
+    An AsyncSession cannot run two statements at once, so the count is issued
+    on a second pooled session while the page runs on the request session.
+    The two statements see separate snapshots: under concurrent writes the
+    total may be off by the rows committed in between, which is acceptable
+    for pagination metadata.
+    
+    With ``count_key`` the total is read from and stored in the Redis cache
+    for ``COUNT_CACHE_TTL`` seconds, so paging through the same filtered
+    list does not recount it on every request.
+    
+    Returns a ``(total, items)`` tuple where ``items`` holds
+    ``row_factory(row)`` for each row mapping; ``total`` is None when no
+    count query is given.
+    """
+    if count_query is None:
+        return None, await stream_rows(db, query, row_factory)
+    
+    if count_key is not None:
+        total = await get_cached(count_key)
+        if total is not None:
+            return total, await stream_rows(db, query, row_factory)
+    
+    async with AsyncSessionLocal() as count_session:
+        total, items = await asyncio.gather(
+            count_session.scalar(count_query),
+            stream_rows(db, query, row_factory)
+        )
+    total = total or 0
+    
+    if count_key is not None and total > COUNT_CACHE_MIN_ROWS:
+        await set_cached(count_key, total, COUNT_CACHE_TTL)
+    return total, items
+
+
+async def gather_scalars(*statements) -> list:
+    """
+    Execute independent scalar queries concurrently, one pooled session each.
+    
+    Wall-clock time is that of the slowest statement rather than the sum.
+    As with ``fetch_page``, each statement reads its own snapshot.
+    """
+    async def run(statement):
+        async with AsyncSessionLocal() as session:
+            return await session.scalar(statement)
+    
+    return list(await asyncio.gather(*(run(s) for s in statements)))
+
+
 async def init_db():
     """Initialize database tables."""
     async with engine.begin() as conn:
         # Import all models here to ensure they are registered
-        from app.models import entity, transaction, alert, case
+        from app.models import entity, transaction, alert, case, poc, rfp
+        # Trigram matching backs fuzzy name lookups and their GIN indexes
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
+        
+        from app.models.entity import ENTITY_FLAGS_MIGRATION_DDL
+        await conn.execute(text(ENTITY_FLAGS_MIGRATION_DDL))
+        await conn.execute(text(transaction.TRANSACTION_FLAG_MIGRATION_DDL))
+        await conn.execute(text(rfp.CONTENT_VERSION_MIGRATION_DDL))
+        
+        for statement in case.SEQUENCE_SYNC_DDL + poc.SEQUENCE_SYNC_DDL + rfp.SEQUENCE_SYNC_DDL:
+            await conn.execute(text(statement))
+        
+        from app.models.transaction import TRANSACTION_DAILY_STATS_DDL
+        for statement in TRANSACTION_DAILY_STATS_DDL + rfp.PROPOSAL_DASHBOARD_DDL:
+            await conn.execute(text(statement))
+
+
+async def warm_pool(connections: int) -> None:
+    """Open ``connections`` pooled connections so early requests skip connecting."""
+    async def ping():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    
+    # Concurrent, so each ping checks out its own connection
+    await asyncio.gather(*(ping() for _ in range(connections)))
+
+
+async def refresh_materialized_views():
+    """Refresh every rollup view without blocking readers."""
+    async with engine.begin() as conn:
+        for view in MATERIALIZED_VIEWS:
+            await conn.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}"))
+
+
+async def refresh_materialized_views_periodically(interval: int):
+    """Background loop keeping rollup views at most ``interval`` seconds stale."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await refresh_materialized_views()
+        except Exception as e:
+            logger.warning(f"Materialized view refresh failed: {e}")
 
@@ -0,0 +1,69 @@
+"""
+Keyset (cursor) pagination helpers.
+
+Cursors are opaque base64 strings carrying the sort key of the last row
+of the previous page, so deep pages are fetched with an index range scan
+instead of an O(offset) skip.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable, Sequence, Tuple
+from fastapi import HTTPException
+from sqlalchemy import and_, or_, tuple_
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Serialize the sort key of the last row on a page into a cursor."""
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_cursor(cursor: str, parsers: Sequence[Callable[[Any], Any]]) -> Tuple[Any, ...]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    ``parsers`` converts each JSON value back to the column's Python type
+    (e.g. ``datetime.fromisoformat`` or an Enum class). Malformed cursors
+    are rejected with a 400.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if len(payload) != len(parsers):
+            raise ValueError("cursor length mismatch")
+        return tuple(
+            parse(value) if value is not None else None
+            for parse, value in zip(parsers, payload)
+        )
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def keyset_order(keys: Sequence[Tuple[Any, bool]]) -> list:
+    """ORDER BY clauses for ``(column, descending)`` sort keys."""
+    return [column.desc() if descending else column.asc() for column, descending in keys]
+
+
+def keyset_filter(keys: Sequence[Tuple[Any, bool]], values: Sequence[Any]):
+    """
+    Predicate selecting rows strictly after ``values`` in ``keys`` order.
+
+    When every key sorts in the same direction a row-value comparison is
+    used, which PostgreSQL can satisfy with a single index range scan.
+    Mixed directions fall back to the expanded lexicographic form.
+    """
+    columns = [column for column, _ in keys]
+    directions = {descending for _, descending in keys}
+
+    if directions == {True}:
+        return tuple_(*columns) < tuple(values)
+    if directions == {False}:
+        return tuple_(*columns) > tuple(values)
+
+    clauses = []
+    for i, (column, descending) in enumerate(keys):
+        prefix = [keys[j][0] == values[j] for j in range(i)]
+        step = column < values[i] if descending else column > values[i]
+        clauses.append(and_(*prefix, step))
+    return or_(*clauses)
@@ -5,17 +5,23 @@ A comprehensive financial crime detection and decision intelligence platform
 featuring entity resolution, graph analytics, and real-time monitoring.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
+from typing import Awaitable
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from loguru import logger
 import sys
 
-from app.core.config import settings
+from app.core.config import settings, CORS_ORIGINS
 from app.api import router as api_router
-from app.core.database import init_db
-from app.services.opensearch_service import OpenSearchService
-from app.services.neo4j_service import Neo4jService
+from app.api.endpoints.ftex import get_scoring_engine, get_resolution_engine
+from app.core.database import init_db, warm_pool, refresh_materialized_views_periodically
+from app.core.cache import close_cache
+from app.services.opensearch_service import get_opensearch_service
+from app.services.neo4j_service import get_neo4j_service
 
 
 # Configure logging
@@ -27,33 +33,56 @@ logger.add(
 )
 
 
+async def startup_step(name: str, step: Awaitable, timeout: float) -> None:
+    """Run one startup step under ``timeout``, logging rather than raising on failure."""
+    try:
+        await asyncio.wait_for(step, timeout)
+    except Exception as e:
+        logger.warning(f"⚠️ {name} failed: {e!r}")
+    else:
+        logger.info(f"✅ {name} done")
+
+
+async def init_database():
+    """Create the schema, then open pooled connections before the first request."""
+    await init_db()
+    if settings.DATABASE_POOL_WARMUP:
+        await warm_pool(settings.DATABASE_POOL_SIZE)
+
+
+async def init_opensearch():
+    """
+    Start the search batcher, create any missing indices and store the search
+    templates. Templates not stored here are stored on first search instead.
+    """
+    opensearch_service = get_opensearch_service()
+    opensearch_service.batcher.start()
+    await opensearch_service.initialize_indices()
+    await opensearch_service.register_search_templates()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager for startup and shutdown events."""
     logger.info("🚀 Starting FTex Decision Intelligence Platform...")
     
-    # Initialize database
-    try:
-        await init_db()
-        logger.info("✅ Database initialized successfully")
-    except Exception as e:
-        logger.error(f"❌ Database initialization failed: {e}")
+    # Bring up the backing services concurrently; each is bounded so one
+    # slow dependency can't hold up startup
+    timeout = settings.STARTUP_TIMEOUT_SECONDS
+    await asyncio.gather(
+        startup_step("Database initialization", init_database(), timeout),
+        startup_step("OpenSearch index initialization", init_opensearch(), timeout),
+        startup_step("Neo4j connection check", get_neo4j_service().verify_connection(), timeout),
+    )
     
-    # Initialize OpenSearch
-    try:
-        opensearch_service = OpenSearchService()
-        await opensearch_service.initialize_indices()
-        logger.info("✅ OpenSearch indices initialized")
-    except Exception as e:
-        logger.warning(f"⚠️ OpenSearch initialization warning: {e}")
+    # Build the default analytics engines before the first request
+    get_scoring_engine()
+    get_resolution_engine()
     
-    # Initialize Neo4j
-    try:
-        neo4j_service = Neo4jService()
-        await neo4j_service.verify_connection()
-        logger.info("✅ Neo4j connection verified")
-    except Exception as e:
-        logger.warning(f"⚠️ Neo4j connection warning: {e}")
+    # Keep rollup views fresh
+    view_refresher = asyncio.create_task(
+        refresh_materialized_views_periodically(settings.MATERIALIZED_VIEW_REFRESH_SECONDS)
+    )
     
     logger.info("✅ FTex Platform started successfully!")
     
@@ -61,6 +90,10 @@ async def lifespan(app: FastAPI):
     
     # Cleanup on shutdown
     logger.info("🛑 Shutting down FTex Platform...")
+    view_refresher.cancel()
+    await close_cache()
+    await get_opensearch_service().close()
+    await get_neo4j_service().close()
     logger.info("👋 Goodbye!")
 
 
@@ -94,18 +127,22 @@ Built for Tier 1 Banking organisations in the APAC region.
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Compress larger payloads such as graph networks and list pages
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include API router
 app.include_router(api_router, prefix="/api")
 
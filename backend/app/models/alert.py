@@ -4,7 +4,7 @@ Alert model for financial crime detection alerts.
 
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import Column, String, DateTime, Float, JSON, Text, Enum as SQLEnum, ForeignKey, Integer
+from sqlalchemy import func, literal_column, Column, String, DateTime, Float, JSON, Text, Enum as SQLEnum, ForeignKey, Integer, Index
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 import uuid
@@ -90,8 +90,8 @@ class Alert(Base):
             "id": self.id,
             "alert_type": self.alert_type,
             "category": self.category,
-            "severity": self.severity.value if self.severity else None,
-            "status": self.status.value if self.status else None,
+            "severity": self.severity,
+            "status": self.status,
             "title": self.title,
             "description": self.description,
             "detection_rule": self.detection_rule,
@@ -104,10 +104,38 @@ class Alert(Base):
             "case_id": self.case_id,
             "assigned_to": self.assigned_to,
             "investigation_notes": self.investigation_notes,
-            "detected_at": self.detected_at.isoformat() if self.detected_at else None,
-            "acknowledged_at": self.acknowledged_at.isoformat() if self.acknowledged_at else None,
-            "resolved_at": self.resolved_at.isoformat() if self.resolved_at else None,
+            "detected_at": self.detected_at,
+            "acknowledged_at": self.acknowledged_at,
+            "resolved_at": self.resolved_at,
             "source_system": self.source_system,
-            "created_at": self.created_at.isoformat() if self.created_at else None
+            "created_at": self.created_at
         }
 
+
+# Open-alert queue: backs the dashboard open count and the default listing
+Index(
+    "idx_alerts_open",
+    Alert.detected_at.desc(),
+    postgresql_where=Alert.status.in_([AlertStatus.NEW, AlertStatus.INVESTIGATING])
+)
+# Sort keys for the alert list. Keyset comparisons against NULL match
+# nothing, so a missing severity ranks with LOW and a missing detection time
+# sorts last. The sentinels are literals rather than bind parameters so that
+# list queries match the expression index below.
+ALERT_SEVERITY_UNSET = AlertSeverity.LOW
+ALERT_UNDETECTED = datetime.min
+alert_severity_key = func.coalesce(
+    Alert.severity,
+    literal_column(f"'{ALERT_SEVERITY_UNSET.name}'::{Alert.severity.type.name}")
+)
+alert_detected_key = func.coalesce(
+    Alert.detected_at, literal_column(f"'{ALERT_UNDETECTED}'::timestamp")
+)
+
+# Matches the list_alerts ORDER BY so pages are read in index order
+Index(
+    "idx_alerts_severity_detected",
+    alert_severity_key.desc(),
+    alert_detected_key.desc(),
+    Alert.id.desc()
+)
@@ -4,9 +4,9 @@ Case model for investigation case management.
 
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import Column, String, DateTime, Float, JSON, Text, Enum as SQLEnum, Integer
+from sqlalchemy import func, literal_column, Column, String, DateTime, Float, JSON, Text, Enum as SQLEnum, Integer, Sequence, Index
 from sqlalchemy.orm import relationship
-from app.core.database import Base
+from app.core.database import Base, sequence_sync_ddl
 import uuid
 
 
@@ -21,6 +21,10 @@ class CaseStatus(str, Enum):
     CLOSED = "closed"
 
 
+# Source of the numeric suffix in case numbers; safe under concurrent inserts
+case_number_seq = Sequence("case_number_seq", metadata=Base.metadata)
+
+
 class Case(Base):
     """
     Case model for financial crime investigations.
@@ -94,7 +98,7 @@ class Case(Base):
             "case_type": self.case_type,
             "category": self.category,
             "priority": self.priority,
-            "status": self.status.value if self.status else None,
+            "status": self.status,
             "title": self.title,
             "description": self.description,
             "summary": self.summary,
@@ -106,13 +110,30 @@ class Case(Base):
             "sar_reference": self.sar_reference,
             "assigned_to": self.assigned_to,
             "assigned_team": self.assigned_team,
-            "opened_at": self.opened_at.isoformat() if self.opened_at else None,
-            "due_date": self.due_date.isoformat() if self.due_date else None,
-            "closed_at": self.closed_at.isoformat() if self.closed_at else None,
+            "opened_at": self.opened_at,
+            "due_date": self.due_date,
+            "closed_at": self.closed_at,
             "investigation_notes": self.investigation_notes,
             "findings": self.findings,
             "recommendation": self.recommendation,
             "tags": self.tags,
-            "created_at": self.created_at.isoformat() if self.created_at else None
+            "created_at": self.created_at
         }
 
+
+# Sort keys for the case list. Keyset comparisons against NULL match
+# nothing, so unprioritized cases sort after priority 5 and cases without an
+# open time sort last. The sentinels are literals rather than bind parameters
+# so that list queries match the expression index below.
+CASE_UNPRIORITIZED = 2 ** 31 - 1
+CASE_UNOPENED = datetime.min
+case_priority_key = func.coalesce(Case.priority, literal_column(str(CASE_UNPRIORITIZED)))
+case_opened_key = func.coalesce(Case.opened_at, literal_column(f"'{CASE_UNOPENED}'::timestamp"))
+
+# Matches the list_cases ORDER BY, including the keyset tie-breaker
+Index("idx_cases_priority_opened", case_priority_key, case_opened_key.desc(), Case.id.desc())
+
+# Run by init_db() so an existing table doesn't restart numbering at 1
+SEQUENCE_SYNC_DDL = (
+    sequence_sync_ddl("case_number_seq", Case.__tablename__, "case_number"),
+)
@@ -4,7 +4,7 @@ Entity model for storing resolved entities.
 
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import Column, String, DateTime, Text, JSON, Float, Integer, Enum as SQLEnum
+from sqlalchemy import func, literal_column, Column, String, DateTime, Text, JSON, Float, Boolean, Enum as SQLEnum, Index
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 import uuid
@@ -42,9 +42,9 @@ class Entity(Base):
     risk_factors = Column(JSON, default=list)
     
     # Status
-    is_sanctioned = Column(Integer, default=0, index=True)
-    is_pep = Column(Integer, default=0, index=True)  # Politically Exposed Person
-    is_adverse_media = Column(Integer, default=0)
+    is_sanctioned = Column(Boolean, default=False, nullable=False)
+    is_pep = Column(Boolean, default=False, nullable=False)  # Politically Exposed Person
+    is_adverse_media = Column(Boolean, default=False, nullable=False)
     
     # Metadata
     attributes = Column(JSON, default=dict)
@@ -66,18 +66,72 @@ class Entity(Base):
         """Convert entity to dictionary."""
         return {
             "id": self.id,
-            "entity_type": self.entity_type.value,
+            "entity_type": self.entity_type,
             "name": self.name,
             "external_ids": self.external_ids,
             "risk_score": self.risk_score,
             "risk_factors": self.risk_factors,
-            "is_sanctioned": bool(self.is_sanctioned),
-            "is_pep": bool(self.is_pep),
-            "is_adverse_media": bool(self.is_adverse_media),
+            "is_sanctioned": self.is_sanctioned,
+            "is_pep": self.is_pep,
+            "is_adverse_media": self.is_adverse_media,
             "attributes": self.attributes,
             "source_systems": self.source_systems,
             "confidence_score": self.confidence_score,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None
+            "created_at": self.created_at,
+            "updated_at": self.updated_at
         }
 
+
+# Trigram index so ILIKE '%...%' name searches avoid a sequential scan
+Index(
+    "idx_entities_name_trgm",
+    Entity.name,
+    postgresql_using="gin",
+    postgresql_ops={"name": "gin_trgm_ops"}
+)
+# Risk sort key for the entity list. Keyset comparisons against NULL match
+# nothing, so unscored entities take a sentinel below the 0-1 score range and
+# sort last. The sentinel is a literal rather than a bind parameter so that
+# list queries match the expression index below.
+ENTITY_UNSCORED = -1.0
+entity_risk_key = func.coalesce(Entity.risk_score, literal_column(str(ENTITY_UNSCORED)))
+
+# Matches the list_entities ORDER BY, including the keyset tie-breaker
+Index("idx_entities_risk_id", entity_risk_key.desc(), Entity.id.desc())
+# Small partial indexes per flag; Postgres bitmap-ANDs them for combined filters
+Index("idx_entities_sanctioned", Entity.risk_score.desc(), postgresql_where=Entity.is_sanctioned)
+Index("idx_entities_pep", Entity.risk_score.desc(), postgresql_where=Entity.is_pep)
+
+# The flag columns used to be 0/1 integers. create_all leaves existing tables
+# alone, so init_db() runs this to convert them in place; it is a no-op once
+# the columns are boolean.
+ENTITY_FLAGS_MIGRATION_DDL = """
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'entities' AND column_name = 'is_sanctioned'
+          AND data_type = 'integer'
+    ) THEN
+        DROP INDEX IF EXISTS idx_entities_sanctioned;
+        DROP INDEX IF EXISTS idx_entities_pep;
+        DROP INDEX IF EXISTS ix_entities_is_sanctioned;
+        DROP INDEX IF EXISTS ix_entities_is_pep;
+        ALTER TABLE entities
+            ALTER COLUMN is_sanctioned DROP DEFAULT,
+            ALTER COLUMN is_pep DROP DEFAULT,
+            ALTER COLUMN is_adverse_media DROP DEFAULT;
+        ALTER TABLE entities
+            ALTER COLUMN is_sanctioned TYPE BOOLEAN USING (coalesce(is_sanctioned, 0) <> 0),
+            ALTER COLUMN is_pep TYPE BOOLEAN USING (coalesce(is_pep, 0) <> 0),
+            ALTER COLUMN is_adverse_media TYPE BOOLEAN USING (coalesce(is_adverse_media, 0) <> 0);
+        ALTER TABLE entities
+            ALTER COLUMN is_sanctioned SET NOT NULL,
+            ALTER COLUMN is_pep SET NOT NULL,
+            ALTER COLUMN is_adverse_media SET NOT NULL;
+        CREATE INDEX idx_entities_sanctioned ON entities (risk_score DESC) WHERE is_sanctioned;
+        CREATE INDEX idx_entities_pep ON entities (risk_score DESC) WHERE is_pep;
+    END IF;
+END
+$$
+"""
@@ -7,8 +7,8 @@ as mentioned in the job requirements.
 
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import Column, String, DateTime, Text, JSON, Float, Integer, Enum as SQLEnum, ForeignKey
-from app.core.database import Base
+from sqlalchemy import func, literal_column, Column, String, DateTime, Text, JSON, Float, Integer, Enum as SQLEnum, ForeignKey, Index, Sequence
+from app.core.database import Base, intern_on_load, sequence_sync_ddl
 import uuid
 
 
@@ -118,34 +118,80 @@ class ProvingEngagement(Base):
     updated_by = Column(String(100))
     
     def to_dict(self):
+        d = self._loaded_state()
         return {
-            "id": self.id,
-            "engagement_number": self.engagement_number,
-            "engagement_type": self.engagement_type.value if self.engagement_type else None,
-            "client_name": self.client_name,
-            "client_industry": self.client_industry,
-            "client_country": self.client_country,
-            "title": self.title,
-            "description": self.description,
-            "objectives": self.objectives,
-            "success_criteria": self.success_criteria,
-            "status": self.status.value if self.status else None,
-            "solution_areas": self.solution_areas,
-            "use_cases": self.use_cases,
-            "planned_start_date": self.planned_start_date.isoformat() if self.planned_start_date else None,
-            "planned_end_date": self.planned_end_date.isoformat() if self.planned_end_date else None,
-            "actual_start_date": self.actual_start_date.isoformat() if self.actual_start_date else None,
-            "actual_end_date": self.actual_end_date.isoformat() if self.actual_end_date else None,
-            "team_members": self.team_members,
-            "environment_type": self.environment_type,
-            "milestones": self.milestones,
-            "deliverables": self.deliverables,
-            "results_summary": self.results_summary,
-            "metrics_achieved": self.metrics_achieved,
-            "created_at": self.created_at.isoformat() if self.created_at else None
+            "id": d.get("id"),
+            "engagement_number": d.get("engagement_number"),
+            "engagement_type": d.get("engagement_type"),
+            "client_name": d.get("client_name"),
+            "client_industry": d.get("client_industry"),
+            "client_country": d.get("client_country"),
+            "title": d.get("title"),
+            "description": d.get("description"),
+            "objectives": d.get("objectives"),
+            "success_criteria": d.get("success_criteria"),
+            "status": d.get("status"),
+            "solution_areas": d.get("solution_areas"),
+            "use_cases": d.get("use_cases"),
+            "planned_start_date": d.get("planned_start_date"),
+            "planned_end_date": d.get("planned_end_date"),
+            "actual_start_date": d.get("actual_start_date"),
+            "actual_end_date": d.get("actual_end_date"),
+            "team_members": d.get("team_members"),
+            "environment_type": d.get("environment_type"),
+            "milestones": d.get("milestones"),
+            "deliverables": d.get("deliverables"),
+            "results_summary": d.get("results_summary"),
+            "metrics_achieved": d.get("metrics_achieved"),
+            "created_at": d.get("created_at")
         }
 
 
+# Environment types are a handful of values (cloud, on-prem, hybrid)
+intern_on_load(ProvingEngagement, "environment_type")
+
+# Covers the dashboard's GROUP BY (status, engagement_type) as an index-only scan
+Index(
+    "idx_engagements_status_type",
+    ProvingEngagement.status,
+    ProvingEngagement.engagement_type
+)
+
+# Trigram indexes so the list search's ILIKE '%...%' can use an index scan
+Index(
+    "idx_engagements_title_trgm",
+    ProvingEngagement.title,
+    postgresql_using="gin",
+    postgresql_ops={"title": "gin_trgm_ops"}
+)
+Index(
+    "idx_engagements_client_trgm",
+    ProvingEngagement.client_name,
+    postgresql_using="gin",
+    postgresql_ops={"client_name": "gin_trgm_ops"}
+)
+
+# Numbers engagements without counting the table on every insert; nextval()
+# is also race-free, unlike count(*) + 1 under concurrent creates.
+engagement_seq = Sequence("engagement_seq", start=1, metadata=Base.metadata)
+
+# Creation-time sort key for the engagement list. Keyset comparisons against
+# NULL match nothing, so engagements without a creation time take a sentinel
+# and sort last. The sentinel is a literal rather than a bind parameter so
+# that list queries match the expression index below.
+ENGAGEMENT_UNDATED = datetime.min
+engagement_created_key = func.coalesce(
+    ProvingEngagement.created_at, literal_column(f"'{ENGAGEMENT_UNDATED}'::timestamp")
+)
+
+# Matches the list's keyset order so each cursor page is one index range scan
+Index(
+    "idx_engagements_created_id",
+    engagement_created_key.desc(),
+    ProvingEngagement.id.desc()
+)
+
+
 class ProductDemo(Base):
     """
     Product Demonstration management.
@@ -217,32 +263,70 @@ class ProductDemo(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     def to_dict(self):
+        d = self._loaded_state()
         return {
-            "id": self.id,
-            "demo_number": self.demo_number,
-            "demo_type": self.demo_type.value if self.demo_type else None,
-            "client_name": self.client_name,
-            "client_industry": self.client_industry,
-            "attendees": self.attendees,
-            "audience_type": self.audience_type,
-            "title": self.title,
-            "description": self.description,
-            "key_messages": self.key_messages,
-            "solution_areas": self.solution_areas,
-            "use_cases_shown": self.use_cases_shown,
-            "delivery_format": self.delivery_format,
-            "scheduled_date": self.scheduled_date.isoformat() if self.scheduled_date else None,
-            "actual_date": self.actual_date.isoformat() if self.actual_date else None,
-            "duration_minutes": self.duration_minutes,
-            "presenter": self.presenter,
-            "status": self.status,
-            "overall_rating": self.overall_rating,
-            "strengths": self.strengths,
-            "improvements": self.improvements,
-            "created_at": self.created_at.isoformat() if self.created_at else None
+            "id": d.get("id"),
+            "demo_number": d.get("demo_number"),
+            "demo_type": d.get("demo_type"),
+            "client_name": d.get("client_name"),
+            "client_industry": d.get("client_industry"),
+            "attendees": d.get("attendees"),
+            "audience_type": d.get("audience_type"),
+            "title": d.get("title"),
+            "description": d.get("description"),
+            "key_messages": d.get("key_messages"),
+            "solution_areas": d.get("solution_areas"),
+            "use_cases_shown": d.get("use_cases_shown"),
+            "delivery_format": d.get("delivery_format"),
+            "scheduled_date": d.get("scheduled_date"),
+            "actual_date": d.get("actual_date"),
+            "duration_minutes": d.get("duration_minutes"),
+            "presenter": d.get("presenter"),
+            "status": d.get("status"),
+            "overall_rating": d.get("overall_rating"),
+            "strengths": d.get("strengths"),
+            "improvements": d.get("improvements"),
+            "created_at": d.get("created_at")
         }
 
 
+# Format, audience and status codes repeat across nearly every demo
+intern_on_load(ProductDemo, "delivery_format", "audience_type", "status")
+
+
+# Scheduled-date sort key for the demo list. Keyset comparisons against NULL
+# match nothing, so unscheduled demos take a sentinel and sort last. The
+# sentinel is a literal rather than a bind parameter so that list queries
+# match the expression index below.
+DEMO_UNSCHEDULED = datetime.min
+demo_schedule_key = func.coalesce(
+    ProductDemo.scheduled_date, literal_column(f"'{DEMO_UNSCHEDULED}'::timestamp")
+)
+
+# Serve the status-filtered list in ORDER BY order from the index
+Index(
+    "idx_demos_status_scheduled",
+    ProductDemo.status,
+    demo_schedule_key.desc(),
+    ProductDemo.id.desc()
+)
+
+# Upcoming demos by date
+Index(
+    "idx_demos_upcoming",
+    ProductDemo.scheduled_date,
+    postgresql_where=ProductDemo.status == "scheduled"
+)
+
+# Covers every column the dashboard's GROUP BY demo_type reads, so it can
+# run as an index-only scan
+Index(
+    "idx_demos_type_dashboard",
+    ProductDemo.demo_type,
+    postgresql_include=["scheduled_date", "status", "overall_rating"]
+)
+
+
 class DemoScenario(Base):
     """
     Reusable demo scenarios/scripts.
@@ -286,20 +370,30 @@ class DemoScenario(Base):
     created_by = Column(String(100))
     
     def to_dict(self):
+        d = self._loaded_state()
         return {
-            "id": self.id,
-            "name": self.name,
-            "description": self.description,
-            "solution_area": self.solution_area,
-            "target_audience": self.target_audience,
-            "narrative": self.narrative,
-            "demo_steps": self.demo_steps,
-            "talking_points": self.talking_points,
-            "key_features": self.key_features,
-            "estimated_duration": self.estimated_duration,
-            "times_used": self.times_used,
-            "avg_rating": self.avg_rating,
-            "version": self.version,
-            "is_active": bool(self.is_active)
+            "id": d.get("id"),
+            "name": d.get("name"),
+            "description": d.get("description"),
+            "solution_area": d.get("solution_area"),
+            "target_audience": d.get("target_audience"),
+            "narrative": d.get("narrative"),
+            "demo_steps": d.get("demo_steps"),
+            "talking_points": d.get("talking_points"),
+            "key_features": d.get("key_features"),
+            "estimated_duration": d.get("estimated_duration"),
+            "times_used": d.get("times_used"),
+            "avg_rating": d.get("avg_rating"),
+            "version": d.get("version"),
+            "is_active": bool(d.get("is_active"))
         }
 
+
+# Source of the numeric suffix in demo numbers; safe under concurrent inserts
+demo_seq = Sequence("demo_seq", start=1, metadata=Base.metadata)
+
+# Run by init_db() so existing tables don't restart numbering at 1
+SEQUENCE_SYNC_DDL = (
+    sequence_sync_ddl("engagement_seq", ProvingEngagement.__tablename__, "engagement_number"),
+    sequence_sync_ddl("demo_seq", ProductDemo.__tablename__, "demo_number"),
+)
@@ -4,8 +4,9 @@ RFP/RFI Model for proposal management.
 
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import Column, String, DateTime, Text, JSON, Float, Integer, Enum as SQLEnum, ForeignKey
-from app.core.database import Base
+from sqlalchemy import func, literal_column, Column, String, DateTime, Text, JSON, Float, Integer, Enum as SQLEnum, ForeignKey, Sequence, Index, MetaData, Table
+from sqlalchemy.ext.hybrid import hybrid_property
+from app.core.database import Base, intern_on_load, sequence_sync_ddl
 import uuid
 
 
@@ -121,41 +122,118 @@ class Proposal(Base):
     
     def to_dict(self):
         """Convert proposal to dictionary."""
+        d = self._loaded_state()
         return {
-            "id": self.id,
-            "proposal_number": self.proposal_number,
-            "proposal_type": self.proposal_type.value if self.proposal_type else None,
-            "client_name": self.client_name,
-            "client_industry": self.client_industry,
-            "client_country": self.client_country,
-            "client_contact_name": self.client_contact_name,
-            "client_contact_email": self.client_contact_email,
-            "title": self.title,
-            "description": self.description,
-            "requirements_summary": self.requirements_summary,
-            "status": self.status.value if self.status else None,
-            "priority": self.priority.value if self.priority else None,
-            "solution_areas": self.solution_areas,
-            "use_cases": self.use_cases,
-            "received_date": self.received_date.isoformat() if self.received_date else None,
-            "due_date": self.due_date.isoformat() if self.due_date else None,
-            "submitted_date": self.submitted_date.isoformat() if self.submitted_date else None,
-            "decision_date": self.decision_date.isoformat() if self.decision_date else None,
-            "estimated_deal_value": self.estimated_deal_value,
-            "currency": self.currency,
-            "lead_owner": self.lead_owner,
-            "team_members": self.team_members,
-            "win_probability": self.win_probability,
-            "competition": self.competition,
-            "differentiators": self.differentiators,
-            "risks": self.risks,
-            "outcome_reason": self.outcome_reason,
-            "tags": self.tags,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None
+            "id": d.get("id"),
+            "proposal_number": d.get("proposal_number"),
+            "proposal_type": d.get("proposal_type"),
+            "client_name": d.get("client_name"),
+            "client_industry": d.get("client_industry"),
+            "client_country": d.get("client_country"),
+            "client_contact_name": d.get("client_contact_name"),
+            "client_contact_email": d.get("client_contact_email"),
+            "title": d.get("title"),
+            "description": d.get("description"),
+            "requirements_summary": d.get("requirements_summary"),
+            "status": d.get("status"),
+            "priority": d.get("priority"),
+            "solution_areas": d.get("solution_areas"),
+            "use_cases": d.get("use_cases"),
+            "received_date": d.get("received_date"),
+            "due_date": d.get("due_date"),
+            "submitted_date": d.get("submitted_date"),
+            "decision_date": d.get("decision_date"),
+            "estimated_deal_value": d.get("estimated_deal_value"),
+            "currency": d.get("currency"),
+            "lead_owner": d.get("lead_owner"),
+            "team_members": d.get("team_members"),
+            "win_probability": d.get("win_probability"),
+            "competition": d.get("competition"),
+            "differentiators": d.get("differentiators"),
+            "risks": d.get("risks"),
+            "outcome_reason": d.get("outcome_reason"),
+            "tags": d.get("tags"),
+            "created_at": d.get("created_at"),
+            "updated_at": d.get("updated_at")
         }
 
 
+# A handful of currency codes cover every proposal
+intern_on_load(Proposal, "currency")
+
+
+# Due-date sort key for the proposal list. Keyset comparisons against NULL
+# match nothing, so undated proposals take a far-future sentinel and sort
+# last. The sentinel is a literal rather than a bind parameter so that list
+# queries match the expression indexes below.
+PROPOSAL_UNDATED = datetime.max
+proposal_due_key = func.coalesce(
+    Proposal.due_date, literal_column(f"'{PROPOSAL_UNDATED}'::timestamp")
+)
+
+# Priority tie-breaker within a due date; a missing priority ranks with LOW
+# for the same reason
+PROPOSAL_PRIORITY_UNSET = ProposalPriority.LOW
+proposal_priority_key = func.coalesce(
+    Proposal.priority,
+    literal_column(f"'{PROPOSAL_PRIORITY_UNSET.name}'::{Proposal.priority.type.name}")
+)
+
+# Serve the list's filter + ORDER BY directly from the index
+Index(
+    "idx_proposals_status_due",
+    Proposal.status,
+    proposal_due_key,
+    proposal_priority_key.desc(),
+    Proposal.id
+)
+Index(
+    "idx_proposals_type_due",
+    Proposal.proposal_type,
+    proposal_due_key,
+    proposal_priority_key.desc(),
+    Proposal.id
+)
+
+# Open proposals by due date; small when most proposals are decided
+Index(
+    "idx_proposals_active_due",
+    Proposal.due_date,
+    postgresql_where=Proposal.status.in_([
+        ProposalStatus.DRAFT, ProposalStatus.IN_PROGRESS, ProposalStatus.REVIEW
+    ])
+)
+
+# Covers every column the dashboard rollup's GROUP BY (status,
+# proposal_type) reads, so its refresh can run as an index-only scan
+Index(
+    "idx_proposals_status_type",
+    Proposal.status,
+    Proposal.proposal_type,
+    postgresql_include=["due_date", "estimated_deal_value"]
+)
+
+# Trigram indexes so the list search's ILIKE '%...%' can use an index scan
+Index(
+    "idx_proposals_title_trgm",
+    Proposal.title,
+    postgresql_using="gin",
+    postgresql_ops={"title": "gin_trgm_ops"}
+)
+Index(
+    "idx_proposals_client_trgm",
+    Proposal.client_name,
+    postgresql_using="gin",
+    postgresql_ops={"client_name": "gin_trgm_ops"}
+)
+Index(
+    "idx_proposals_description_trgm",
+    Proposal.description,
+    postgresql_using="gin",
+    postgresql_ops={"description": "gin_trgm_ops"}
+)
+
+
 class ProposalSection(Base):
     """
     Individual sections/questions within an RFP/RFI.
@@ -199,23 +277,28 @@ class ProposalSection(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     def to_dict(self):
+        d = self._loaded_state()
         return {
-            "id": self.id,
-            "proposal_id": self.proposal_id,
-            "section_number": self.section_number,
-            "title": self.title,
-            "question": self.question,
-            "response": self.response,
-            "response_status": self.response_status,
-            "assigned_to": self.assigned_to,
-            "reviewer": self.reviewer,
-            "category": self.category,
-            "is_mandatory": bool(self.is_mandatory),
-            "max_score": self.max_score,
-            "weight": self.weight
+            "id": d.get("id"),
+            "proposal_id": d.get("proposal_id"),
+            "section_number": d.get("section_number"),
+            "title": d.get("title"),
+            "question": d.get("question"),
+            "response": d.get("response"),
+            "response_status": d.get("response_status"),
+            "assigned_to": d.get("assigned_to"),
+            "reviewer": d.get("reviewer"),
+            "category": d.get("category"),
+            "is_mandatory": bool(d.get("is_mandatory")),
+            "max_score": d.get("max_score"),
+            "weight": d.get("weight")
         }
 
 
+# Workflow codes repeat across every section of every proposal
+intern_on_load(ProposalSection, "response_status", "category")
+
+
 class ContentLibrary(Base):
     """
     Reusable content library for RFP/RFI responses.
@@ -239,8 +322,9 @@ class ContentLibrary(Base):
     tags = Column(JSON, default=list)
     keywords = Column(JSON, default=list)  # For search
     
-    # Version Control
-    version = Column(String(20), default="1.0")
+    # Version Control; exposed as "major.minor" through ``version``
+    major_version = Column(Integer, nullable=False, default=1)
+    minor_version = Column(Integer, nullable=False, default=0)
     is_current = Column(Integer, default=1)
     
     # Usage Stats
@@ -256,19 +340,104 @@ class ContentLibrary(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     created_by = Column(String(100))
     
+    @hybrid_property
+    def version(self) -> str:
+        return f"{self.major_version}.{self.minor_version}"
+    
+    @version.inplace.expression
+    @classmethod
+    def _version_expression(cls):
+        return func.concat(cls.major_version, ".", cls.minor_version).label("version")
+    
     def to_dict(self):
+        d = self._loaded_state()
         return {
-            "id": self.id,
-            "title": self.title,
-            "content": self.content,
-            "category": self.category,
-            "subcategory": self.subcategory,
-            "solution_area": self.solution_area,
-            "tags": self.tags,
-            "keywords": self.keywords,
+            "id": d.get("id"),
+            "title": d.get("title"),
+            "content": d.get("content"),
+            "category": d.get("category"),
+            "subcategory": d.get("subcategory"),
+            "solution_area": d.get("solution_area"),
+            "tags": d.get("tags"),
+            "keywords": d.get("keywords"),
             "version": self.version,
-            "usage_count": self.usage_count,
-            "last_reviewed_date": self.last_reviewed_date.isoformat() if self.last_reviewed_date else None,
-            "created_at": self.created_at.isoformat() if self.created_at else None
+            "usage_count": d.get("usage_count"),
+            "last_reviewed_date": d.get("last_reviewed_date"),
+            "created_at": d.get("created_at")
         }
 
+
+# Trigram indexes for the content library search
+Index(
+    "idx_content_title_trgm",
+    ContentLibrary.title,
+    postgresql_using="gin",
+    postgresql_ops={"title": "gin_trgm_ops"}
+)
+Index(
+    "idx_content_body_trgm",
+    ContentLibrary.content,
+    postgresql_using="gin",
+    postgresql_ops={"content": "gin_trgm_ops"}
+)
+
+
+# The content version used to be a "major.minor" string. create_all leaves
+# existing tables alone, so init_db() runs this to split it into the integer
+# columns; it is a no-op once the string column is gone.
+CONTENT_VERSION_MIGRATION_DDL = """
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'content_library' AND column_name = 'version'
+    ) THEN
+        ALTER TABLE content_library
+            ADD COLUMN IF NOT EXISTS major_version INTEGER NOT NULL DEFAULT 1,
+            ADD COLUMN IF NOT EXISTS minor_version INTEGER NOT NULL DEFAULT 0;
+        UPDATE content_library SET
+            major_version = coalesce(nullif(split_part(version, '.', 1), '')::int, 1),
+            minor_version = coalesce(nullif(split_part(version, '.', 2), '')::int, 0);
+        ALTER TABLE content_library DROP COLUMN version;
+    END IF;
+END
+$$
+"""
+
+
+# Source of the numeric suffix in proposal numbers; safe under concurrent inserts
+proposal_seq = Sequence("proposal_seq", start=1, metadata=Base.metadata)
+
+# Run by init_db() so an existing table doesn't restart numbering at 1
+SEQUENCE_SYNC_DDL = (
+    sequence_sync_ddl("proposal_seq", Proposal.__tablename__, "proposal_number"),
+)
+
+
+# Proposal counts and deal value per (status, type), backing the RFP
+# dashboard. Like transaction_daily_stats it is a materialized view on its
+# own MetaData; init_db() runs PROPOSAL_DASHBOARD_DDL to build it.
+proposal_dashboard_stats = Table(
+    "mv_proposal_dashboard",
+    MetaData(),
+    Column("status", SQLEnum(ProposalStatus)),
+    Column("proposal_type", SQLEnum(ProposalType)),
+    Column("proposal_count", Integer),
+    Column("deal_value", Float),
+)
+
+PROPOSAL_DASHBOARD_DDL = (
+    """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS mv_proposal_dashboard AS
+    SELECT
+        status,
+        proposal_type,
+        count(*) AS proposal_count,
+        sum(estimated_deal_value) AS deal_value
+    FROM proposals
+    GROUP BY status, proposal_type
+    """,
+    # Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_mv_proposal_dashboard_status_type "
+    "ON mv_proposal_dashboard (status, proposal_type)",
+)
@@ -4,9 +4,9 @@ Transaction model for financial transaction monitoring.
 
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import Column, String, DateTime, Float, JSON, Text, Enum as SQLEnum, ForeignKey, Integer
+from sqlalchemy import Boolean, Column, String, DateTime, Date, Float, JSON, Text, Enum as SQLEnum, ForeignKey, Integer, MetaData, Table, Index
 from sqlalchemy.orm import relationship
-from app.core.database import Base
+from app.core.database import Base, intern_on_load
 import uuid
 
 
@@ -53,7 +53,7 @@ class Transaction(Base):
     # Risk Assessment
     risk_score = Column(Float, default=0.0, index=True)
     risk_indicators = Column(JSON, default=list)
-    is_flagged = Column(Integer, default=0, index=True)
+    is_flagged = Column(Boolean, default=False, nullable=False)
     
     # Status
     status = Column(String(50), default="completed", index=True)
@@ -65,7 +65,8 @@ class Transaction(Base):
     # Metadata
     channel = Column(String(50))  # online, branch, atm, mobile
     description = Column(Text)
-    metadata = Column(JSON, default=dict)
+    # "metadata" is reserved on declarative classes; the column keeps its name
+    metadata_ = Column("metadata", JSON, default=dict)
     
     # Audit
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -76,27 +77,105 @@ class Transaction(Base):
     
     def to_dict(self):
         """Convert transaction to dictionary."""
+        d = self._loaded_state()
         return {
-            "id": self.id,
-            "transaction_type": self.transaction_type.value,
-            "reference_number": self.reference_number,
-            "amount": self.amount,
-            "currency": self.currency,
-            "sender_entity_id": self.sender_entity_id,
-            "receiver_entity_id": self.receiver_entity_id,
-            "sender_account": self.sender_account,
-            "receiver_account": self.receiver_account,
-            "sender_country": self.sender_country,
-            "receiver_country": self.receiver_country,
-            "risk_score": self.risk_score,
-            "risk_indicators": self.risk_indicators,
-            "is_flagged": bool(self.is_flagged),
-            "status": self.status,
-            "transaction_date": self.transaction_date.isoformat() if self.transaction_date else None,
-            "settlement_date": self.settlement_date.isoformat() if self.settlement_date else None,
-            "channel": self.channel,
-            "description": self.description,
-            "metadata": self.metadata,
-            "created_at": self.created_at.isoformat() if self.created_at else None
+            "id": d.get("id"),
+            "transaction_type": d.get("transaction_type"),
+            "reference_number": d.get("reference_number"),
+            "amount": d.get("amount"),
+            "currency": d.get("currency"),
+            "sender_entity_id": d.get("sender_entity_id"),
+            "receiver_entity_id": d.get("receiver_entity_id"),
+            "sender_account": d.get("sender_account"),
+            "receiver_account": d.get("receiver_account"),
+            "sender_country": d.get("sender_country"),
+            "receiver_country": d.get("receiver_country"),
+            "risk_score": d.get("risk_score"),
+            "risk_indicators": d.get("risk_indicators"),
+            "is_flagged": d.get("is_flagged"),
+            "status": d.get("status"),
+            "transaction_date": d.get("transaction_date"),
+            "settlement_date": d.get("settlement_date"),
+            "channel": d.get("channel"),
+            "description": d.get("description"),
+            "metadata": d.get("metadata_"),
+            "created_at": d.get("created_at")
         }
 
+# Codes repeat across nearly every row; share one string per value
+intern_on_load(Transaction, "currency", "sender_country", "receiver_country", "channel", "status")
+
+# Covers every column the stats aggregates read for a date window, so
+# get_transaction_stats can run as an index-only range scan
+Index(
+    "ix_tx_date_flag_risk",
+    Transaction.transaction_date,
+    postgresql_include=["is_flagged", "risk_score", "amount"]
+)
+# Matches the list_transactions ORDER BY so keyset pages are index range scans
+Index(
+    "idx_transactions_date_id",
+    Transaction.transaction_date.desc(),
+    Transaction.id.desc()
+)
+# Flagged transactions are a small slice, newest first for review queues
+Index(
+    "idx_transactions_flagged",
+    Transaction.transaction_date.desc(),
+    postgresql_where=Transaction.is_flagged
+)
+
+# is_flagged used to be a 0/1 integer. create_all leaves existing tables
+# alone, so init_db() runs this to convert it in place; it is a no-op once
+# the column is boolean.
+TRANSACTION_FLAG_MIGRATION_DDL = """
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'transactions' AND column_name = 'is_flagged'
+          AND data_type = 'integer'
+    ) THEN
+        DROP INDEX IF EXISTS idx_transactions_flagged;
+        DROP INDEX IF EXISTS ix_transactions_is_flagged;
+        ALTER TABLE transactions ALTER COLUMN is_flagged DROP DEFAULT;
+        ALTER TABLE transactions
+            ALTER COLUMN is_flagged TYPE BOOLEAN USING (coalesce(is_flagged, 0) <> 0);
+        ALTER TABLE transactions ALTER COLUMN is_flagged SET NOT NULL;
+        CREATE INDEX idx_transactions_flagged ON transactions (transaction_date DESC)
+            WHERE is_flagged;
+    END IF;
+END
+$$
+"""
+
+
+# Daily transaction rollup backing the trends chart. It is a materialized
+# view, so it lives on its own MetaData to keep create_all from building it
+# as a table; init_db() runs TRANSACTION_DAILY_STATS_DDL instead.
+transaction_daily_stats = Table(
+    "transaction_daily_stats",
+    MetaData(),
+    Column("date", Date, primary_key=True),
+    Column("tx_count", Integer),
+    Column("volume", Float),
+    Column("sum_risk", Float),
+    Column("n_risk", Integer),
+)
+
+TRANSACTION_DAILY_STATS_DDL = (
+    """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS transaction_daily_stats AS
+    SELECT
+        date(transaction_date) AS date,
+        count(*) AS tx_count,
+        sum(amount) AS volume,
+        sum(risk_score) AS sum_risk,
+        count(risk_score) AS n_risk
+    FROM transactions
+    GROUP BY date(transaction_date)
+    """,
+    # Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_transaction_daily_stats_date "
+    "ON transaction_daily_stats (date)",
+)
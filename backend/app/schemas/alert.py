@@ -44,8 +44,8 @@ class AlertResponse(BaseModel):
     id: str
     alert_type: str
     category: Optional[str] = None
-    severity: Optional[str] = None
-    status: Optional[str] = None
+    severity: Optional[AlertSeverity] = None
+    status: Optional[AlertStatus] = None
     title: str
     description: Optional[str] = None
     detection_rule: Optional[str] = None
@@ -58,11 +58,11 @@ class AlertResponse(BaseModel):
     case_id: Optional[str] = None
     assigned_to: Optional[str] = None
     investigation_notes: Optional[str] = None
-    detected_at: Optional[str] = None
-    acknowledged_at: Optional[str] = None
-    resolved_at: Optional[str] = None
+    detected_at: Optional[datetime] = None
+    acknowledged_at: Optional[datetime] = None
+    resolved_at: Optional[datetime] = None
     source_system: Optional[str] = None
-    created_at: Optional[str] = None
+    created_at: Optional[datetime] = None
 
     model_config = {"from_attributes": True}
 
@@ -70,8 +70,9 @@ class AlertResponse(BaseModel):
 class AlertListResponse(BaseModel):
     """Schema for paginated alert list."""
     items: List[AlertResponse]
-    total: int
+    total: Optional[int] = None
     page: int
     page_size: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
 
@@ -51,7 +51,7 @@ class CaseResponse(BaseModel):
     case_type: str
     category: Optional[str] = None
     priority: int
-    status: Optional[str] = None
+    status: Optional[CaseStatus] = None
     title: str
     description: Optional[str] = None
     summary: Optional[str] = None
@@ -63,14 +63,14 @@ class CaseResponse(BaseModel):
     sar_reference: Optional[str] = None
     assigned_to: Optional[str] = None
     assigned_team: Optional[str] = None
-    opened_at: Optional[str] = None
-    due_date: Optional[str] = None
-    closed_at: Optional[str] = None
+    opened_at: Optional[datetime] = None
+    due_date: Optional[datetime] = None
+    closed_at: Optional[datetime] = None
     investigation_notes: Optional[str] = None
     findings: Optional[str] = None
     recommendation: Optional[str] = None
     tags: Optional[List[str]] = None
-    created_at: Optional[str] = None
+    created_at: Optional[datetime] = None
 
     model_config = {"from_attributes": True}
 
@@ -78,8 +78,9 @@ class CaseResponse(BaseModel):
 class CaseListResponse(BaseModel):
     """Schema for paginated case list."""
     items: List[CaseResponse]
-    total: int
+    total: Optional[int] = None
     page: int
     page_size: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
 
@@ -41,7 +41,7 @@ class EntityUpdate(BaseModel):
 class EntityResponse(BaseModel):
     """Schema for entity response."""
     id: str
-    entity_type: str
+    entity_type: EntityType
     name: str
     external_ids: Optional[Dict[str, str]] = None
     risk_score: float
@@ -52,8 +52,8 @@ class EntityResponse(BaseModel):
     attributes: Optional[Dict[str, Any]] = None
     source_systems: Optional[List[str]] = None
     confidence_score: Optional[float] = None
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
     model_config = {"from_attributes": True}
 
@@ -61,8 +61,9 @@ class EntityResponse(BaseModel):
 class EntityListResponse(BaseModel):
     """Schema for paginated entity list."""
     items: List[EntityResponse]
-    total: int
+    total: Optional[int] = None
     page: int
     page_size: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
 
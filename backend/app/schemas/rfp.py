@@ -60,20 +60,20 @@ class ProposalResponse(BaseModel):
     """Schema for proposal response."""
     id: str
     proposal_number: Optional[str] = None
-    proposal_type: Optional[str] = None
+    proposal_type: Optional[ProposalType] = None
     client_name: str
     client_industry: Optional[str] = None
     client_country: Optional[str] = None
     title: str
     description: Optional[str] = None
     requirements_summary: Optional[str] = None
-    status: Optional[str] = None
-    priority: Optional[str] = None
+    status: Optional[ProposalStatus] = None
+    priority: Optional[ProposalPriority] = None
     solution_areas: Optional[List[str]] = None
     use_cases: Optional[List[str]] = None
-    received_date: Optional[str] = None
-    due_date: Optional[str] = None
-    submitted_date: Optional[str] = None
+    received_date: Optional[datetime] = None
+    due_date: Optional[datetime] = None
+    submitted_date: Optional[datetime] = None
     estimated_deal_value: Optional[float] = None
     currency: Optional[str] = None
     lead_owner: Optional[str] = None
@@ -83,8 +83,8 @@ class ProposalResponse(BaseModel):
     differentiators: Optional[List[str]] = None
     risks: Optional[List[str]] = None
     tags: Optional[List[str]] = None
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
     model_config = {"from_attributes": True}
 
@@ -96,6 +96,7 @@ class ProposalListResponse(BaseModel):
     page: int
     page_size: int
     pages: int
+    next_cursor: Optional[str] = None
 
 
 # Proposal Sections
@@ -175,7 +176,7 @@ class ContentResponse(BaseModel):
     keywords: Optional[List[str]] = None
     version: str
     usage_count: int
-    created_at: Optional[str] = None
+    created_at: Optional[datetime] = None
 
     model_config = {"from_attributes": True}
 
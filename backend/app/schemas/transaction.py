@@ -34,7 +34,7 @@ class TransactionCreate(TransactionBase):
 class TransactionResponse(BaseModel):
     """Schema for transaction response."""
     id: str
-    transaction_type: str
+    transaction_type: TransactionType
     reference_number: Optional[str] = None
     amount: float
     currency: str
@@ -48,12 +48,12 @@ class TransactionResponse(BaseModel):
     risk_indicators: Optional[List[Dict[str, Any]]] = None
     is_flagged: bool
     status: str
-    transaction_date: Optional[str] = None
-    settlement_date: Optional[str] = None
+    transaction_date: Optional[datetime] = None
+    settlement_date: Optional[datetime] = None
     channel: Optional[str] = None
     description: Optional[str] = None
-    metadata: Optional[Dict[str, Any]] = None
-    created_at: Optional[str] = None
+    metadata: Optional[Dict[str, Any]] = Field(None, validation_alias="metadata_")
+    created_at: Optional[datetime] = None
 
     model_config = {"from_attributes": True}
 
@@ -65,6 +65,7 @@ class TransactionListResponse(BaseModel):
     page: int
     page_size: int
     pages: int
+    next_cursor: Optional[str] = None
 
 
 class TransactionStats(BaseModel):
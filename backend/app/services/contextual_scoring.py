@@ -11,11 +11,12 @@ The key FTex differentiator: scoring based on network CONTEXT,
 not just individual attributes.
 """
 
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timedelta
 import math
+import numpy as np
 
 
 class RiskCategory(str, Enum):
@@ -56,6 +57,10 @@ class RiskScore:
     network_context: Dict[str, Any] = field(default_factory=dict)
     calculated_at: datetime = field(default_factory=datetime.utcnow)
     
+    # Lower bounds of medium, high and critical
+    LEVELS = ("low", "medium", "high", "critical")
+    LEVEL_THRESHOLDS = (0.4, 0.6, 0.8)
+    
     @classmethod
     def calculate_level(cls, score: float) -> str:
         if score >= 0.8:
@@ -66,6 +71,16 @@ class RiskScore:
             return "medium"
         else:
             return "low"
+    
+    @classmethod
+    def level_codes(cls, scores: np.ndarray) -> np.ndarray:
+        """Risk levels as indexes into LEVELS (0 = low ... 3 = critical)."""
+        return np.digitize(scores, cls.LEVEL_THRESHOLDS).astype(np.int8)
+    
+    @classmethod
+    def calculate_levels(cls, scores: np.ndarray) -> List[str]:
+        """Vectorized calculate_level for an array of scores."""
+        return [cls.LEVELS[i] for i in cls.level_codes(scores).tolist()]
 
 
 class ScoringRule:
@@ -84,6 +99,25 @@ class ScoringRule:
     def evaluate(self, entity: Dict[str, Any], context: Dict[str, Any]) -> Optional[RiskFactor]:
         """Evaluate the rule and return a risk factor if applicable."""
         raise NotImplementedError
+    
+    def evaluate_batch(
+        self,
+        entities: List[Dict[str, Any]],
+        contexts: List[Dict[str, Any]]
+    ) -> np.ndarray:
+        """
+        Score many entities at once.
+        
+        Returns a float array with the factor score per entity and NaN where
+        the rule does not apply. Rules with cheap features override this to
+        avoid building RiskFactor objects.
+        """
+        scores = np.full(len(entities), np.nan)
+        for i, (entity, context) in enumerate(zip(entities, contexts)):
+            factor = self.evaluate(entity, context)
+            if factor:
+                scores[i] = factor.score
+        return scores
 
 
 class SanctionsRule(ScoringRule):
@@ -110,11 +144,34 @@ class SanctionsRule(ScoringRule):
                 description="Entity appears on sanctions list"
             )
         return None
+    
+    def evaluate_batch(
+        self,
+        entities: List[Dict[str, Any]],
+        contexts: List[Dict[str, Any]]
+    ) -> np.ndarray:
+        hit = np.fromiter(
+            (bool(e.get('is_sanctioned') or e.get('matched_sanctions_lists')) for e in entities),
+            dtype=bool,
+            count=len(entities)
+        )
+        return np.where(hit, 1.0, np.nan)
 
 
 class PEPRule(ScoringRule):
     """Check if entity is a Politically Exposed Person."""
     
+    # Score based on PEP level
+    LEVEL_SCORES = {
+        'head_of_state': 1.0,
+        'senior_government': 0.9,
+        'international_org': 0.85,
+        'domestic': 0.7,
+        'foreign': 0.8,
+        'family_associate': 0.6,
+        'unknown': 0.75
+    }
+    
     def __init__(self, weight: float = 0.8):
         super().__init__(RiskCategory.PEP, "pep_status", weight)
     
@@ -123,17 +180,7 @@ class PEPRule(ScoringRule):
         pep_level = entity.get('pep_level', 'unknown')  # domestic, foreign, international_org
         
         if is_pep:
-            # Score based on PEP level
-            score_map = {
-                'head_of_state': 1.0,
-                'senior_government': 0.9,
-                'international_org': 0.85,
-                'domestic': 0.7,
-                'foreign': 0.8,
-                'family_associate': 0.6,
-                'unknown': 0.75
-            }
-            score = score_map.get(pep_level, 0.75)
+            score = self.LEVEL_SCORES.get(pep_level, 0.75)
             
             return RiskFactor(
                 category=self.category,
@@ -148,6 +195,21 @@ class PEPRule(ScoringRule):
                 description=f"Politically Exposed Person ({pep_level})"
             )
         return None
+    
+    def evaluate_batch(
+        self,
+        entities: List[Dict[str, Any]],
+        contexts: List[Dict[str, Any]]
+    ) -> np.ndarray:
+        levels = self.LEVEL_SCORES
+        return np.fromiter(
+            (
+                levels.get(e.get('pep_level', 'unknown'), 0.75) if e.get('is_pep') else np.nan
+                for e in entities
+            ),
+            dtype=float,
+            count=len(entities)
+        )
 
 
 class JurisdictionRule(ScoringRule):
@@ -182,6 +244,23 @@ class JurisdictionRule(ScoringRule):
                 description=f"High-risk jurisdiction: {country}"
             )
         return None
+    
+    def evaluate_batch(
+        self,
+        entities: List[Dict[str, Any]],
+        contexts: List[Dict[str, Any]]
+    ) -> np.ndarray:
+        jurisdictions = self.HIGH_RISK_JURISDICTIONS
+        return np.fromiter(
+            (
+                jurisdictions.get(
+                    (e.get('country') or e.get('jurisdiction') or '').upper(), np.nan
+                )
+                for e in entities
+            ),
+            dtype=float,
+            count=len(entities)
+        )
 
 
 class TransactionPatternRule(ScoringRule):
@@ -428,6 +507,40 @@ class ContextualScoringEngine:
             network_context=context.get('network', {})
         )
     
+    def calculate_scores_vectorized(
+        self,
+        entities: List[Dict[str, Any]],
+        contexts: Optional[List[Dict[str, Any]]] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score a batch of entities as one (entities x rules) matrix.
+        
+        Produces the same overall scores as calculate_score() without
+        building a RiskScore per entity.
+        
+        Returns:
+            (overall scores, number of contributing factors) per entity
+        """
+        contexts = contexts or [{}] * len(entities)
+        if not entities:
+            return np.zeros(0), np.zeros(0, dtype=int)
+        
+        factor_scores = np.column_stack(
+            [rule.evaluate_batch(entities, contexts) for rule in self.rules]
+        )
+        weights = np.array([rule.weight for rule in self.rules])
+        
+        fired = ~np.isnan(factor_scores)
+        total_weight = fired @ weights
+        weighted_sum = np.where(fired, factor_scores, 0.0) @ weights
+        overall = np.divide(
+            weighted_sum, total_weight,
+            out=np.zeros(len(entities)),
+            where=total_weight > 0
+        )
+        
+        return np.clip(overall, 0.0, 1.0), fired.sum(axis=1)
+    
     def explain_score(self, risk_score: RiskScore) -> Dict[str, Any]:
         """
         Generate human-readable explanation of risk score.
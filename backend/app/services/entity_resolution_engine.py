@@ -10,11 +10,17 @@ Core technology for resolving entities across multiple data sources using:
 
 import re
 import hashlib
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import math
 from collections import defaultdict
+import numpy as np
+from rapidfuzz import process
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from rapidfuzz.distance import Jaro, JaroWinkler, Levenshtein
 
 
 class MatchType(str, Enum):
@@ -25,7 +31,7 @@ class MatchType(str, Enum):
     SEMANTIC = "semantic"
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityRecord:
     """Represents a record from a source system."""
     id: str
@@ -35,7 +41,7 @@ class EntityRecord:
     raw_data: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ResolvedEntity:
     """A resolved entity combining multiple source records."""
     resolved_id: str
@@ -47,7 +53,7 @@ class ResolvedEntity:
     match_scores: Dict[str, float] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchCandidate:
     """A candidate pair for matching."""
     record_a: EntityRecord
@@ -57,6 +63,23 @@ class MatchCandidate:
     overall_score: float = 0.0
 
 
+# rapidfuzz metrics selectable for batch comparisons, by name
+SIMILARITY_METRICS = {
+    'jaro': Jaro,
+    'jaro_winkler': JaroWinkler,
+    'levenshtein': Levenshtein,
+}
+
+# Names repeat heavily across records, so phonetic codes are memoized
+PHONETIC_CACHE_SIZE = 100_000
+
+
+def clear_phonetic_cache() -> None:
+    """Drop memoized Soundex/Metaphone codes (e.g. in long-running workers)."""
+    BlockingStrategy.soundex.cache_clear()
+    BlockingStrategy.metaphone.cache_clear()
+
+
 class BlockingStrategy:
     """
     Blocking strategies to reduce comparison space.
@@ -66,6 +89,7 @@ class BlockingStrategy:
     """
     
     @staticmethod
+    @lru_cache(maxsize=PHONETIC_CACHE_SIZE)
     def soundex(name: str) -> str:
         """Generate Soundex code for phonetic blocking."""
         if not name:
@@ -97,6 +121,7 @@ class BlockingStrategy:
         return (result + "0000")[:4]
     
     @staticmethod
+    @lru_cache(maxsize=PHONETIC_CACHE_SIZE)
     def metaphone(name: str) -> str:
         """Simplified Metaphone for phonetic blocking."""
         if not name:
@@ -155,106 +180,90 @@ class SimilarityScorer:
     @staticmethod
     def levenshtein_distance(s1: str, s2: str) -> int:
         """Calculate Levenshtein edit distance."""
-        if len(s1) < len(s2):
-            s1, s2 = s2, s1
-        
-        if len(s2) == 0:
-            return len(s1)
-        
-        prev_row = range(len(s2) + 1)
-        for i, c1 in enumerate(s1):
-            curr_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                insertions = prev_row[j + 1] + 1
-                deletions = curr_row[j] + 1
-                substitutions = prev_row[j] + (c1 != c2)
-                curr_row.append(min(insertions, deletions, substitutions))
-            prev_row = curr_row
-        
-        return prev_row[-1]
+        return Levenshtein.distance(s1, s2)
     
     @staticmethod
     def levenshtein_similarity(s1: str, s2: str) -> float:
         """Normalized Levenshtein similarity (0-1)."""
-        if not s1 and not s2:
+        # Identical strings (both empty included)
+        if s1 == s2:
             return 1.0
         if not s1 or not s2:
             return 0.0
         
-        distance = SimilarityScorer.levenshtein_distance(s1.lower(), s2.lower())
-        max_len = max(len(s1), len(s2))
-        return 1.0 - (distance / max_len)
+        return Levenshtein.normalized_similarity(s1, s2, processor=str.lower)
     
     @staticmethod
     def jaro_similarity(s1: str, s2: str) -> float:
-        """Jaro similarity score."""
-        if not s1 and not s2:
+        """
+        Jaro similarity score.
+        
+        Transpositions are counted as half the out-of-order matches rounded
+        down, as in Winkler's reference strcmp95, so an odd number of
+        out-of-order matches scores slightly higher than with exact halving.
+        """
+        # Identical strings (both empty included)
+        if s1 == s2:
             return 1.0
         if not s1 or not s2:
             return 0.0
         
-        s1, s2 = s1.lower(), s2.lower()
-        
-        match_distance = max(len(s1), len(s2)) // 2 - 1
-        if match_distance < 0:
-            match_distance = 0
-        
-        s1_matches = [False] * len(s1)
-        s2_matches = [False] * len(s2)
-        
-        matches = 0
-        transpositions = 0
-        
-        for i, c1 in enumerate(s1):
-            start = max(0, i - match_distance)
-            end = min(i + match_distance + 1, len(s2))
-            
-            for j in range(start, end):
-                if s2_matches[j] or c1 != s2[j]:
-                    continue
-                s1_matches[i] = True
-                s2_matches[j] = True
-                matches += 1
-                break
+        return Jaro.similarity(s1, s2, processor=str.lower)
+    
+    @staticmethod
+    def jaro_winkler_similarity(s1: str, s2: str, p: float = 0.1) -> float:
+        """
+        Jaro-Winkler similarity (gives higher scores to strings with common prefix).
         
-        if matches == 0:
+        As in Winkler's reference strcmp95, the common-prefix boost (up to 4
+        characters) is only applied once the Jaro score exceeds 0.7, so weak
+        matches are not lifted by a shared initial.
+        """
+        # Identical strings (both empty included)
+        if s1 == s2:
+            return 1.0
+        if not s1 or not s2:
             return 0.0
         
-        k = 0
-        for i, c1 in enumerate(s1):
-            if not s1_matches[i]:
-                continue
-            while not s2_matches[k]:
-                k += 1
-            if c1 != s2[k]:
-                transpositions += 1
-            k += 1
-        
-        jaro = (matches / len(s1) + matches / len(s2) + 
-                (matches - transpositions / 2) / matches) / 3
-        
-        return jaro
+        return JaroWinkler.similarity(s1, s2, prefix_weight=p, processor=str.lower)
     
     @staticmethod
-    def jaro_winkler_similarity(s1: str, s2: str, p: float = 0.1) -> float:
-        """Jaro-Winkler similarity (gives higher scores to strings with common prefix)."""
-        jaro = SimilarityScorer.jaro_similarity(s1, s2)
-        
-        # Find common prefix length (max 4)
-        prefix_len = 0
-        s1_lower, s2_lower = s1.lower(), s2.lower()
-        for i in range(min(len(s1), len(s2), 4)):
-            if s1_lower[i] == s2_lower[i]:
-                prefix_len += 1
-            else:
-                break
-        
-        return jaro + prefix_len * p * (1 - jaro)
+    def batch_jaro_winkler(query: str, candidates: List[str]) -> np.ndarray:
+        """Jaro-Winkler similarity of ``query`` against every candidate in one pass."""
+        return process.cdist(
+            [query], candidates,
+            scorer=JaroWinkler.similarity,
+            processor=str.lower,
+            dtype=np.float64,
+            workers=-1
+        )[0]
+    
+    @staticmethod
+    def similarity_matrix(
+        names: List[str],
+        metric=JaroWinkler,
+        candidates: Optional[List[str]] = None
+    ) -> np.ndarray:
+        """
+        Pairwise similarity matrix for a block of names.
+        
+        ``metric`` is a rapidfuzz.distance module; its normalized similarity
+        is computed for all pairs in a single native call. Rows are ``names``
+        and columns are ``candidates`` (``names`` itself when omitted).
+        """
+        return process.cdist(
+            names, names if candidates is None else candidates,
+            scorer=metric.normalized_similarity,
+            processor=str.lower,
+            dtype=np.float64,
+            workers=-1
+        )
     
     @staticmethod
     def jaccard_similarity(s1: str, s2: str, ngram: int = 2) -> float:
         """Jaccard similarity using character n-grams."""
-        if not s1 and not s2:
+        # Identical strings (both empty included)
+        if s1 == s2:
             return 1.0
         if not s1 or not s2:
             return 0.0
@@ -276,7 +285,8 @@ class SimilarityScorer:
     @staticmethod
     def token_based_similarity(s1: str, s2: str) -> float:
         """Token-based similarity (good for reordered names)."""
-        if not s1 and not s2:
+        # Identical strings (both empty included)
+        if s1 == s2:
             return 1.0
         if not s1 or not s2:
             return 0.0
@@ -306,14 +316,32 @@ class SimilarityScorer:
         return matches / 4.0
     
     @staticmethod
-    def composite_name_score(name1: str, name2: str) -> float:
+    def composite_name_score(
+        name1: str,
+        name2: str,
+        precomputed: Optional[Dict[str, float]] = None
+    ) -> float:
         """
         Composite scoring for names using multiple algorithms.
         Weighted combination of different similarity measures.
+        
+        ``precomputed`` may carry 'jaro_winkler' / 'levenshtein' scores taken
+        from a block similarity matrix so they are not recomputed per pair.
         """
+        if name1 == name2:
+            return 1.0
+        
+        precomputed = precomputed or {}
+        jaro_winkler = precomputed.get('jaro_winkler')
+        if jaro_winkler is None:
+            jaro_winkler = SimilarityScorer.jaro_winkler_similarity(name1, name2)
+        levenshtein = precomputed.get('levenshtein')
+        if levenshtein is None:
+            levenshtein = SimilarityScorer.levenshtein_similarity(name1, name2)
+        
         scores = {
-            'jaro_winkler': SimilarityScorer.jaro_winkler_similarity(name1, name2),
-            'levenshtein': SimilarityScorer.levenshtein_similarity(name1, name2),
+            'jaro_winkler': jaro_winkler,
+            'levenshtein': levenshtein,
             'jaccard': SimilarityScorer.jaccard_similarity(name1, name2),
             'token': SimilarityScorer.token_based_similarity(name1, name2),
             'phonetic': SimilarityScorer.phonetic_similarity(name1, name2),
@@ -332,6 +360,12 @@ class SimilarityScorer:
         return weighted_score
 
 
+# Neighbours fetched per record by the "ann" blocking strategy
+ANN_NEIGHBOURS = 50
+# Dimension of the hashed character n-gram vectors indexed for ANN blocking
+ANN_FEATURES = 1024
+
+
 class EntityResolutionEngine:
     """
     FTex Entity Resolution Engine.
@@ -354,6 +388,10 @@ class EntityResolutionEngine:
         self.blocking_strategies = blocking_strategies or ['soundex', 'ngram']
         self.scorer = SimilarityScorer()
         self.blocker = BlockingStrategy()
+        # Built on first use by the "ann" strategy
+        self._ann_vectorizer = None
+        self._ann_index = None
+        self._ann_key: Tuple[Tuple[str, str], ...] = ()
     
     def standardize_record(self, record: EntityRecord) -> EntityRecord:
         """
@@ -418,10 +456,63 @@ class EntityResolutionEngine:
         
         return keys
     
+    def ann_candidates(
+        self,
+        records: List[EntityRecord],
+        k: int = ANN_NEIGHBOURS,
+        names: Optional[List[str]] = None
+    ) -> List[List[int]]:
+        """
+        Approximate nearest-neighbour blocking.
+        
+        Names are embedded as hashed character n-gram vectors and indexed in
+        an HNSW graph; each record's candidates are its ``k`` nearest
+        neighbours by cosine similarity. This keeps the candidate set at
+        O(n·k) where key-based blocks grow quadratically. The index is kept
+        on the engine and reused while the record set is unchanged.
+        """
+        if len(records) < 2:
+            return [[] for _ in records]
+        
+        # Optional dependency, only needed for this strategy
+        import hnswlib
+        from sklearn.feature_extraction.text import HashingVectorizer
+        
+        if self._ann_vectorizer is None:
+            self._ann_vectorizer = HashingVectorizer(
+                analyzer='char_wb',
+                ngram_range=(2, 3),
+                n_features=ANN_FEATURES,
+                alternate_sign=False
+            )
+        
+        if names is None:
+            names = [self._match_name(r) for r in records]
+        names = [name.lower() for name in names]
+        vectors = self._ann_vectorizer.transform(names).toarray().astype(np.float32)
+        
+        key = tuple(zip((r.id for r in records), names))
+        if self._ann_index is None or key != self._ann_key:
+            index = hnswlib.Index(space='cosine', dim=ANN_FEATURES)
+            index.init_index(max_elements=len(records), ef_construction=200, M=16)
+            index.add_items(vectors, np.arange(len(records)))
+            self._ann_index, self._ann_key = index, key
+        
+        k = min(k + 1, len(records))
+        self._ann_index.set_ef(max(k, ANN_NEIGHBOURS))
+        labels, _ = self._ann_index.knn_query(vectors, k=k)
+        
+        return [[j for j in row if j != i] for i, row in enumerate(labels.tolist())]
+    
+    @staticmethod
+    def _match_name(record: EntityRecord) -> str:
+        return record.attributes.get('name_standardized') or record.attributes.get('name', '')
+    
     def score_candidate_pair(
         self, 
         record_a: EntityRecord, 
-        record_b: EntityRecord
+        record_b: EntityRecord,
+        name_scores: Optional[Dict[str, float]] = None
     ) -> MatchCandidate:
         """
         Score a candidate pair using multiple attributes.
@@ -429,11 +520,11 @@ class EntityResolutionEngine:
         scores = {}
         
         # Name matching
-        name_a = record_a.attributes.get('name_standardized') or record_a.attributes.get('name', '')
-        name_b = record_b.attributes.get('name_standardized') or record_b.attributes.get('name', '')
+        name_a = self._match_name(record_a)
+        name_b = self._match_name(record_b)
         
         if name_a and name_b:
-            scores['name'] = self.scorer.composite_name_score(name_a, name_b)
+            scores['name'] = self.scorer.composite_name_score(name_a, name_b, name_scores)
         
         # Date of birth matching
         dob_a = record_a.attributes.get('date_of_birth')
@@ -486,46 +577,37 @@ class EntityResolutionEngine:
         matches: List[MatchCandidate]
     ) -> List[List[EntityRecord]]:
         """
-        Cluster matched records using Union-Find algorithm.
-        Creates connected components of matched entities.
+        Cluster matched records into connected components.
+        
+        Pairs below the match threshold are dropped first; the remaining
+        edges form a sparse graph whose components are labelled by SciPy's
+        compiled connected-components routine.
         """
-        # Build adjacency from matches
-        parent = {}
-        rank = {}
-        
-        def find(x):
-            if x not in parent:
-                parent[x] = x
-                rank[x] = 0
-            if parent[x] != x:
-                parent[x] = find(parent[x])
-            return parent[x]
-        
-        def union(x, y):
-            px, py = find(x), find(y)
-            if px == py:
-                return
-            if rank[px] < rank[py]:
-                px, py = py, px
-            parent[py] = px
-            if rank[px] == rank[py]:
-                rank[px] += 1
-        
-        # Union matched pairs
-        all_records = {}
-        for match in matches:
-            if match.overall_score >= self.match_threshold:
-                id_a = match.record_a.id
-                id_b = match.record_b.id
-                union(id_a, id_b)
-                all_records[id_a] = match.record_a
-                all_records[id_b] = match.record_b
+        edges = [m for m in matches if m.overall_score >= self.match_threshold]
+        if not edges:
+            return []
+        
+        # Number the matched records
+        index: Dict[str, int] = {}
+        records: List[EntityRecord] = []
+        for match in edges:
+            for record in (match.record_a, match.record_b):
+                if record.id not in index:
+                    index[record.id] = len(records)
+                    records.append(record)
+        
+        src = np.fromiter((index[m.record_a.id] for m in edges), dtype=np.int32, count=len(edges))
+        dst = np.fromiter((index[m.record_b.id] for m in edges), dtype=np.int32, count=len(edges))
+        graph = coo_matrix(
+            (np.ones(len(edges), dtype=np.int8), (src, dst)),
+            shape=(len(records), len(records))
+        )
+        _, labels = connected_components(graph, directed=False)
         
         # Group by cluster
         clusters = defaultdict(list)
-        for record_id, record in all_records.items():
-            root = find(record_id)
-            clusters[root].append(record)
+        for label, record in zip(labels.tolist(), records):
+            clusters[label].append(record)
         
         return list(clusters.values())
     
@@ -590,30 +672,68 @@ class EntityResolutionEngine:
         """
         # Step 1: Standardize
         standardized = [self.standardize_record(r) for r in records]
+        # Match names as one column, read by blocking and every scoring call
+        names = [self._match_name(r) for r in standardized]
+        name_lengths = [len(name) for name in names]
         
-        # Step 2: Generate blocking keys and index
+        # Step 2: Generate blocking keys and index (record positions per key)
         block_index = defaultdict(list)
-        for record in standardized:
-            keys = self.generate_blocking_keys(record)
-            for key in keys:
-                block_index[key].append(record)
+        for position, record in enumerate(standardized):
+            for key in self.generate_blocking_keys(record):
+                block_index[key].append(position)
         
         # Step 3 & 4: Generate and score candidates
         scored_pairs = []
         seen_pairs = set()
         
-        for block_key, block_records in block_index.items():
-            # Compare all pairs within block
-            for i, record_a in enumerate(block_records):
-                for record_b in block_records[i+1:]:
-                    pair_key = tuple(sorted([record_a.id, record_b.id]))
-                    if pair_key in seen_pairs:
-                        continue
-                    seen_pairs.add(pair_key)
-                    
-                    candidate = self.score_candidate_pair(record_a, record_b)
-                    candidate.blocking_key = block_key
-                    scored_pairs.append(candidate)
+        def add_candidate(a, b, block_key, jaro_winkler, levenshtein):
+            pair_key = (a, b) if a < b else (b, a)
+            if pair_key in seen_pairs:
+                return
+            seen_pairs.add(pair_key)
+            
+            candidate = self.score_candidate_pair(
+                standardized[a],
+                standardized[b],
+                name_scores={'jaro_winkler': jaro_winkler, 'levenshtein': levenshtein}
+            )
+            candidate.blocking_key = block_key
+            scored_pairs.append(candidate)
+        
+        for block_key, block in block_index.items():
+            if len(block) < 2:
+                continue
+            
+            # Order by name length so rapidfuzz's SIMD kernels pack strings of
+            # similar length into the same lanes; the set of pairs is unchanged
+            block = sorted(block, key=name_lengths.__getitem__)
+            
+            # Edit-distance scores for the whole block in one native call each
+            block_names = [names[p] for p in block]
+            jaro_winkler = self.scorer.similarity_matrix(block_names, JaroWinkler).tolist()
+            levenshtein = self.scorer.similarity_matrix(block_names, Levenshtein).tolist()
+            
+            # Compare all pairs within block (upper triangle)
+            rows, cols = np.triu_indices(len(block), k=1)
+            for i, j in zip(rows.tolist(), cols.tolist()):
+                add_candidate(
+                    block[i], block[j], block_key,
+                    jaro_winkler[i][j], levenshtein[i][j]
+                )
+        
+        if 'ann' in self.blocking_strategies:
+            # Compare each record with its nearest neighbours only
+            for a, neighbours in enumerate(self.ann_candidates(standardized, names=names)):
+                if not neighbours:
+                    continue
+                neighbours = sorted(neighbours, key=name_lengths.__getitem__)
+                query = [names[a]]
+                candidates = [names[b] for b in neighbours]
+                jaro_winkler = self.scorer.similarity_matrix(query, JaroWinkler, candidates)[0].tolist()
+                levenshtein = self.scorer.similarity_matrix(query, Levenshtein, candidates)[0].tolist()
+                
+                for b, jw, lev in zip(neighbours, jaro_winkler, levenshtein):
+                    add_candidate(a, b, "ann", jw, lev)
         
         # Step 5: Cluster matches
         clusters = self.cluster_matches(scored_pairs)
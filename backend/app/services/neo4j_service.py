@@ -2,6 +2,7 @@
 Neo4j service for graph-based entity resolution and analytics.
 """
 
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from neo4j import AsyncGraphDatabase
 from app.core.config import settings
@@ -26,8 +27,21 @@ class Neo4jService:
         """Close the Neo4j driver."""
         await self.driver.close()
     
-    async def create_entity_node(self, entity) -> str:
-        """Create an entity node in the graph."""
+    async def create_entity_node(
+        self,
+        entity_id: str,
+        name: str,
+        entity_type: str,
+        risk_score: float = 0.0,
+        is_sanctioned: bool = False,
+        is_pep: bool = False
+    ) -> str:
+        """
+        Create an entity node in the graph.
+        
+        Takes plain values rather than an ORM instance so it can run after
+        the request session is gone (e.g. as a background task).
+        """
         async with self.driver.session() as session:
             query = """
             CREATE (e:Entity {
@@ -42,12 +56,12 @@ class Neo4jService:
             """
             result = await session.run(
                 query,
-                id=entity.id,
-                name=entity.name,
-                entity_type=entity.entity_type.value,
-                risk_score=entity.risk_score,
-                is_sanctioned=bool(entity.is_sanctioned),
-                is_pep=bool(entity.is_pep)
+                id=entity_id,
+                name=name,
+                entity_type=entity_type,
+                risk_score=risk_score,
+                is_sanctioned=is_sanctioned,
+                is_pep=is_pep
             )
             record = await result.single()
             return record["node_id"] if record else None
@@ -84,6 +98,9 @@ class Neo4jService:
             WITH nodes(p) as ns, relationships(p) as rs
             UNWIND ns as n
             WITH collect(distinct n) as nodes, collect(distinct rs) as rels
+            // Trim and flatten server-side so only what is returned crosses the wire
+            WITH nodes[..$limit] as nodes,
+                 reduce(acc = [], r in rels | acc + r)[..$edge_limit] as edges
             RETURN 
                 [n in nodes | {{
                     id: n.id, 
@@ -91,27 +108,24 @@ class Neo4jService:
                     type: n.entity_type,
                     risk_score: n.risk_score
                 }}] as nodes,
-                [r in rels | [rel in r | {{
+                [rel in edges | {{
                     source: startNode(rel).id,
                     target: endNode(rel).id,
                     type: type(rel)
-                }}]] as edges
+                }}] as edges
             LIMIT 1
             """
-            result = await session.run(query, entity_id=entity_id)
+            result = await session.run(
+                query, entity_id=entity_id, limit=limit, edge_limit=limit * 2
+            )
             record = await result.single()
             
             if not record:
                 return {"nodes": [], "edges": []}
             
-            # Flatten edges list
-            edges = []
-            for edge_group in record["edges"]:
-                edges.extend(edge_group)
-            
             return {
-                "nodes": record["nodes"][:limit],
-                "edges": edges[:limit * 2]
+                "nodes": record["nodes"],
+                "edges": record["edges"]
             }
     
     async def find_shortest_path(
@@ -249,31 +263,122 @@ class Neo4jService:
         entity_id: str, 
         depth: int = 3
     ) -> Dict[str, Any]:
-        """Analyze how risk propagates through the network."""
+        """
+        Analyze how risk propagates through the network.
+        
+        APOC expands breadth-first with global node uniqueness, so each
+        affected entity is reached once, at its shortest distance, instead
+        of once per path.
+        """
         async with self.driver.session() as session:
-            query = f"""
-            MATCH path = (source:Entity {{id: $entity_id}})-[*1..{depth}]-(affected)
-            WHERE affected.id <> $entity_id
-            WITH affected, 
-                 length(path) as distance,
-                 source.risk_score as source_risk
+            query = """
+            MATCH (source:Entity {id: $entity_id})
+            CALL apoc.path.expandConfig(source, {
+                minLevel: 1,
+                maxLevel: $depth,
+                bfs: true,
+                uniqueness: 'NODE_GLOBAL'
+            })
+            YIELD path
+            WITH source, last(nodes(path)) as affected, length(path) as distance
             RETURN 
                 affected.id as id,
                 affected.name as name,
                 affected.entity_type as type,
                 affected.risk_score as current_risk,
                 distance,
-                source_risk * (1.0 / distance) as propagated_risk
+                source.risk_score * (1.0 / distance) as propagated_risk
             ORDER BY propagated_risk DESC
             LIMIT 50
             """
-            result = await session.run(query, entity_id=entity_id)
+            result = await session.run(query, entity_id=entity_id, depth=depth)
             records = await result.data()
             return {
                 "source_entity": entity_id,
                 "affected_entities": records
             }
     
+    async def find_weighted_path(
+        self,
+        source_id: str,
+        target_id: str,
+        max_depth: int = 6
+    ) -> Dict[str, Any]:
+        """
+        Cheapest path between two entities by relationship weight (default 1.0).
+        
+        Dijkstra has no hop limit, so when the cheapest path is longer than
+        ``max_depth`` the fewest-hop path within ``max_depth`` is returned
+        instead, with its own total weight.
+        """
+        returns = """
+            RETURN 
+                [n in nodes(path) | {id: n.id, name: n.name, type: n.entity_type}] as nodes,
+                [r in relationships(path) | {type: type(r)}] as relationships,
+                length(path) as path_length,
+                weight
+            LIMIT 1
+        """
+        async with self.driver.session() as session:
+            query = """
+            MATCH (source:Entity {id: $source_id}), (target:Entity {id: $target_id})
+            CALL apoc.algo.dijkstra(source, target, '', 'weight', 1.0)
+            YIELD path, weight
+            """ + returns
+            result = await session.run(query, source_id=source_id, target_id=target_id)
+            record = await result.single()
+            
+            if record and record["path_length"] > max_depth:
+                query = f"""
+                MATCH path = shortestPath(
+                    (source:Entity {{id: $source_id}})-[*1..{max_depth}]-(target:Entity {{id: $target_id}})
+                )
+                WITH path, reduce(w = 0.0, r in relationships(path) | w + coalesce(r.weight, 1.0)) as weight
+                """ + returns
+                result = await session.run(query, source_id=source_id, target_id=target_id)
+                record = await result.single()
+            
+            if not record:
+                return {"nodes": [], "relationships": [], "length": -1}
+            
+            return {
+                "nodes": record["nodes"],
+                "relationships": record["relationships"],
+                "length": record["path_length"],
+                "weight": record["weight"]
+            }
+    
+    async def get_entity_metrics(self, entity_id: str) -> Dict[str, Any]:
+        """Degree, local clustering coefficient and neighbour risk for an entity."""
+        async with self.driver.session() as session:
+            query = """
+            MATCH (e:Entity {id: $entity_id})
+            OPTIONAL MATCH (e)--(n)
+            WITH e, collect(DISTINCT n) as neighbours
+            // Links among the neighbours, expanded from each neighbour rather
+            // than scanned across the graph; the aggregating subquery yields
+            // links = 0 when there are none
+            CALL {
+                WITH neighbours
+                UNWIND neighbours as a
+                MATCH (a)--(b)
+                WHERE b IN neighbours AND elementId(a) < elementId(b)
+                RETURN count(DISTINCT [a, b]) as links
+            }
+            WITH neighbours, size(neighbours) as k, links
+            RETURN 
+                k as degree,
+                CASE WHEN k < 2 THEN 0.0 ELSE 2.0 * links / (k * (k - 1)) END as clustering,
+                reduce(total = 0.0, n IN neighbours | total + coalesce(n.risk_score, 0.0)) as risk_exposure
+            """
+            result = await session.run(query, entity_id=entity_id)
+            record = await result.single()
+            
+            if not record:
+                return {"degree": 0, "clustering": 0.0, "risk_exposure": 0.0}
+            
+            return record.data()
+    
     async def get_transaction_flow(
         self,
         entity_id: str,
@@ -308,3 +413,8 @@ class Neo4jService:
                 "flows": records
             }
 
+
+@lru_cache(maxsize=1)
+def get_neo4j_service() -> Neo4jService:
+    """Process-wide Neo4j service, so requests share one driver and its pool."""
+    return Neo4jService()
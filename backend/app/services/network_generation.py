@@ -16,7 +16,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 import hashlib
-from collections import defaultdict
+from collections import Counter, defaultdict
+from functools import lru_cache
 
 
 class RelationshipType(str, Enum):
@@ -57,6 +58,18 @@ class RelationshipType(str, Enum):
     POTENTIAL_DUPLICATE = "POTENTIAL_DUPLICATE"
 
 
+# Value -> member lookup for coercing raw relationship strings in bulk
+RELATIONSHIP_TYPES: Dict[str, RelationshipType] = {t.value: t for t in RelationshipType}
+
+
+@lru_cache(maxsize=65536)
+def edge_id_for(source_id: str, target_id: str, relationship_type: RelationshipType) -> str:
+    """Deterministic edge ID; memoized since the same pairs recur across transactions."""
+    return hashlib.md5(
+        f"{source_id}_{target_id}_{relationship_type.value}".encode()
+    ).hexdigest()[:16]
+
+
 @dataclass
 class NetworkNode:
     """A node in the knowledge graph."""
@@ -93,14 +106,39 @@ class Network:
     """A knowledge graph network."""
     nodes: Dict[str, NetworkNode] = field(default_factory=dict)
     edges: Dict[str, NetworkEdge] = field(default_factory=dict)
+    # node_id -> {edge_id: edge} for every edge touching the node, so
+    # traversals visit a node's own edges instead of scanning all edges
+    adjacency: Dict[str, Dict[str, NetworkEdge]] = field(
+        default_factory=lambda: defaultdict(dict), repr=False
+    )
     
     def add_node(self, node: NetworkNode) -> None:
         """Add a node to the network."""
         self.nodes[node.id] = node
     
+    def add_nodes(self, nodes: List[NetworkNode]) -> None:
+        """Add many nodes; later nodes replace earlier ones with the same ID."""
+        self.nodes.update((node.id, node) for node in nodes)
+    
     def add_edge(self, edge: NetworkEdge) -> None:
         """Add an edge to the network."""
+        previous = self.edges.get(edge.id)
+        if previous is not None:
+            self.adjacency[previous.source_id].pop(edge.id, None)
+            self.adjacency[previous.target_id].pop(edge.id, None)
+        
         self.edges[edge.id] = edge
+        self.adjacency[edge.source_id][edge.id] = edge
+        self.adjacency[edge.target_id][edge.id] = edge
+    
+    def add_edges(self, edges: List[NetworkEdge]) -> None:
+        """Add many edges; later edges replace earlier ones with the same ID."""
+        for edge in edges:
+            self.add_edge(edge)
+    
+    def edges_of(self, node_id: str) -> List[NetworkEdge]:
+        """Edges with ``node_id`` at either end."""
+        return list(self.adjacency.get(node_id, {}).values())
     
     def get_neighbors(self, node_id: str, depth: int = 1) -> Set[str]:
         """Get neighboring node IDs up to specified depth."""
@@ -113,7 +151,7 @@ class Network:
         for _ in range(depth):
             next_level = set()
             for nid in current_level:
-                for edge in self.edges.values():
+                for edge in self.edges_of(nid):
                     if edge.source_id == nid and edge.target_id not in neighbors:
                         next_level.add(edge.target_id)
                         neighbors.add(edge.target_id)
@@ -322,12 +360,8 @@ class NetworkGenerationEngine:
         confidence: float = 1.0
     ) -> NetworkEdge:
         """Create an edge between two nodes."""
-        edge_id = hashlib.md5(
-            f"{source_id}_{target_id}_{relationship_type.value}".encode()
-        ).hexdigest()[:16]
-        
         edge = NetworkEdge(
-            id=edge_id,
+            id=edge_id_for(source_id, target_id, relationship_type),
             source_id=source_id,
             target_id=target_id,
             relationship_type=relationship_type,
@@ -338,6 +372,51 @@ class NetworkGenerationEngine:
         self.network.add_edge(edge)
         return edge
     
+    def bulk_load(
+        self,
+        nodes: List[Dict[str, Any]],
+        edges: List[Dict[str, Any]]
+    ) -> Tuple[List[NetworkNode], List[NetworkEdge]]:
+        """
+        Load nodes and explicit edges in one pass each.
+        
+        Equivalent to calling create_node_from_entity / create_edge per item
+        but without the per-call overhead, for graphs of many thousands of
+        nodes. Node dicts carry ``id``, ``entity_type``, ``name`` and optional
+        ``attributes``/``risk_score``/``source_systems``; edge dicts carry
+        ``source_id``, ``target_id``, ``relationship_type`` and optional
+        ``attributes``/``weight``/``confidence``. Unknown relationship types
+        fall back to RELATED_TO.
+        """
+        new_nodes = [
+            NetworkNode(
+                id=node['id'],
+                node_type=node['entity_type'],
+                label=node['name'],
+                attributes=node.get('attributes') or {},
+                risk_score=node.get('risk_score', 0.0),
+                source_systems=node.get('source_systems') or []
+            )
+            for node in nodes
+        ]
+        self.network.add_nodes(new_nodes)
+        
+        new_edges = []
+        for edge in edges:
+            rel_type = RELATIONSHIP_TYPES.get(edge['relationship_type'], RelationshipType.RELATED_TO)
+            new_edges.append(NetworkEdge(
+                id=edge_id_for(edge['source_id'], edge['target_id'], rel_type),
+                source_id=edge['source_id'],
+                target_id=edge['target_id'],
+                relationship_type=rel_type,
+                weight=edge.get('weight', 1.0),
+                confidence=edge.get('confidence', 1.0),
+                attributes=edge.get('attributes') or {}
+            ))
+        self.network.add_edges(new_edges)
+        
+        return new_nodes, new_edges
+    
     def extract_relationships_from_transactions(
         self,
         transactions: List[Dict[str, Any]]
@@ -347,30 +426,27 @@ class NetworkGenerationEngine:
         
         Creates SENT_TO/RECEIVED_FROM edges between entities.
         """
-        edges = []
-        
-        for tx in transactions:
-            sender_id = tx.get('sender_entity_id')
-            receiver_id = tx.get('receiver_entity_id')
-            
-            if not sender_id or not receiver_id:
-                continue
-            
-            # Create directed edge from sender to receiver
-            edge = self.create_edge(
+        # Directed edge from sender to receiver, for transactions naming both
+        edges = [
+            NetworkEdge(
+                id=edge_id_for(sender_id, receiver_id, RelationshipType.SENT_TO),
                 source_id=sender_id,
                 target_id=receiver_id,
                 relationship_type=RelationshipType.SENT_TO,
+                weight=tx.get('amount', 1.0),
                 attributes={
                     'transaction_id': tx.get('id'),
                     'amount': tx.get('amount'),
                     'currency': tx.get('currency'),
                     'date': tx.get('transaction_date')
-                },
-                weight=tx.get('amount', 1.0)
+                }
             )
-            edges.append(edge)
+            for tx in transactions
+            if (sender_id := tx.get('sender_entity_id'))
+            and (receiver_id := tx.get('receiver_entity_id'))
+        ]
         
+        self.network.add_edges(edges)
         return edges
     
     def extract_relationships_from_corporate_data(
@@ -482,7 +558,7 @@ class NetworkGenerationEngine:
             next_level = set()
             
             for node_id in current_level:
-                for edge in self.network.edges.values():
+                for edge in self.network.edges_of(node_id):
                     neighbor_id = None
                     if edge.source_id == node_id:
                         neighbor_id = edge.target_id
@@ -514,8 +590,9 @@ class NetworkGenerationEngine:
             return {}
         
         # Degree centrality
-        in_degree = sum(1 for e in self.network.edges.values() if e.target_id == node_id)
-        out_degree = sum(1 for e in self.network.edges.values() if e.source_id == node_id)
+        node_edges = self.network.edges_of(node_id)
+        in_degree = sum(1 for e in node_edges if e.target_id == node_id)
+        out_degree = sum(1 for e in node_edges if e.source_id == node_id)
         total_degree = in_degree + out_degree
         
         # Get neighbors
@@ -536,12 +613,11 @@ class NetworkGenerationEngine:
             neighbor_edges = 0
             neighbor_list = list(neighbors)
             for i, n1 in enumerate(neighbor_list):
-                for n2 in neighbor_list[i+1:]:
-                    for e in self.network.edges.values():
-                        if (e.source_id == n1 and e.target_id == n2) or \
-                           (e.source_id == n2 and e.target_id == n1):
-                            neighbor_edges += 1
-                            break
+                linked = {
+                    e.target_id if e.source_id == n1 else e.source_id
+                    for e in self.network.edges_of(n1)
+                }
+                neighbor_edges += sum(1 for n2 in neighbor_list[i+1:] if n2 in linked)
             
             max_edges = len(neighbors) * (len(neighbors) - 1) / 2
             clustering = neighbor_edges / max_edges if max_edges > 0 else 0.0
@@ -560,14 +636,10 @@ class NetworkGenerationEngine:
         return {
             'node_count': len(self.network.nodes),
             'edge_count': len(self.network.edges),
-            'node_types': dict(defaultdict(int, {
-                n.node_type: sum(1 for x in self.network.nodes.values() if x.node_type == n.node_type)
-                for n in self.network.nodes.values()
-            })),
-            'relationship_types': dict(defaultdict(int, {
-                e.relationship_type.value: sum(1 for x in self.network.edges.values() if x.relationship_type == e.relationship_type)
-                for e in self.network.edges.values()
-            })),
+            'node_types': dict(Counter(n.node_type for n in self.network.nodes.values())),
+            'relationship_types': dict(Counter(
+                e.relationship_type.value for e in self.network.edges.values()
+            )),
             'avg_risk_score': sum(n.risk_score for n in self.network.nodes.values()) / len(self.network.nodes) if self.network.nodes else 0,
             'high_risk_nodes': sum(1 for n in self.network.nodes.values() if n.risk_score >= 0.7)
         }
@@ -2,9 +2,218 @@
 OpenSearch service for full-text search and analytics.
 """
 
-from typing import List, Dict, Any, Optional
+import asyncio
+import json
+import re
+from functools import lru_cache
+from typing import Awaitable, Callable, List, Dict, Any, Optional, Set
 from opensearchpy import AsyncOpenSearch
 from app.core.config import settings
+from app.core.cache import bump_generation
+
+
+# Generation scope of cached search results; index writes bump it
+SEARCH_CACHE_GENERATION = "search"
+
+# Fields returned per search hit; the rest of each document stays on the
+# cluster instead of being shipped and serialized
+SEARCH_RESULT_FIELDS = {
+    "entities": ["id", "name", "entity_type", "risk_score", "is_sanctioned", "is_pep"],
+    "transactions": [
+        "id", "transaction_type", "reference_number", "amount", "currency",
+        "description", "risk_score", "transaction_date"
+    ],
+    "alerts": ["id", "alert_type", "category", "severity", "status", "title", "detected_at"],
+}
+
+# Totals are exact up to this many hits and reported as a lower bound beyond
+SEARCH_TOTAL_HITS_LIMIT = 10_000
+
+
+# Error type OpenSearch reports when a stored search template is missing,
+# e.g. after the cluster was rebuilt
+MISSING_TEMPLATE_ERROR = "resource_not_found_exception"
+
+
+def _template_source(body: Dict[str, Any]) -> str:
+    """JSON-encode a query body, unquoting the Mustache placeholders in it."""
+    return re.sub(r'"(\{\{[^"]*\}\})"', r"\1", json.dumps(body))
+
+
+# Query bodies stored on the cluster as Mustache search templates, so each
+# request sends only its parameters. ``q`` and the filter lists go through
+# toJson, which takes care of quoting and escaping.
+SEARCH_TEMPLATES = {
+    "entities_search": _template_source({
+        "query": {
+            "bool": {
+                "must": [
+                    {
+                        "multi_match": {
+                            "query": "{{#toJson}}q{{/toJson}}",
+                            "fields": ["name^3", "attributes.*"],
+                            "fuzziness": "AUTO"
+                        }
+                    }
+                ],
+                "filter": "{{#toJson}}filters{{/toJson}}"
+            }
+        },
+        "from": "{{from}}",
+        "size": "{{size}}",
+        "sort": [{"risk_score": "desc"}, "_score"],
+        "_source": {"includes": SEARCH_RESULT_FIELDS["entities"]},
+        "track_total_hits": SEARCH_TOTAL_HITS_LIMIT
+    }),
+    "transactions_search": _template_source({
+        "query": {
+            "bool": {
+                "must": [
+                    {
+                        "multi_match": {
+                            "query": "{{#toJson}}q{{/toJson}}",
+                            "fields": ["description", "reference_number"]
+                        }
+                    }
+                ],
+                "filter": "{{#toJson}}filters{{/toJson}}"
+            }
+        },
+        "from": "{{from}}",
+        "size": "{{size}}",
+        "_source": {"includes": SEARCH_RESULT_FIELDS["transactions"]},
+        "track_total_hits": SEARCH_TOTAL_HITS_LIMIT
+    }),
+    "alerts_search": _template_source({
+        "query": {
+            "bool": {
+                "must": [
+                    {
+                        "multi_match": {
+                            "query": "{{#toJson}}q{{/toJson}}",
+                            "fields": ["title^2", "description"]
+                        }
+                    }
+                ],
+                "filter": "{{#toJson}}filters{{/toJson}}"
+            }
+        },
+        "from": "{{from}}",
+        "size": "{{size}}",
+        "_source": {"includes": SEARCH_RESULT_FIELDS["alerts"]},
+        "track_total_hits": SEARCH_TOTAL_HITS_LIMIT
+    }),
+    "global_search": _template_source({
+        "query": {
+            "multi_match": {
+                "query": "{{#toJson}}q{{/toJson}}",
+                "fields": ["*"]
+            }
+        },
+        "from": "{{from}}",
+        "size": "{{size}}",
+        "_source": {"includes": "{{#toJson}}fields{{/toJson}}"},
+        "track_total_hits": False
+    }),
+    "suggest": _template_source({
+        "query": {
+            "prefix": {
+                "name.keyword": {
+                    "value": "{{#toJson}}q{{/toJson}}"
+                }
+            }
+        },
+        "size": "{{size}}",
+        "_source": ["name"]
+    }),
+}
+
+
+class MultiSearchBatcher:
+    """
+    Coalesces concurrent templated searches into shared _msearch/template
+    requests.
+    
+    Searches submitted within ``max_wait`` seconds of the first one, up to
+    ``max_batch`` of them, go out as one multi-search and each caller gets
+    its own response back. Until start() is called, searches are sent
+    directly.
+    """
+    
+    def __init__(self, client: AsyncOpenSearch, max_batch: int, max_wait: float):
+        self.client = client
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+        self._dispatches: Set[asyncio.Task] = set()
+    
+    def start(self):
+        """Start the background consumer on the running event loop."""
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """Stop collecting batches and drop any in-flight dispatches."""
+        tasks = list(self._dispatches)
+        if self._worker is not None:
+            tasks.append(self._worker)
+            self._worker = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def search(self, index: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run one search template request (``{"id", "params"}``), batched with
+        any others submitted alongside it.
+        """
+        if self._worker is None:
+            return await self.client.search_template(index=index, body=body)
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((index, body, future))
+        return await future
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            # Dispatch in the background so the next batch can start collecting
+            task = asyncio.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+    
+    async def _dispatch(self, batch):
+        body = []
+        for index, request, _ in batch:
+            body.append({"index": index})
+            body.append(request)
+        
+        try:
+            response = await self.client.msearch_template(body=body)
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, _, future), item in zip(batch, response["responses"]):
+            # Skip callers that went away while the batch was in flight
+            if future.done():
+                continue
+            if "error" in item:
+                future.set_exception(RuntimeError(f"Search failed: {item['error']}"))
+            else:
+                future.set_result(item)
 
 
 class OpenSearchService:
@@ -19,6 +228,18 @@ class OpenSearchService:
             ssl_show_warn=False
         )
         self.index_prefix = settings.OPENSEARCH_INDEX_PREFIX
+        self.batcher = MultiSearchBatcher(
+            self.client,
+            max_batch=settings.OPENSEARCH_BATCH_SIZE,
+            max_wait=settings.OPENSEARCH_BATCH_WAIT_MS / 1000
+        )
+        self._templates_registered = False
+        self._templates_lock = asyncio.Lock()
+    
+    async def close(self):
+        """Stop the search batcher and close the client's connection pool."""
+        await self.batcher.stop()
+        await self.client.close()
     
     async def initialize_indices(self):
         """Create required indices if they don't exist."""
@@ -71,6 +292,51 @@ class OpenSearchService:
             if not await self.client.indices.exists(index=index_name):
                 await self.client.indices.create(index=index_name, body=index_config)
     
+    def _template_id(self, name: str) -> str:
+        """Stored-script id of a search template, namespaced like the indices."""
+        return f"{self.index_prefix}_{name}"
+    
+    async def register_search_templates(self):
+        """Store the search templates on the cluster, replacing older versions."""
+        await asyncio.gather(*(
+            self.client.put_script(
+                id=self._template_id(name),
+                body={"script": {"lang": "mustache", "source": source}}
+            )
+            for name, source in SEARCH_TEMPLATES.items()
+        ))
+        self._templates_registered = True
+    
+    async def _ensure_search_templates(self):
+        """Store the templates once, so a failed startup registration is retried."""
+        if self._templates_registered:
+            return
+        async with self._templates_lock:
+            if not self._templates_registered:
+                await self.register_search_templates()
+    
+    async def _with_templates(self, run: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run a template search, storing the templates first if needed and
+        once more if the cluster reports them missing.
+        """
+        await self._ensure_search_templates()
+        try:
+            return await run()
+        except Exception as e:
+            if MISSING_TEMPLATE_ERROR not in str(e):
+                raise
+        self._templates_registered = False
+        await self._ensure_search_templates()
+        return await run()
+    
+    async def _search_template(self, index_type: str, name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a stored search template against one index."""
+        return await self._with_templates(lambda: self.client.search_template(
+            index=f"{self.index_prefix}_{index_type}",
+            body={"id": self._template_id(name), "params": params}
+        ))
+    
     async def search_entities(
         self,
         query: str,
@@ -79,16 +345,6 @@ class OpenSearchService:
         size: int = 20
     ) -> Dict[str, Any]:
         """Search for entities."""
-        must_clauses = [
-            {
-                "multi_match": {
-                    "query": query,
-                    "fields": ["name^3", "attributes.*"],
-                    "fuzziness": "AUTO"
-                }
-            }
-        ]
-        
         filter_clauses = []
         if filters:
             if "entity_type" in filters:
@@ -103,22 +359,12 @@ class OpenSearchService:
                     }
                 })
         
-        body = {
-            "query": {
-                "bool": {
-                    "must": must_clauses,
-                    "filter": filter_clauses
-                }
-            },
+        response = await self._search_template("entities", "entities_search", {
+            "q": query,
+            "filters": filter_clauses,
             "from": from_,
-            "size": size,
-            "sort": [{"risk_score": "desc"}, "_score"]
-        }
-        
-        response = await self.client.search(
-            index=f"{self.index_prefix}_entities",
-            body=body
-        )
+            "size": size
+        })
         
         return {
             "hits": [hit["_source"] for hit in response["hits"]["hits"]],
@@ -134,27 +380,24 @@ class OpenSearchService:
         size: int = 20
     ) -> Dict[str, Any]:
         """Search for transactions."""
-        body = {
-            "query": {
-                "bool": {
-                    "must": [
-                        {
-                            "multi_match": {
-                                "query": query,
-                                "fields": ["description", "reference_number"]
-                            }
-                        }
-                    ]
-                }
-            },
+        filter_clauses = []
+        if filters:
+            if "amount" in filters:
+                bounds = {}
+                if filters["amount"].get("min") is not None:
+                    bounds["gte"] = filters["amount"]["min"]
+                if filters["amount"].get("max") is not None:
+                    bounds["lte"] = filters["amount"]["max"]
+                filter_clauses.append({"range": {"amount": bounds}})
+            if "currency" in filters:
+                filter_clauses.append({"term": {"currency": filters["currency"]}})
+        
+        response = await self._search_template("transactions", "transactions_search", {
+            "q": query,
+            "filters": filter_clauses,
             "from": from_,
             "size": size
-        }
-        
-        response = await self.client.search(
-            index=f"{self.index_prefix}_transactions",
-            body=body
-        )
+        })
         
         return {
             "hits": [hit["_source"] for hit in response["hits"]["hits"]],
@@ -176,28 +419,12 @@ class OpenSearchService:
             if "status" in filters:
                 filter_clauses.append({"term": {"status": filters["status"]}})
         
-        body = {
-            "query": {
-                "bool": {
-                    "must": [
-                        {
-                            "multi_match": {
-                                "query": query,
-                                "fields": ["title^2", "description"]
-                            }
-                        }
-                    ],
-                    "filter": filter_clauses
-                }
-            },
+        response = await self._search_template("alerts", "alerts_search", {
+            "q": query,
+            "filters": filter_clauses,
             "from": from_,
             "size": size
-        }
-        
-        response = await self.client.search(
-            index=f"{self.index_prefix}_alerts",
-            body=body
-        )
+        })
         
         return {
             "hits": [hit["_source"] for hit in response["hits"]["hits"]],
@@ -210,96 +437,130 @@ class OpenSearchService:
         from_: int = 0,
         size: int = 10
     ) -> Dict[str, Any]:
-        """Search across all indices."""
-        results = {
-            "entities": [],
-            "transactions": [],
-            "alerts": []
-        }
+        """
+        Search across all indices.
         
-        # Search each index
-        for doc_type in ["entities", "transactions", "alerts"]:
-            try:
-                response = await self.client.search(
-                    index=f"{self.index_prefix}_{doc_type}",
-                    body={
-                        "query": {
-                            "multi_match": {
-                                "query": query,
-                                "fields": ["*"]
-                            }
-                        },
-                        "from": from_,
-                        "size": size
+        Raises if any index search fails rather than reporting it as empty,
+        so callers never cache an outage as "no results".
+        """
+        doc_types = ["entities", "transactions", "alerts"]
+        
+        # One search per index, sent together through the batcher
+        responses = await self._with_templates(lambda: asyncio.gather(
+            *(
+                self.batcher.search(
+                    f"{self.index_prefix}_{doc_type}",
+                    {
+                        "id": self._template_id("global_search"),
+                        "params": {
+                            "q": query,
+                            "from": from_,
+                            "size": size,
+                            "fields": SEARCH_RESULT_FIELDS[doc_type]
+                        }
                     }
                 )
-                results[doc_type] = [hit["_source"] for hit in response["hits"]["hits"]]
-            except Exception:
-                pass
+                for doc_type in doc_types
+            )
+        ))
         
-        return results
+        return {
+            doc_type: [hit["_source"] for hit in response["hits"]["hits"]]
+            for doc_type, response in zip(doc_types, responses)
+        }
     
     async def get_suggestions(self, query: str, limit: int = 10) -> List[str]:
-        """Get autocomplete suggestions."""
-        try:
-            response = await self.client.search(
-                index=f"{self.index_prefix}_entities",
-                body={
-                    "query": {
-                        "prefix": {
-                            "name.keyword": {
-                                "value": query
+        """Get autocomplete suggestions; search errors propagate to the caller."""
+        response = await self._with_templates(lambda: self.batcher.search(
+            f"{self.index_prefix}_entities",
+            {
+                "id": self._template_id("suggest"),
+                "params": {"q": query, "size": limit}
+            }
+        ))
+        return [hit["_source"]["name"] for hit in response["hits"]["hits"]]
+    
+    @staticmethod
+    def _screening_query(name: str) -> Dict[str, Any]:
+        """Fuzzy name match restricted to sanctioned entities."""
+        return {
+            "query": {
+                "bool": {
+                    "must": [
+                        {
+                            "match": {
+                                "name": {
+                                    "query": name,
+                                    "fuzziness": "AUTO"
+                                }
                             }
                         }
-                    },
-                    "size": limit,
-                    "_source": ["name"]
+                    ],
+                    "filter": [
+                        {"term": {"is_sanctioned": True}}
+                    ]
                 }
-            )
-            return [hit["_source"]["name"] for hit in response["hits"]["hits"]]
-        except Exception:
-            return []
+            },
+            "size": 10
+        }
+    
+    @staticmethod
+    def _screening_matches(hits: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+        """Hits whose score relative to the best hit reaches ``threshold``."""
+        matches = []
+        for hit in hits["hits"]:
+            score = hit["_score"] / hits["max_score"] if hits["max_score"] else 0
+            if score >= threshold:
+                matches.append({
+                    "entity": hit["_source"],
+                    "confidence": score
+                })
+        return matches
     
     async def screen_name(self, name: str, threshold: float = 0.8) -> List[Dict[str, Any]]:
         """Screen a name against sanctions and watchlists."""
         try:
             response = await self.client.search(
                 index=f"{self.index_prefix}_entities",
-                body={
-                    "query": {
-                        "bool": {
-                            "must": [
-                                {
-                                    "match": {
-                                        "name": {
-                                            "query": name,
-                                            "fuzziness": "AUTO"
-                                        }
-                                    }
-                                }
-                            ],
-                            "filter": [
-                                {"term": {"is_sanctioned": True}}
-                            ]
-                        }
-                    },
-                    "size": 10
-                }
+                body=self._screening_query(name)
             )
-            
-            matches = []
-            for hit in response["hits"]["hits"]:
-                score = hit["_score"] / response["hits"]["max_score"] if response["hits"]["max_score"] else 0
-                if score >= threshold:
-                    matches.append({
-                        "entity": hit["_source"],
-                        "confidence": score
-                    })
-            
-            return matches
+            return self._screening_matches(response["hits"], threshold)
         except Exception:
             return []
     
+    async def screen_names_bulk(self, names: List[str], threshold: float = 0.8) -> List[Dict[str, Any]]:
+        """
+        Screen many names in a single multi-search request.
+        
+        Returns one ``{"input", "matches"}`` result per name, in input order;
+        a name whose search failed gets empty matches and an ``error``.
+        """
+        if not names:
+            return []
+        
+        header = {"index": f"{self.index_prefix}_entities"}
+        body = []
+        for name in names:
+            body.append(header)
+            body.append(self._screening_query(name))
+        
+        response = await self.client.msearch(body=body)
+        
+        results = []
+        for name, item in zip(names, response["responses"]):
+            if "error" in item:
+                results.append({
+                    "input": name,
+                    "matches": [],
+                    "error": str(item["error"])
+                })
+            else:
+                results.append({
+                    "input": name,
+                    "matches": self._screening_matches(item["hits"], threshold)
+                })
+        return results
+    
     async def index_document(self, index_type: str, doc_id: str, document: Dict[str, Any]):
         """Index a document."""
         await self.client.index(
@@ -307,6 +568,7 @@ class OpenSearchService:
             id=doc_id,
             body=document
         )
+        await bump_generation(SEARCH_CACHE_GENERATION)
     
     async def delete_document(self, index_type: str, doc_id: str):
         """Delete a document."""
@@ -314,4 +576,10 @@ class OpenSearchService:
             index=f"{self.index_prefix}_{index_type}",
             id=doc_id
         )
+        await bump_generation(SEARCH_CACHE_GENERATION)
+
 
+@lru_cache(maxsize=1)
+def get_opensearch_service() -> OpenSearchService:
+    """Process-wide OpenSearch service, so requests share one connection pool."""
+    return OpenSearchService()
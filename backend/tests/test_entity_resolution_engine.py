@@ -0,0 +1,43 @@
+"""
+Tests pinning the name similarity scores used by entity resolution.
+"""
+
+import pytest
+from rapidfuzz.distance import JaroWinkler, Levenshtein
+from app.services.entity_resolution_engine import SimilarityScorer
+
+
+@pytest.mark.parametrize("s1, s2, jaro, jaro_winkler", [
+    # Textbook pairs from Winkler's papers
+    ("MARTHA", "MARHTA", 17 / 18, 0.9611111111111111),
+    ("DWAYNE", "DUANE", 37 / 45, 0.84),
+    ("DIXON", "DICKSONX", 23 / 30, 0.8133333333333332),
+    # Odd number of out-of-order matches: transpositions round down
+    ("Mohammed Ali", "Muhammad Aly", 43 / 54, 0.8166666666666667),
+    # Jaro at or below 0.7 gets no prefix boost
+    ("ab", "ac", 2 / 3, 2 / 3),
+    ("Jon", "John", 11 / 12, 0.9333333333333333),
+])
+def test_jaro_scores(s1, s2, jaro, jaro_winkler):
+    assert SimilarityScorer.jaro_similarity(s1, s2) == pytest.approx(jaro)
+    assert SimilarityScorer.jaro_winkler_similarity(s1, s2) == pytest.approx(jaro_winkler)
+
+
+def test_scores_ignore_case_and_handle_empty_strings():
+    assert SimilarityScorer.jaro_winkler_similarity("JOHN SMITH", "john smith") == 1.0
+    assert SimilarityScorer.jaro_winkler_similarity("", "") == 1.0
+    assert SimilarityScorer.jaro_winkler_similarity("John", "") == 0.0
+    assert SimilarityScorer.levenshtein_similarity("Jon", "JOHN") == pytest.approx(0.75)
+
+
+def test_matrix_and_batch_scores_match_pairwise_scores():
+    names = ["Jon", "John", "JOHN SMITH", "Mohammed Ali", "Muhammad Aly"]
+    jaro_winkler = SimilarityScorer.similarity_matrix(names, JaroWinkler)
+    levenshtein = SimilarityScorer.similarity_matrix(names, Levenshtein)
+    batch = SimilarityScorer.batch_jaro_winkler(names[0], names)
+
+    for i, s1 in enumerate(names):
+        assert batch[i] == pytest.approx(SimilarityScorer.jaro_winkler_similarity(names[0], s1))
+        for j, s2 in enumerate(names):
+            assert jaro_winkler[i, j] == pytest.approx(SimilarityScorer.jaro_winkler_similarity(s1, s2))
+            assert levenshtein[i, j] == pytest.approx(SimilarityScorer.levenshtein_similarity(s1, s2))
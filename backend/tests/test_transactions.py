@@ -0,0 +1,15 @@
+"""
+Tests for the transaction endpoint query builders.
+"""
+
+from sqlalchemy.dialects import postgresql
+from app.api.endpoints.transactions import _related_transactions_query
+
+
+def test_related_transactions_query_compiles():
+    query = _related_transactions_query("tx-1", ["entity-a", "entity-b"], 10)
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    
+    assert "UNION" in sql
+    # Both per-party branches keep their own ORDER BY/LIMIT
+    assert sql.count("LIMIT") == 3
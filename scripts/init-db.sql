@@ -4,6 +4,9 @@
 -- Enable UUID extension
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 
+-- Enable trigram matching for fuzzy name search
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 -- Create enum types
 DO $$ BEGIN
     CREATE TYPE entity_type AS ENUM ('individual', 'organization', 'account', 'address', 'device', 'phone', 'email');
@@ -167,7 +170,8 @@ CREATE TABLE IF NOT EXISTS content_library (
     tags JSONB DEFAULT '[]'::jsonb,
     keywords JSONB DEFAULT '[]'::jsonb,
     
-    version VARCHAR(20) DEFAULT '1.0',
+    major_version INTEGER NOT NULL DEFAULT 1,
+    minor_version INTEGER NOT NULL DEFAULT 0,
     is_current INTEGER DEFAULT 1,
     
     usage_count INTEGER DEFAULT 0,
@@ -184,35 +188,40 @@ CREATE TABLE IF NOT EXISTS content_library (
 -- Insert sample entities for demonstration
 INSERT INTO entities (id, entity_type, name, risk_score, is_sanctioned, is_pep, attributes, source_systems, created_at)
 VALUES
-    (uuid_generate_v4(), 'organization', 'Acme Trading Corp', 0.35, 0, 0, '{"industry": "trading", "country": "SG"}', '["core_banking", "crm"]', NOW()),
-    (uuid_generate_v4(), 'individual', 'John Smith', 0.72, 0, 1, '{"nationality": "US", "occupation": "executive"}', '["kyc_system"]', NOW()),
-    (uuid_generate_v4(), 'organization', 'Global Investments Ltd', 0.85, 1, 0, '{"industry": "finance", "country": "KY"}', '["trade_system"]', NOW()),
-    (uuid_generate_v4(), 'account', 'ACC-001-2024-SG', 0.45, 0, 0, '{"type": "checking", "currency": "SGD"}', '["core_banking"]', NOW()),
-    (uuid_generate_v4(), 'individual', 'Sarah Chen', 0.22, 0, 0, '{"nationality": "SG", "occupation": "manager"}', '["kyc_system"]', NOW())
+    (uuid_generate_v4(), 'organization', 'Acme Trading Corp', 0.35, false, false, '{"industry": "trading", "country": "SG"}', '["core_banking", "crm"]', NOW()),
+    (uuid_generate_v4(), 'individual', 'John Smith', 0.72, false, true, '{"nationality": "US", "occupation": "executive"}', '["kyc_system"]', NOW()),
+    (uuid_generate_v4(), 'organization', 'Global Investments Ltd', 0.85, true, false, '{"industry": "finance", "country": "KY"}', '["trade_system"]', NOW()),
+    (uuid_generate_v4(), 'account', 'ACC-001-2024-SG', 0.45, false, false, '{"type": "checking", "currency": "SGD"}', '["core_banking"]', NOW()),
+    (uuid_generate_v4(), 'individual', 'Sarah Chen', 0.22, false, false, '{"nationality": "SG", "occupation": "manager"}', '["kyc_system"]', NOW())
 ON CONFLICT DO NOTHING;
 
 -- Create indexes for better query performance
 CREATE INDEX IF NOT EXISTS idx_entities_type ON entities(entity_type);
 CREATE INDEX IF NOT EXISTS idx_entities_risk ON entities(risk_score DESC);
-CREATE INDEX IF NOT EXISTS idx_entities_sanctioned ON entities(is_sanctioned) WHERE is_sanctioned = 1;
-CREATE INDEX IF NOT EXISTS idx_entities_pep ON entities(is_pep) WHERE is_pep = 1;
+CREATE INDEX IF NOT EXISTS idx_entities_sanctioned ON entities(risk_score DESC) WHERE is_sanctioned;
+CREATE INDEX IF NOT EXISTS idx_entities_pep ON entities(risk_score DESC) WHERE is_pep;
 CREATE INDEX IF NOT EXISTS idx_entities_name_trgm ON entities USING gin(name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_entities_risk_id ON entities((COALESCE(risk_score, -1.0)) DESC, id DESC);
 
 CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions(transaction_date DESC);
 CREATE INDEX IF NOT EXISTS idx_transactions_sender ON transactions(sender_entity_id);
 CREATE INDEX IF NOT EXISTS idx_transactions_receiver ON transactions(receiver_entity_id);
 CREATE INDEX IF NOT EXISTS idx_transactions_amount ON transactions(amount DESC);
-CREATE INDEX IF NOT EXISTS idx_transactions_flagged ON transactions(is_flagged) WHERE is_flagged = 1;
+CREATE INDEX IF NOT EXISTS idx_transactions_date_id ON transactions(transaction_date DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_transactions_flagged ON transactions(transaction_date DESC) WHERE is_flagged;
 
 CREATE INDEX IF NOT EXISTS idx_alerts_status ON alerts(status);
 CREATE INDEX IF NOT EXISTS idx_alerts_severity ON alerts(severity DESC);
 CREATE INDEX IF NOT EXISTS idx_alerts_detected ON alerts(detected_at DESC);
 CREATE INDEX IF NOT EXISTS idx_alerts_assigned ON alerts(assigned_to);
 CREATE INDEX IF NOT EXISTS idx_alerts_entity ON alerts(primary_entity_id);
+CREATE INDEX IF NOT EXISTS idx_alerts_open ON alerts(detected_at DESC) WHERE status IN ('NEW', 'INVESTIGATING');
+CREATE INDEX IF NOT EXISTS idx_alerts_severity_detected ON alerts((COALESCE(severity, 'LOW'::alertseverity)) DESC, (COALESCE(detected_at, '0001-01-01 00:00:00'::timestamp)) DESC, id DESC);
 
 CREATE INDEX IF NOT EXISTS idx_cases_status ON cases(status);
 CREATE INDEX IF NOT EXISTS idx_cases_priority ON cases(priority);
 CREATE INDEX IF NOT EXISTS idx_cases_assigned ON cases(assigned_to);
+CREATE INDEX IF NOT EXISTS idx_cases_priority_opened ON cases((COALESCE(priority, 2147483647)), (COALESCE(opened_at, '0001-01-01 00:00:00'::timestamp)) DESC, id DESC);
 
 -- RFP/RFI indexes
 CREATE INDEX IF NOT EXISTS idx_proposals_type ON proposals(proposal_type);
@@ -224,6 +233,18 @@ CREATE INDEX IF NOT EXISTS idx_proposals_lead ON proposals(lead_owner);
 CREATE INDEX IF NOT EXISTS idx_proposal_sections_proposal ON proposal_sections(proposal_id);
 CREATE INDEX IF NOT EXISTS idx_content_library_category ON content_library(category);
 CREATE INDEX IF NOT EXISTS idx_content_library_solution ON content_library(solution_area);
+-- Trigram indexes for the proposal and content library searches
+CREATE INDEX IF NOT EXISTS idx_proposals_title_trgm ON proposals USING gin(title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_proposals_client_trgm ON proposals USING gin(client_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_proposals_description_trgm ON proposals USING gin(description gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_content_title_trgm ON content_library USING gin(title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_content_body_trgm ON content_library USING gin(content gin_trgm_ops);
+-- Proposal list filter + ORDER BY; undated proposals sort last (see proposal_due_key)
+CREATE INDEX IF NOT EXISTS idx_proposals_status_due ON proposals(status, (COALESCE(due_date, '9999-12-31 23:59:59.999999'::timestamp)), (COALESCE(priority, 'low'::proposal_priority)) DESC, id);
+CREATE INDEX IF NOT EXISTS idx_proposals_type_due ON proposals(proposal_type, (COALESCE(due_date, '9999-12-31 23:59:59.999999'::timestamp)), (COALESCE(priority, 'low'::proposal_priority)) DESC, id);
+-- RFP dashboard: open proposals by due date, and the (status, type) rollup
+CREATE INDEX IF NOT EXISTS idx_proposals_active_due ON proposals(due_date) WHERE status IN ('draft', 'in_progress', 'review');
+CREATE INDEX IF NOT EXISTS idx_proposals_status_type ON proposals(status, proposal_type) INCLUDE (due_date, estimated_deal_value);
 
 -- Create function to update updated_at timestamp
 CREATE OR REPLACE FUNCTION update_updated_at_column()